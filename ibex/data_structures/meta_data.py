@@ -1,10 +1,38 @@
+import os
 import sys
 from ibex.geometry import ib3shapes
 
 
 
+# parsed meta data per meta.txt path with its modification time, and meta data set without a file
+meta_data_cache = {}
+explicit_meta_data = {}
+
+
+
+def CachedMetaData(prefix):
+    # meta data set explicitly takes precedence over meta.txt
+    if os.path.normpath(prefix) in explicit_meta_data: return explicit_meta_data[os.path.normpath(prefix)]
+
+    # only parse meta.txt again if it changed
+    filename = os.path.abspath('{}/meta.txt'.format(prefix))
+    modified_time = os.stat(filename).st_mtime
+    if not filename in meta_data_cache or meta_data_cache[filename][0] != modified_time:
+        meta_data_cache[filename] = (modified_time, MetaData(prefix))
+
+    return meta_data_cache[filename][1]
+
+
+
+def SetMetaData(prefix, resolution=None, grid_size=None):
+    # use this resolution and grid size (z, y, x) for prefix instead of reading meta.txt
+    if resolution is None and grid_size is None: explicit_meta_data.pop(os.path.normpath(prefix), None)
+    else: explicit_meta_data[os.path.normpath(prefix)] = MetaData(prefix, resolution, grid_size)
+
+
+
 class MetaData:
-    def __init__(self, prefix):
+    def __init__(self, prefix, resolution=None, grid_size=None):
         # initialize the prefix variable
         self.prefix = prefix
 
@@ -23,6 +51,12 @@ class MetaData:
         self.crop_zmin = None
         self.crop_zmax = None
 
+        # meta data given explicitly does not need the meta data txt file
+        if resolution is not None or grid_size is not None:
+            self.resolution = None if resolution is None else tuple(float(value) for value in resolution)
+            self.grid_size = None if grid_size is None else tuple(int(value) for value in grid_size)
+            return
+
         # open the meta data txt file
         filename = '{}/meta.txt'.format(prefix)
         with open(filename, 'r') as fd:
@@ -1,8 +1,6 @@
 import struct
 import numpy as np
 import itertools
-from mpl_toolkits.mplot3d import Axes3D
-import matplotlib.pyplot as plt
 
 from ibex.utilities.constants import *
 
@@ -153,7 +151,9 @@ class Skeleton:
         # extract ndoes and edges
         nodes = self.get_nodes()
         edges = self.get_edges()
-        # plot edges and nodes
+        # plot edges and nodes, matplotlib is only loaded for plotting
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D
         fig = plt.figure(figsize=(16,12))
         ax = Axes3D(fig)
         ax.scatter(nodes[:,2],nodes[:,1],nodes[:,0], s=10, c='r')
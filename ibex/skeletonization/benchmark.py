@@ -1,7 +1,11 @@
 import os
+import csv
+import json
+import time
 import struct
+import multiprocessing
 
-import scipy.spatial, scipy.optimize
+import scipy.sparse, scipy.sparse.csgraph, scipy.spatial, scipy.optimize
 import numpy as np
 
 from ibex.utilities import dataIO
@@ -9,6 +13,14 @@ from ibex.utilities.constants import *
 
 
 
+# parameters that are swept during endpoint evaluation
+resolutions = [(iv, iv, iv) for iv in range(30, 210, 10)]
+astar_expansions = [0, 11, 13, 15, 17, 19, 21, 23, 25]
+teaser_scales = [7, 9, 11, 13, 15, 17]
+teaser_buffers = [1, 2, 3, 4, 5]
+
+
+
 def ReadSkeletonEndpoints(filename):
     endpoints = []
 
@@ -64,7 +76,64 @@ def ReadGroundTruth(prefix, max_label):
 
 
 
-def FindEndpointMatches(prefix, algorithm, params, resolution, ground_truth):
+# match ground truth and proposed endpoints (x, y, z) in nanometers that are within max_distance
+#
+# the default matching has the most pairs within max_distance and the smallest total distance among those;
+# the original dense assignment over every pair (pruned=False) lets endpoints farther than max_distance
+# from everything decide which close pairs are matched, so it never finds more true positives
+def MatchEndpoints(gt_pts, pr_pts, max_distance, pruned=True):
+    if not len(gt_pts) or not len(pr_pts): return []
+
+    # no pair is within max_distance (with slack for rounding)
+    candidates = scipy.spatial.cKDTree(gt_pts).sparse_distance_matrix(scipy.spatial.cKDTree(pr_pts), max_distance + 1e-6, output_type='ndarray')
+    if not len(candidates): return []
+
+    # reproduce scores from before the pruned matching, pairs beyond max_distance are discarded afterwards
+    if not pruned:
+        cost_matrix = scipy.spatial.distance.cdist(gt_pts, pr_pts)
+        matching = scipy.optimize.linear_sum_assignment(cost_matrix)
+
+        return sorted(match for match in zip(matching[0], matching[1]) if cost_matrix[match[0], match[1]] <= max_distance)
+
+    # a maximum matching of minimum distance among the pairs within max_distance only
+    candidates = candidates[candidates['v'] <= max_distance]
+    if not len(candidates): return []
+
+    # endpoints that cannot reach each other through candidate pairs are independent problems
+    ngt_pts = len(gt_pts)
+    graph = scipy.sparse.coo_matrix((np.ones(len(candidates), dtype=np.int8), (candidates['i'], candidates['j'] + ngt_pts)), shape=(ngt_pts + len(pr_pts), ngt_pts + len(pr_pts)))
+    _, components = scipy.sparse.csgraph.connected_components(graph, directed=False)
+
+    # any non candidate pair costs more than every candidate assignment combined
+    no_match = max_distance * (min(len(gt_pts), len(pr_pts)) + 1) + 1
+
+    matches = []
+    order = np.argsort(components[candidates['i']], kind='mergesort')
+    candidates = candidates[order]
+    boundaries = np.flatnonzero(np.diff(components[candidates['i']])) + 1
+    for component in np.split(candidates, boundaries):
+        # a single candidate pair is always matched
+        if len(component) == 1:
+            matches.append((component['i'][0], component['j'][0]))
+            continue
+
+        gt_indices, gt_local = np.unique(component['i'], return_inverse=True)
+        pr_indices, pr_local = np.unique(component['j'], return_inverse=True)
+
+        cost_matrix = np.full((len(gt_indices), len(pr_indices)), no_match, dtype=np.float64)
+        cost_matrix[gt_local, pr_local] = component['v']
+
+        matching = scipy.optimize.linear_sum_assignment(cost_matrix)
+        for gt_index, pr_index in zip(matching[0], matching[1]):
+            if cost_matrix[gt_index, pr_index] == no_match: continue
+
+            matches.append((gt_indices[gt_index], pr_indices[pr_index]))
+
+    return sorted(matches)
+
+
+
+def FindEndpointMatches(prefix, algorithm, params, resolution, ground_truth, pruned=True):
     # read the endpoints for this set of parameters
     skeleton_filename = 'benchmarks/skeleton/{}-{}-{:03d}x{:03d}x{:03d}-upsample-{}-skeleton.pts'.format(prefix, algorithm, resolution[IB_X], resolution[IB_Y], resolution[IB_Z], params)
     if not os.path.exists(skeleton_filename): return 0, 0, 0
@@ -86,8 +155,9 @@ def FindEndpointMatches(prefix, algorithm, params, resolution, ground_truth):
     false_negatives = 0
 
     with open(output_filename, 'wb') as fd:
-        # need resolution for max distance
+        # need resolution for max distance, can not use IB_NDIMS because coordinates are (x, y, z) here
         resolution = dataIO.Resolution(prefix)
+        scale = np.array([resolution[IB_X], resolution[IB_Y], resolution[IB_Z]])
 
         fd.write(struct.pack('q', max_label))
         for label in range(max_label):
@@ -99,29 +169,10 @@ def FindEndpointMatches(prefix, algorithm, params, resolution, ground_truth):
             ngt_pts = len(ground_truth[label])
             npr_pts = len(proposed[label])
 
-            gt_pts = np.zeros((ngt_pts, 3), dtype=np.int64)
-            pr_pts = np.zeros((npr_pts, 3), dtype=np.int64)
-
-            # can not use IB_NDIMS because coordinates are (x, y, z) here
-            for pt in range(ngt_pts):
-                gt_pts[pt,0] = resolution[IB_X] * ground_truth[label][pt][0]
-                gt_pts[pt,1] = resolution[IB_Y] * ground_truth[label][pt][1]
-                gt_pts[pt,2] = resolution[IB_Z] * ground_truth[label][pt][2]
-
-            for pt in range(npr_pts):
-                pr_pts[pt,0] = resolution[IB_X] * proposed[label][pt][0]
-                pr_pts[pt,1] = resolution[IB_Y] * proposed[label][pt][1]
-                pr_pts[pt,2] = resolution[IB_Z] * proposed[label][pt][2]
-
-            cost_matrix = scipy.spatial.distance.cdist(gt_pts, pr_pts)
-            matching = scipy.optimize.linear_sum_assignment(cost_matrix)
+            gt_pts = (scale * np.array(ground_truth[label], dtype=np.int64).reshape(ngt_pts, 3)).astype(np.int64)
+            pr_pts = (scale * np.array(proposed[label], dtype=np.int64).reshape(npr_pts, 3)).astype(np.int64)
 
-            valid_matches = set()
-            for match in zip(matching[0], matching[1]):
-                # valid pairs must be within max_distance (in nanometers)
-                if cost_matrix[match[0], match[1]] > max_distance: continue
-
-                valid_matches.add(match)
+            valid_matches = MatchEndpoints(gt_pts, pr_pts, max_distance, pruned)
 
             true_positives += len(valid_matches)
             false_positives += npr_pts - len(valid_matches)
@@ -145,8 +196,6 @@ def EvaluateEndpoints(prefix):
     gold = dataIO.ReadGoldData(prefix)
     max_label = np.amax(gold) + 1
 
-    resolutions = [(iv, iv, iv) for iv in range(30, 210, 10)]           # all downsampled resolutions
-
     # get the human labeled ground truth
     gt_endpoints = ReadGroundTruth(prefix, max_label)
 
@@ -160,7 +209,7 @@ def EvaluateEndpoints(prefix):
     # go through all possible configurations
     for resolution in resolutions:
         # go through parameters for medial axis strategy
-        for astar_expansion in [0, 11, 13, 15, 17, 19, 21, 23, 25]:
+        for astar_expansion in astar_expansions:
             fscore, precision, recall = FindEndpointMatches(prefix, 'thinning', '{:02d}'.format(astar_expansion), resolution, gt_endpoints)
 
             if (precision > min_precision and recall > min_recall):
@@ -190,8 +239,8 @@ def EvaluateEndpoints(prefix):
                 best_fscore_recall = recall
                 algorithm = 'medial-axis-{:03d}x{:03d}x{:03d}-{:02d}'.format(resolution[IB_X], resolution[IB_Y], resolution[IB_Z], astar_expansion)
 
-        for tscale in [7, 9, 11, 13, 15, 17]:
-            for tbuffer in [1, 2, 3, 4, 5]:
+        for tscale in teaser_scales:
+            for tbuffer in teaser_buffers:
                 fscore, precision, recall = FindEndpointMatches(prefix, 'teaser', '{:02d}-{:02d}-00'.format(tscale, tbuffer), resolution, gt_endpoints)
                 
                 if (precision > min_precision and recall > min_recall):
@@ -214,6 +263,184 @@ def EvaluateEndpoints(prefix):
     print 'Recall: {}'.format(best_fscore_recall)
 
 
+# all (algorithm, resolution, params) triples considered by EvaluateEndpoints
+def SweepConfigurations(sweep_resolutions=resolutions):
+    configurations = []
+
+    for resolution in sweep_resolutions:
+        for astar_expansion in astar_expansions:
+            configurations.append(('thinning', resolution, '{:02d}'.format(astar_expansion)))
+            configurations.append(('medial-axis', resolution, '{:02d}'.format(astar_expansion)))
+        for tscale in teaser_scales:
+            for tbuffer in teaser_buffers:
+                configurations.append(('teaser', resolution, '{:02d}-{:02d}-00'.format(tscale, tbuffer)))
+
+    return configurations
+
+
+
+def SkeletonFilename(prefix, algorithm, resolution, params):
+    return 'benchmarks/skeleton/{}-{}-{:03d}x{:03d}x{:03d}-upsample-{}-skeleton.pts'.format(prefix, algorithm, resolution[IB_X], resolution[IB_Y], resolution[IB_Z], params)
+
+
+
+def UpsamplingTimesFilename(prefix, algorithm, resolution, params):
+    return 'benchmarks/skeleton/running-times/upsampling-times/{}-{}-{:03d}x{:03d}x{:03d}-{}.bytes'.format(prefix, algorithm, resolution[IB_X], resolution[IB_Y], resolution[IB_Z], params)
+
+
+
+# sum the per label running times written by the c++ code in benchmark mode
+def ReadRunningTime(filename):
+    if not os.path.exists(filename): return None
+
+    with open(filename, 'rb') as fd:
+        max_label, = struct.unpack('q', fd.read(8))
+        running_times = np.fromfile(fd, dtype=np.float64, count=max_label)
+
+    return float(np.sum(running_times))
+
+
+
+def ConfigurationRunningTime(prefix, algorithm, resolution, params):
+    running_times_directory = 'benchmarks/skeleton/running-times'
+    res = '{:03d}x{:03d}x{:03d}'.format(resolution[IB_X], resolution[IB_Y], resolution[IB_Z])
+
+    if algorithm == 'teaser':
+        tscale, tbuffer, _ = params.split('-')
+        skeleton_filename = '{}/skeleton-times/{}-teaser-{}-{}-{}.bytes'.format(running_times_directory, prefix, res, tscale, tbuffer)
+    else:
+        skeleton_filename = '{}/skeleton-times/{}-{}-{}.bytes'.format(running_times_directory, prefix, algorithm, res)
+    # teaser upsampling times are renamed to the full parameters after every run
+    upsample_filename = UpsamplingTimesFilename(prefix, algorithm, resolution, params)
+
+    running_times = [ReadRunningTime(skeleton_filename), ReadRunningTime(upsample_filename)]
+    running_times = [running_time for running_time in running_times if running_time is not None]
+    if not len(running_times): return None
+
+    return sum(running_times)
+
+
+
+# create the skeletons for every missing configuration at this resolution
+def GenerateMissingSkeletons(prefix, resolution, configurations, segmentation):
+    from ibex.transforms.seg2seg import DownsampleMapping
+    from ibex.skeletonization.generate_skeletons import TopologicalThinning, MedialAxis, TEASER
+
+    configurations = [configuration for configuration in configurations if not os.path.exists(SkeletonFilename(prefix, *configuration))]
+    if not len(configurations): return
+
+    DownsampleMapping(prefix, segmentation, output_resolution=resolution, benchmark=True)
+
+    for algorithm, _, params in configurations:
+        if algorithm == 'thinning':
+            TopologicalThinning(prefix, segmentation, skeleton_resolution=resolution, benchmark=True, astar_expansion=int(params) / 10.0)
+        elif algorithm == 'medial-axis':
+            MedialAxis(prefix, segmentation, skeleton_resolution=resolution, benchmark=True, astar_expansion=int(params) / 10.0)
+        elif algorithm == 'teaser':
+            tscale, tbuffer, astar_params = params.split('-')
+            TEASER(prefix, segmentation, skeleton_resolution=resolution, benchmark=True, teaser_scale=int(tscale) / 10.0, teaser_buffer=int(tbuffer), astar_expansion=int(astar_params) / 10.0)
+
+            # the teaser output and its upsampling time do not encode the scale and buffer
+            os.rename(SkeletonFilename(prefix, algorithm, resolution, astar_params), SkeletonFilename(prefix, algorithm, resolution, params))
+            if os.path.exists(UpsamplingTimesFilename(prefix, algorithm, resolution, astar_params)):
+                os.rename(UpsamplingTimesFilename(prefix, algorithm, resolution, astar_params), UpsamplingTimesFilename(prefix, algorithm, resolution, params))
+
+
+
+# state shared with the worker processes
+sweep_prefix = None
+sweep_ground_truth = None
+sweep_segmentation = None
+
+
+
+def InitializeSweepWorker(prefix, ground_truth, segmentation):
+    global sweep_prefix, sweep_ground_truth, sweep_segmentation
+
+    sweep_prefix = prefix
+    sweep_ground_truth = ground_truth
+    sweep_segmentation = segmentation
+
+
+
+def GenerateSweepResolution(arguments):
+    resolution, configurations = arguments
+
+    GenerateMissingSkeletons(sweep_prefix, resolution, configurations, sweep_segmentation)
+
+
+
+def ScoreSweepConfiguration(configuration):
+    algorithm, resolution, params = configuration
+
+    start_time = time.time()
+    if os.path.exists(SkeletonFilename(sweep_prefix, algorithm, resolution, params)):
+        fscore, precision, recall = FindEndpointMatches(sweep_prefix, algorithm, params, resolution, sweep_ground_truth)
+        exists = True
+    else:
+        fscore, precision, recall = (0, 0, 0)
+        exists = False
+
+    return {
+        'algorithm': algorithm,
+        'resolution': '{:03d}x{:03d}x{:03d}'.format(resolution[IB_X], resolution[IB_Y], resolution[IB_Z]),
+        'params': params,
+        'exists': exists,
+        'fscore': fscore,
+        'precision': precision,
+        'recall': recall,
+        'runtime': ConfigurationRunningTime(sweep_prefix, algorithm, resolution, params),
+        'matching_time': time.time() - start_time,
+    }
+
+
+
+# evaluate every configuration of EvaluateEndpoints in a process pool and write one results table
+def SweepEndpoints(prefix, output_prefix=None, generate_missing=True, nprocesses=None, sweep_resolutions=resolutions):
+    if output_prefix is None: output_prefix = 'benchmarks/skeleton/{}-endpoint-sweep'.format(prefix)
+
+    for directory in ['benchmarks/skeleton/matchings', 'benchmarks/skeleton/running-times/skeleton-times', 'benchmarks/skeleton/running-times/upsampling-times']:
+        if not os.path.isdir(directory): os.makedirs(directory)
+
+    # read the gold data and the human labeled ground truth once
+    gold = dataIO.ReadGoldData(prefix)
+    max_label = np.amax(gold) + 1
+    gt_endpoints = ReadGroundTruth(prefix, max_label)
+
+    configurations = SweepConfigurations(sweep_resolutions)
+
+    pool = multiprocessing.Pool(nprocesses, InitializeSweepWorker, (prefix, gt_endpoints, gold if generate_missing else None))
+    try:
+        # every resolution shares a downsampling so it is generated by a single worker
+        if generate_missing:
+            jobs = [(resolution, [configuration for configuration in configurations if configuration[1] == resolution]) for resolution in sweep_resolutions]
+            pool.map(GenerateSweepResolution, jobs)
+
+        results = pool.map(ScoreSweepConfiguration, configurations)
+    finally:
+        pool.close()
+        pool.join()
+
+    fields = ['algorithm', 'resolution', 'params', 'exists', 'fscore', 'precision', 'recall', 'runtime', 'matching_time']
+    with open('{}.csv'.format(output_prefix), 'w') as fd:
+        writer = csv.DictWriter(fd, fieldnames=fields)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result)
+
+    with open('{}.json'.format(output_prefix), 'w') as fd:
+        json.dump(results, fd, indent=2)
+
+    best = max(results, key=lambda result: result['fscore'])
+    print 'Best method: {}-{}-{}'.format(best['algorithm'], best['resolution'], best['params'])
+    print 'F1-Score: {}'.format(best['fscore'])
+    print 'Precision: {}'.format(best['precision'])
+    print 'Recall: {}'.format(best['recall'])
+
+    return results
+
+
+
 # find skeleton benchmark information
 def GenerateExamples(prefix, cutoff=500):
     gold = dataIO.ReadGoldData(prefix)
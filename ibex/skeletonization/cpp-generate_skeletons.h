@@ -8,7 +8,15 @@ void CppTopologicalThinning(const char *prefix, long skeleton_resolution[3], con
 void CppTeaserSkeletonization(const char *prefix, long skeleton_resolution[3], bool benchmark, double input_scale, long input_buffer);
 void CppFindEndpointVectors(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark);
 void CppFindEdges(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark);
+void CppFindEndpointVectorsAndEdges(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark);
 void CppApplyUpsampleOperation(const char *prefix, const char *params, long *input_segmentation, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, double astar_expansion, bool benchmark);
+void CppAStarSetBidirectional(bool input_bidirectional);
+void CppTeaserSetCropping(bool input_crop_labels);
+void CppTeaserSetThreads(long input_nthreads);
+void CppTeaserSetVoxelSize(double input_voxel_size[3]);
+void CppSetRecordRunningTimes(bool input_record_running_times);
+bool CppRecordRunningTimes(void);
+void CppWriteRunningTimes(const char *running_times_filename, long max_label, double *running_times);
 
 
 // universal variables and functions
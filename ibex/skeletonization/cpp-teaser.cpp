@@ -3,270 +3,250 @@
 #include <stdio.h>
 #include <math.h>
 #include <stdlib.h>
+#include <string.h>
+#include <chrono>
+#include <thread>
+#include <atomic>
+#include <vector>
 #include "cpp-MinBinaryHeap.h"
 #include "cpp-generate_skeletons.h"
+#include "cpp-edt.h"
 
 
 
 // global variables
-static long grid_size[3];
-static long nentries;
-static long sheet_size;
-static long row_size;
-static long infinity;
-
+static double scale = 1.3;
+static long buffer = 2;
+static const long min_path_length = 2;
 
+// run every label on its padded bounding box instead of the entire grid
+static bool crop_labels = true;
+static long nthreads = 1;
 
-static unsigned char *segmentation = NULL;
-static unsigned char *skeleton = NULL;
-static double *DBF = NULL;
-static double *penalties = NULL;
-static double *PDRF = NULL;
-static unsigned char *inside = NULL;
+// voxel sizes (z, y, x) relative to the smallest one for the distances on anisotropic grids
+static double voxel_size[3] = { 1, 1, 1 };
 
 
 
-static long inside_voxels = 0;
-static double scale = 1.3;
-static long buffer = 2;
-static const long min_path_length = 2;
+void CppTeaserSetCropping(bool input_crop_labels)
+{
+    crop_labels = input_crop_labels;
+}
 
 
 
-static void IndexToIndicies(long iv, long &ix, long &iy, long &iz)
+void CppTeaserSetThreads(long input_nthreads)
 {
-    iz = iv / sheet_size;
-    iy = (iv - iz * sheet_size) / row_size;
-    ix = iv % row_size;
+    nthreads = (input_nthreads < 1) ? 1 : input_nthreads;
 }
 
 
 
-static long IndicesToIndex(long ix, long iy, long iz)
+void CppTeaserSetVoxelSize(double input_voxel_size[3])
 {
-    return iz * sheet_size + iy * row_size + ix;
+    voxel_size[IB_Z] = input_voxel_size[IB_Z];
+    voxel_size[IB_Y] = input_voxel_size[IB_Y];
+    voxel_size[IB_X] = input_voxel_size[IB_X];
 }
 
 
 
-static void ComputeDistanceFromBoundaryField(void)
+struct DijkstraData {
+    long iv;
+    DijkstraData *prev;
+    double distance;
+    // the voxel is visited in this search if visited equals the current epoch
+    unsigned long visited;
+};
+
+
+
+// all of the state for skeletonizing one label, buffers are reused between labels
+struct TeaserData {
+    // the (cropped) grid for the current label
+    long grid_size[3];
+    long nentries;
+    long sheet_size;
+    long row_size;
+    long infinity;
+
+    unsigned char *segmentation;
+    unsigned char *skeleton;
+    unsigned char *inside;
+    double *DBF;
+    double *penalties;
+    double *PDRF;
+    long inside_voxels;
+
+    // scratch space for the distance transform rows
+    EDTBuffers rows;
+
+    // dijkstra buffers
+    DijkstraData *voxel_data;
+    MinBinaryHeap<DijkstraData *> *voxel_heap;
+    unsigned long epoch;
+    long capacity;
+};
+
+
+
+static void InitializeTeaserData(TeaserData &data)
 {
-    // allocate memory for bounday map and distance transform
-    long *b = new long[nentries];
-    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-        for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
-            for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-                if (!segmentation[IndicesToIndex(ix, iy, iz)]) {
-                    b[IndicesToIndex(ix, iy, iz)] = 0;
-                    continue;
-                }
+    memset(&data, 0, sizeof(TeaserData));
+}
 
-                // inside voxels that are on the boundary have value 1 (based on TEASER paper figure 2)
-                if ((ix == 0 or iy == 0 or iz == 0 or (ix == grid_size[IB_X] - 1) or (iy == grid_size[IB_Y] - 1) or (iz == grid_size[IB_Z] - 1)) ||
-                    (ix > 0 and !segmentation[IndicesToIndex(ix - 1, iy, iz)]) ||
-                    (iy > 0 and !segmentation[IndicesToIndex(ix, iy - 1, iz)]) ||
-                    (iz > 0 and !segmentation[IndicesToIndex(ix, iy, iz - 1)]) ||
-                    (ix < grid_size[IB_X] - 1 and !segmentation[IndicesToIndex(ix + 1, iy, iz)]) ||
-                    (iy < grid_size[IB_Y] - 1 and !segmentation[IndicesToIndex(ix, iy + 1, iz)]) ||
-                    (iz < grid_size[IB_Z] - 1 and !segmentation[IndicesToIndex(ix, iy, iz + 1)])) {
-                    b[IndicesToIndex(ix, iy, iz)] = 1;
-                }
-                else {
-                    b[IndicesToIndex(ix, iy, iz)] = infinity;
-                }
-            }
-        }
-    }
 
-    // go along the z dimenion first for every (x, y) coordinate
-    for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-        for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
 
-            long k = 0;
-            long *v = new long[grid_size[IB_Z] + 1];
-            double *z = new double[grid_size[IB_Z] + 1];
-
-            v[0] = 0;
-            z[0] = -1 * infinity;
-            z[1] = infinity;
-
-            for (long q = 1; q < grid_size[IB_Z]; ++q) {
-                // label for jump statement
-                zlabel:
-                double s = ((b[IndicesToIndex(ix, iy, q)] + q * q) - (b[IndicesToIndex(ix, iy, v[k])] + v[k] * v[k])) / (float)(2 * q - 2 * v[k]);
-                
-                if (s <= z[k]) {
-                    --k;
-                    goto zlabel;
-                }
-                else {
-                    ++k;
-                    v[k] = q;
-                    z[k] = s;
-                    z[k + 1] = infinity;
-                }
-            }
+static void ReleaseTeaserData(TeaserData &data)
+{
+    delete[] data.segmentation;
+    delete[] data.skeleton;
+    delete[] data.inside;
+    delete[] data.DBF;
+    delete[] data.penalties;
+    delete[] data.PDRF;
+    delete[] data.voxel_data;
+    delete data.voxel_heap;
+    CppEDTReleaseBuffers(data.rows);
+
+    InitializeTeaserData(data);
+}
 
-            k = 0;
-            for (long q = 0; q < grid_size[IB_Z]; ++q) {
-                while (z[k + 1] < q)
-                    ++k;
 
-                DBF[IndicesToIndex(ix, iy, q)] = (q - v[k]) * (q - v[k]) + b[IndicesToIndex(ix, iy, v[k])];
-            }
 
-            // free memory 
-            delete[] v;
-            delete[] z;
-        }
+// set the grid for the next label, buffers only grow when needed
+static void ReserveTeaserData(TeaserData &data, long grid_size[3])
+{
+    data.grid_size[IB_Z] = grid_size[IB_Z];
+    data.grid_size[IB_Y] = grid_size[IB_Y];
+    data.grid_size[IB_X] = grid_size[IB_X];
+    data.nentries = grid_size[IB_Z] * grid_size[IB_Y] * grid_size[IB_X];
+    data.sheet_size = grid_size[IB_Y] * grid_size[IB_X];
+    data.row_size = grid_size[IB_X];
+    data.infinity = 0;
+    for (int dim = 0; dim < 3; ++dim)
+        data.infinity += (long) ceil((grid_size[dim] * voxel_size[dim]) * (grid_size[dim] * voxel_size[dim]));
+    data.inside_voxels = 0;
+
+    if (data.nentries > data.capacity) {
+        delete[] data.segmentation;
+        delete[] data.skeleton;
+        delete[] data.inside;
+        delete[] data.DBF;
+        delete[] data.penalties;
+        delete[] data.PDRF;
+        delete[] data.voxel_data;
+        delete data.voxel_heap;
+
+        data.capacity = data.nentries;
+        data.segmentation = new unsigned char[data.capacity];
+        data.skeleton = new unsigned char[data.capacity];
+        data.inside = new unsigned char[data.capacity];
+        data.DBF = new double[data.capacity];
+        data.penalties = new double[data.capacity];
+        data.PDRF = new double[data.capacity];
+        data.voxel_data = new DijkstraData[data.capacity];
+        if (!data.voxel_data) exit(-1);
+        for (long iv = 0; iv < data.capacity; ++iv)
+            data.voxel_data[iv].visited = 0;
+        data.epoch = 0;
+
+        DijkstraData tmp;
+        data.voxel_heap = new MinBinaryHeap<DijkstraData *>(&tmp, (&tmp.distance), data.capacity);
     }
 
-    // update the boundary values with this distance
-    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-        for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
-            for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-                b[IndicesToIndex(ix, iy, iz)] = DBF[IndicesToIndex(ix, iy, iz)];
-            }
-        }
+    memset(data.segmentation, 0, data.nentries * sizeof(unsigned char));
+    memset(data.skeleton, 0, data.nentries * sizeof(unsigned char));
+    memset(data.inside, 0, data.nentries * sizeof(unsigned char));
+    for (long iv = 0; iv < data.nentries; ++iv) {
+        data.DBF[iv] = 0;
+        data.penalties[iv] = 0;
     }
+}
 
-    // go along the y dimension second for every (z, x) coordinate
-    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-        for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-
-            long k = 0;
-            long *v = new long[grid_size[IB_Y] + 1];
-            double *z = new double[grid_size[IB_Y] + 1];
-
-            v[0] = 0;
-            z[0] = -1 * infinity;
-            z[1] = infinity;
-
-            for (long q = 1; q < grid_size[IB_Y]; ++q) {
-                // label for jump statement
-                ylabel:
-                double s = ((b[IndicesToIndex(ix, q, iz)] + q * q) - (b[IndicesToIndex(ix, v[k], iz)] +  v[k] * v[k])) / (float)(2 * q - 2 * v[k]);
-                
-                if (s <= z[k]) {
-                    --k;
-                    goto ylabel;
-                }
-                else {
-                    ++k; 
-                    v[k] = q;
-                    z[k] = s;
-                    z[k + 1] = infinity;
-                }
-            }
 
-            k = 0;
-            for (long q = 0; q < grid_size[IB_Y]; ++q) {
-                while (z[k + 1] < q)
-                    ++k;
-            
-                DBF[IndicesToIndex(ix, q, iz)] = (q - v[k]) * (q - v[k]) + b[IndicesToIndex(ix, v[k], iz)];
-            }
 
-            // free memory
-            delete[] v;
-            delete[] z;
-        }
-    }
+static void IndexToIndicies(TeaserData &data, long iv, long &ix, long &iy, long &iz)
+{
+    iz = iv / data.sheet_size;
+    iy = (iv - iz * data.sheet_size) / data.row_size;
+    ix = iv % data.row_size;
+}
 
-    // update the boundary values with this distance
-    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-        for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
-            for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-                b[IndicesToIndex(ix, iy, iz)] = DBF[IndicesToIndex(ix, iy, iz)];
-            }
-        }
-    }
 
 
-    // go along the x dimension last for every (y, z) coordinate
-    for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
-        for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
+static long IndicesToIndex(TeaserData &data, long ix, long iy, long iz)
+{
+    return iz * data.sheet_size + iy * data.row_size + ix;
+}
 
-            long k = 0;
-            long *v = new long[grid_size[IB_X] + 1];
-            double *z = new double[grid_size[IB_X] + 1];
 
-            v[0] = 0;
-            z[0] = -1 * infinity;
-            z[1] = infinity;
 
-            for (long q = 1; q < grid_size[IB_X]; ++q) {
-                // label for jump statement
-                xlabel:
-                double s = ((b[IndicesToIndex(q, iy, iz)] + q * q) - (b[IndicesToIndex(v[k], iy, iz)] + v[k] * v[k])) / (float)(2 * q - 2 * v[k]);
+static void ComputeDistanceFromBoundaryField(TeaserData &data)
+{
+    long *grid_size = data.grid_size;
+    long infinity = data.infinity;
+    unsigned char *segmentation = data.segmentation;
+    double *DBF = data.DBF;
 
-                if (s <= z[k]) {
-                    --k;
-                    goto xlabel;
+    // create the bounday map for the distance transform
+    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
+        for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
+            for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
+                if (!segmentation[IndicesToIndex(data, ix, iy, iz)]) {
+                    DBF[IndicesToIndex(data, ix, iy, iz)] = 0;
+                    continue;
+                }
+
+                // inside voxels that are on the boundary have value 1 (based on TEASER paper figure 2)
+                if ((ix == 0 or iy == 0 or iz == 0 or (ix == grid_size[IB_X] - 1) or (iy == grid_size[IB_Y] - 1) or (iz == grid_size[IB_Z] - 1)) ||
+                    (ix > 0 and !segmentation[IndicesToIndex(data, ix - 1, iy, iz)]) ||
+                    (iy > 0 and !segmentation[IndicesToIndex(data, ix, iy - 1, iz)]) ||
+                    (iz > 0 and !segmentation[IndicesToIndex(data, ix, iy, iz - 1)]) ||
+                    (ix < grid_size[IB_X] - 1 and !segmentation[IndicesToIndex(data, ix + 1, iy, iz)]) ||
+                    (iy < grid_size[IB_Y] - 1 and !segmentation[IndicesToIndex(data, ix, iy + 1, iz)]) ||
+                    (iz < grid_size[IB_Z] - 1 and !segmentation[IndicesToIndex(data, ix, iy, iz + 1)])) {
+                    DBF[IndicesToIndex(data, ix, iy, iz)] = 1;
                 }
                 else {
-                    ++k;
-                    v[k] = q;
-                    z[k] = s;
-                    z[k + 1] = infinity;
+                    DBF[IndicesToIndex(data, ix, iy, iz)] = infinity;
                 }
             }
-
-            k = 0;
-            for (long q = 0;  q < grid_size[IB_X]; ++q) {
-                while (z[k + 1] < q)
-                    ++k;
-
-                DBF[IndicesToIndex(q, iy, iz)] = (q - v[k]) * (q - v[k]) + b[IndicesToIndex(v[k], iy, iz)];
-            }
-
-            // free memory
-            delete[] v;
-            delete[] z;
         }
     }
 
-    for (long iv = 0; iv < nentries; ++iv) {
+    // the shared transform goes along z, y and x in place, labels are already spread over the threads
+    CppSquaredDistanceField(DBF, grid_size, voxel_size, 1, &(data.rows));
+
+    for (long iv = 0; iv < data.nentries; ++iv) {
         DBF[iv] = sqrt(DBF[iv]);
     }
-
-    // free memory
-    delete[] b;
 }
 
 
 
-struct DijkstraData {
-    long iv;
-    DijkstraData *prev;
-    double voxel_penalty;
-    double distance;
-    bool visited;
-};
+static bool IsVisited(TeaserData &data, long iv)
+{
+    return data.voxel_data[iv].visited == data.epoch;
+}
 
 
 
-long ComputeDistanceFromVoxelField(long source_index)
+// the distance and path to the root are only saved if compute_skeleton is true
+static long ComputeDistanceFromVoxelField(TeaserData &data, long source_index, bool compute_skeleton)
 {
-    DijkstraData *voxel_data = new DijkstraData[nentries];
-    if (!voxel_data) exit(-1);
-
-    // initialize all data
-    for (int iv = 0; iv < nentries; ++iv) {
-        voxel_data[iv].iv = iv;
-        voxel_data[iv].prev = NULL;
-        voxel_data[iv].voxel_penalty = penalties[iv];
-        voxel_data[iv].distance = infinity;
-        voxel_data[iv].visited = false;
-    }
+    DijkstraData *voxel_data = data.voxel_data;
+    MinBinaryHeap<DijkstraData *> &voxel_heap = *(data.voxel_heap);
+    unsigned char *segmentation = data.segmentation;
 
-    // initialize the priority queue
-    DijkstraData tmp;
-    MinBinaryHeap<DijkstraData *> voxel_heap(&tmp, (&tmp.distance), nentries);
+    // a new epoch invalidates all previous visits without resetting the buffer
+    data.epoch++;
 
     // insert the source into the heap
+    voxel_data[source_index].iv = source_index;
+    voxel_data[source_index].prev = NULL;
     voxel_data[source_index].distance = 0.0;
-    voxel_data[source_index].visited = true;
+    voxel_data[source_index].visited = data.epoch;
     voxel_heap.Insert(source_index, &(voxel_data[source_index]));
 
     // visit all vertices
@@ -277,39 +257,39 @@ long ComputeDistanceFromVoxelField(long source_index)
 
         // visit all 26 neighbors of this index
         long ix, iy, iz;
-        IndexToIndicies(voxel_index, ix, iy, iz);
+        IndexToIndicies(data, voxel_index, ix, iy, iz);
 
         for (long iw = iz - 1; iw <= iz + 1; ++iw) {
             for (long iv = iy - 1; iv <= iy + 1; ++iv) {
                 for (long iu = ix - 1; iu <= ix + 1; ++iu) {
                     // get the linear index for this voxel
-                    long neighbor_index = IndicesToIndex(iu, iv, iw);
+                    long neighbor_index = IndicesToIndex(data, iu, iv, iw);
 
                     // skip if background
                     if (!segmentation[neighbor_index]) continue;
-                    
+
                     // get the corresponding neighbor data
                     DijkstraData *neighbor_data = &(voxel_data[neighbor_index]);
 
                     // find the distance between these voxels
-                    long deltaz = (iw - iz);
-                    long deltay = (iv - iy);
-                    long deltax = (iu - ix);
+                    double deltaz = (iw - iz) * voxel_size[IB_Z];
+                    double deltay = (iv - iy) * voxel_size[IB_Y];
+                    double deltax = (iu - ix) * voxel_size[IB_X];
 
                     // get the distance between (ix, iy, iz) and (iu, iv, iw)
                     double distance = sqrt(deltax * deltax + deltay * deltay + deltaz * deltaz);
 
                     // get the distance to get to this voxel through the current voxel (requires a penalty for visiting this voxel)
-                    double distance_through_current = current->distance + distance + neighbor_data->voxel_penalty;
-                    double distance_without_current = neighbor_data->distance;
+                    double distance_through_current = current->distance + distance + data.penalties[neighbor_index];
 
-                    if (!neighbor_data->visited) {
+                    if (!IsVisited(data, neighbor_index)) {
+                        neighbor_data->iv = neighbor_index;
                         neighbor_data->prev = current;
                         neighbor_data->distance = distance_through_current;
-                        neighbor_data->visited = true;
+                        neighbor_data->visited = data.epoch;
                         voxel_heap.Insert(neighbor_index, neighbor_data);
                     }
-                    else if (distance_through_current < distance_without_current) {
+                    else if (distance_through_current < neighbor_data->distance) {
                         neighbor_data->prev = current;
                         neighbor_data->distance = distance_through_current;
                         voxel_heap.DecreaseKey(neighbor_index, neighbor_data);
@@ -320,55 +300,59 @@ long ComputeDistanceFromVoxelField(long source_index)
     }
 
     // first call to this function needs to return the root and does not compute the skeleton
-    if (!PDRF) {
-        // free memory
-        delete[] voxel_data;
-
+    if (!compute_skeleton) {
         // return the farthest voxel (to get the root voxel)
         return voxel_index;
     }
 
-    // save the PDRF (only called when given root voxel)
-    for (long iv = 0; iv < nentries; ++iv) {
+    // save the PDRF (only called when given root voxel), unreachable voxels are infinitely far
+    for (long iv = 0; iv < data.nentries; ++iv) {
         if (!segmentation[iv]) continue;
-        PDRF[iv] = voxel_data[iv].distance;
+        if (IsVisited(data, iv)) data.PDRF[iv] = voxel_data[iv].distance;
+        else {
+            data.PDRF[iv] = data.infinity;
+            voxel_data[iv].iv = iv;
+            voxel_data[iv].prev = NULL;
+            voxel_data[iv].distance = data.infinity;
+            voxel_data[iv].visited = data.epoch;
+        }
     }
 
     // continue until there are no more inside voxels
-    while (inside_voxels) {
+    while (data.inside_voxels) {
         double farthest_pdrf = -1;
         long starting_voxel = -1;
 
         // find the farthest PDRF that is still inside
-        for (long iv = 0; iv < nentries; ++iv) {
-            if (!inside[iv]) continue;
-            if (PDRF[iv] > farthest_pdrf) {
-                farthest_pdrf = PDRF[iv];
+        for (long iv = 0; iv < data.nentries; ++iv) {
+            if (!data.inside[iv]) continue;
+            if (data.PDRF[iv] > farthest_pdrf) {
+                farthest_pdrf = data.PDRF[iv];
                 starting_voxel = iv;
             }
         }
 
-        for (long iv = 0; iv < nentries; ++iv) {
-            if (!inside[iv]) continue;
+        for (long iv = 0; iv < data.nentries; ++iv) {
+            if (!data.inside[iv]) continue;
             long ix, iy, iz;
-            IndexToIndicies(iv, ix, iy, iz);
+            IndexToIndicies(data, iv, ix, iy, iz);
 
             // get the skeleton path from this location to the root
             DijkstraData *current = &(voxel_data[starting_voxel]);
 
-            while (!skeleton[current->iv]) {
+            while (current && !data.skeleton[current->iv]) {
                 long ii, ij, ik;
-                IndexToIndicies(current->iv, ii, ij, ik);
+                IndexToIndicies(data, current->iv, ii, ij, ik);
                 // what is the distance between this skeleton location and the inside location
-                double deltax = (ii - ix);
-                double deltay = (ij - iy);
-                double deltaz = (ik - iz);
+                double deltax = (ii - ix) * voxel_size[IB_X];
+                double deltay = (ij - iy) * voxel_size[IB_Y];
+                double deltaz = (ik - iz) * voxel_size[IB_Z];
 
                 double distance = sqrt(deltax * deltax + deltay * deltay + deltaz * deltaz);
 
-                if (distance < scale * DBF[current->iv] + buffer) {
-                    inside[iv] = 0;
-                    inside_voxels--;
+                if (distance < scale * data.DBF[current->iv] + buffer) {
+                    data.inside[iv] = 0;
+                    data.inside_voxels--;
                     break;
                 }
 
@@ -378,48 +362,45 @@ long ComputeDistanceFromVoxelField(long source_index)
         }
 
         DijkstraData *current = &(voxel_data[starting_voxel]);
-        while (!skeleton[current->iv]) {
-            skeleton[current->iv] = 1;
+        while (current && !data.skeleton[current->iv]) {
+            data.skeleton[current->iv] = 1;
             current = current->prev;
         }
     }
 
-    // free memory
-    delete[] voxel_data;
-
     return -1;
 }
 
 
 
-void ComputePenalties(void)
+static void ComputePenalties(TeaserData &data)
 {
     // get the maximum distance from the boundary
     double M = 0;
-    for (long iv = 0; iv < nentries; ++iv) {
-        if (DBF[iv] > M) M = DBF[iv]; 
+    for (long iv = 0; iv < data.nentries; ++iv) {
+        if (data.DBF[iv] > M) M = data.DBF[iv];
     }
 
     // choose 5000 so that 3000 length voxel paths have correct floating point precision
     const double pdrf_scale = 5000;
-    for (long iv = 0; iv < nentries; ++iv) {
-        penalties[iv] = pdrf_scale * pow(1 - DBF[iv] / M, 16);
+    for (long iv = 0; iv < data.nentries; ++iv) {
+        data.penalties[iv] = pdrf_scale * pow(1 - data.DBF[iv] / M, 16);
     }
 }
 
 
 
-static bool IsEndpoint(long iv)
+static bool IsEndpoint(TeaserData &data, long iv)
 {
     long ix, iy, iz;
-    IndexToIndicies(iv, ix, iy, iz);
+    IndexToIndicies(data, iv, ix, iy, iz);
 
     short nnneighbors = 0;
     for (long iw = iz - 1; iw <= iz + 1; ++iw) {
         for (long iv = iy - 1; iv <= iy + 1; ++iv) {
             for (long iu = ix - 1; iu <= ix + 1; ++iu) {
-                long linear_index = IndicesToIndex(iu, iv, iw);
-                if (segmentation[linear_index]) nnneighbors++;
+                long linear_index = IndicesToIndex(data, iu, iv, iw);
+                if (data.skeleton[linear_index]) nnneighbors++;
             }
         }
     }
@@ -431,7 +412,111 @@ static bool IsEndpoint(long iv)
 
 
 
-void CppTeaserSkeletonization(const char *prefix, long skeleton_resolution[3], bool benchmark, double input_scale, long input_buffer) 
+// skeletonize one label given its elements in the uncropped grid and write the skeleton elements to output
+static void TeaserSkeletonizeLabel(TeaserData &data, long input_grid_size[3], std::vector<long> &elements, std::vector<long> &output)
+{
+    output.clear();
+    if (!elements.size()) return;
+
+    // the label is processed on its bounding box with one voxel of padding (or on the padded grid)
+    long min_index[3] = { input_grid_size[IB_Z], input_grid_size[IB_Y], input_grid_size[IB_X] };
+    long max_index[3] = { -1, -1, -1 };
+    for (unsigned long ie = 0; ie < elements.size(); ++ie) {
+        long iz = elements[ie] / (input_grid_size[IB_X] * input_grid_size[IB_Y]);
+        long iy = (elements[ie] - iz * input_grid_size[IB_X] * input_grid_size[IB_Y]) / input_grid_size[IB_X];
+        long ix = elements[ie] % input_grid_size[IB_X];
+
+        if (iz < min_index[IB_Z]) min_index[IB_Z] = iz;
+        if (iy < min_index[IB_Y]) min_index[IB_Y] = iy;
+        if (ix < min_index[IB_X]) min_index[IB_X] = ix;
+        if (iz > max_index[IB_Z]) max_index[IB_Z] = iz;
+        if (iy > max_index[IB_Y]) max_index[IB_Y] = iy;
+        if (ix > max_index[IB_X]) max_index[IB_X] = ix;
+    }
+
+    long grid_size[3];
+    for (int dim = 0; dim < 3; ++dim) {
+        if (!crop_labels) min_index[dim] = 0;
+        if (crop_labels) grid_size[dim] = max_index[dim] - min_index[dim] + 3;
+        else grid_size[dim] = input_grid_size[dim] + 2;
+    }
+
+    ReserveTeaserData(data, grid_size);
+
+    for (unsigned long ie = 0; ie < elements.size(); ++ie) {
+        // convert the element to non-cropped iz, iy, ix
+        long iz = elements[ie] / (input_grid_size[IB_X] * input_grid_size[IB_Y]);
+        long iy = (elements[ie] - iz * input_grid_size[IB_X] * input_grid_size[IB_Y]) / input_grid_size[IB_X];
+        long ix = elements[ie] % input_grid_size[IB_X];
+
+        // convert to cropped linear index
+        long element = IndicesToIndex(data, ix - min_index[IB_X] + 1, iy - min_index[IB_Y] + 1, iz - min_index[IB_Z] + 1);
+
+        data.segmentation[element] = 1;
+        data.inside[element] = 1;
+        data.inside_voxels++;
+    }
+
+    ComputeDistanceFromBoundaryField(data);
+
+    // set any voxel as the source
+    long source_voxel = -1;
+    for (long iv = 0; iv < data.nentries; ++iv)
+        if (data.inside[iv]) { source_voxel = iv; break; }
+
+    // find a root voxel which is guaranteed to be at an extrema point
+    long root_voxel = ComputeDistanceFromVoxelField(data, source_voxel, false);
+    data.skeleton[root_voxel] = 1;
+    data.inside[root_voxel] = 0;
+    data.inside_voxels--;
+
+    ComputePenalties(data);
+    ComputeDistanceFromVoxelField(data, root_voxel, true);
+
+    for (long iv = 0; iv < data.nentries; ++iv) {
+        if (!data.skeleton[iv]) continue;
+
+        long ix, iy, iz;
+        IndexToIndicies(data, iv, ix, iy, iz);
+        ix += min_index[IB_X] - 1;
+        iy += min_index[IB_Y] - 1;
+        iz += min_index[IB_Z] - 1;
+
+        long element = iz * input_grid_size[IB_X] * input_grid_size[IB_Y] + iy * input_grid_size[IB_X] + ix;
+
+        // endpoints get a negative value
+        if (IsEndpoint(data, iv)) element = -1 * element;
+
+        output.push_back(element);
+    }
+}
+
+
+
+static void TeaserWorker(long input_grid_size[3], std::vector<std::vector<long> > *elements, std::vector<std::vector<long> > *skeletons, double *running_times, std::atomic<long> *next_label)
+{
+    TeaserData data;
+    InitializeTeaserData(data);
+
+    long max_label = elements->size();
+    for (long label = (*next_label)++; label < max_label; label = (*next_label)++) {
+        std::chrono::steady_clock::time_point t1 = std::chrono::steady_clock::now();
+
+        TeaserSkeletonizeLabel(data, input_grid_size, (*elements)[label], (*skeletons)[label]);
+
+        // free the input for this label
+        std::vector<long>().swap((*elements)[label]);
+
+        std::chrono::steady_clock::time_point t2 = std::chrono::steady_clock::now();
+        running_times[label] = std::chrono::duration<double>(t2 - t1).count();
+    }
+
+    ReleaseTeaserData(data);
+}
+
+
+
+void CppTeaserSkeletonization(const char *prefix, long skeleton_resolution[3], bool benchmark, double input_scale, long input_buffer)
 {
     // set global variables
     scale = input_scale;
@@ -447,6 +532,7 @@ void CppTeaserSkeletonization(const char *prefix, long skeleton_resolution[3], b
     if (!rfp) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
 
     // read the size and number of segments
+    long grid_size[3];
     if (fread(&(grid_size[IB_Z]), sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
     if (fread(&(grid_size[IB_Y]), sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
     if (fread(&(grid_size[IB_X]), sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
@@ -458,139 +544,57 @@ void CppTeaserSkeletonization(const char *prefix, long skeleton_resolution[3], b
 
     if (benchmark) sprintf(output_filename, "benchmarks/skeleton/%s-teaser-%03ldx%03ldx%03ld-downsample-skeleton.pts", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
     else sprintf(output_filename, "skeletons/%s/teaser-%03ldx%03ldx%03ld-downsample-skeleton.pts", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
-    
+
     FILE *wfp = fopen(output_filename, "wb");
     if (!wfp) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
 
     // go through all labels
     long max_label;
     if (fread(&max_label, sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
-    
+
     // write header for the skeleton file
     if (fwrite(&(grid_size[IB_Z]), sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
     if (fwrite(&(grid_size[IB_Y]), sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
     if (fwrite(&(grid_size[IB_X]), sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
     if (fwrite(&max_label, sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
 
-    // add padding around each segment
-    grid_size[IB_Z] += 2;
-    grid_size[IB_Y] += 2;
-    grid_size[IB_X] += 2;
-
-    // set global indexing parameters
-    nentries = grid_size[IB_Z] * grid_size[IB_Y] * grid_size[IB_X];
-    sheet_size = grid_size[IB_Y] * grid_size[IB_X];
-    row_size = grid_size[IB_X];
-    infinity = grid_size[IB_Z] * grid_size[IB_Z] + grid_size[IB_Y] * grid_size[IB_Y] + grid_size[IB_X] * grid_size[IB_X];
-
-    double *running_times = new double[max_label];
-
+    // read the elements of every label so that labels can be skeletonized independently
+    std::vector<std::vector<long> > elements(max_label);
     for (long label = 0; label < max_label; ++label) {
-        clock_t t1, t2;
-        t1 = clock();
-
-        // find the number of elements in this segment
         long num;
         if (fread(&num, sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
-        if (!num) { fwrite(&num, sizeof(long), 1, wfp); continue; }
-
-        // allocate memory for global variables
-        segmentation = new unsigned char[nentries];
-        skeleton = new unsigned char[nentries];
-        penalties = new double[nentries];
-        inside = new unsigned char[nentries];
-        DBF = new double[nentries];
-        for (long iv = 0; iv < nentries; ++iv) {
-            segmentation[iv] = 0;
-            skeleton[iv] = 0;
-            penalties[iv] = 0;
-            inside[iv] = 0;
-            DBF[iv] = 0;
-        }
-
-        for (long iv = 0; iv < num; ++iv) {
-            long element;
-            if (fread(&element, sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
-
-
-            // convert the element to non-cropped iz, iy, ix
-            long iz = element / ((grid_size[IB_X] - 2) * (grid_size[IB_Y] - 2));
-            long iy = (element - iz * (grid_size[IB_X] - 2) * (grid_size[IB_Y] - 2)) / (grid_size[IB_X] - 2);
-            long ix = element % (grid_size[IB_X] - 2);
-
-            // convert to cropped linear index
-            element = (iz + 1) * sheet_size + (iy + 1) * row_size + ix + 1;
-
-            segmentation[element] = 1;
-            inside[element] = 1;
-            inside_voxels++;
-        }
-
-        ComputeDistanceFromBoundaryField();
-
-        // set any voxel as the source
-        long source_voxel = -1;
-        for (long iv = 0; iv < nentries; ++iv)
-            if (inside[iv]) { source_voxel = iv; break; }
-
-        // find a root voxel which is guaranteed to be at an extrema point
-        long root_voxel = ComputeDistanceFromVoxelField(source_voxel);
-        skeleton[root_voxel] = 1;
-        inside[root_voxel] = 0;
-        inside_voxels--;
 
-        ComputePenalties();
-        PDRF = new double[nentries];
-        ComputeDistanceFromVoxelField(root_voxel);
+        elements[label].resize(num);
+        if (num && fread(&(elements[label][0]), sizeof(long), num, rfp) != (unsigned long) num) { fprintf(stderr, "Failed to read %s\n", input_filename); exit(-1); }
+    }
 
-        num = 0;
-        for (long iv = 0; iv < nentries; ++iv) {
-            if (skeleton[iv]) num++;
-        }
+    // close the input file
+    fclose(rfp);
 
-        // delete segmentation and point to skeleton to find which indices are endpoints
-        delete[] segmentation;
-        segmentation = skeleton;
+    std::vector<std::vector<long> > skeletons(max_label);
+    double *running_times = new double[max_label];
+    for (long label = 0; label < max_label; ++label)
+        running_times[label] = 0.0;
+
+    // labels are taken from a shared counter by every thread
+    std::atomic<long> next_label(0);
+    if (nthreads == 1) TeaserWorker(grid_size, &elements, &skeletons, running_times, &next_label);
+    else {
+        std::vector<std::thread> threads;
+        for (long it = 0; it < nthreads; ++it)
+            threads.push_back(std::thread(TeaserWorker, grid_size, &elements, &skeletons, running_times, &next_label));
+        for (long it = 0; it < nthreads; ++it)
+            threads[it].join();
+    }
 
-        // write the number of elements
+    // write the skeletons in label order
+    for (long label = 0; label < max_label; ++label) {
+        long num = skeletons[label].size();
         if (fwrite(&num, sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
-
-        for (long iv = 0; iv < nentries; ++iv) {
-            if (!skeleton[iv]) continue;
-
-            long ix, iy, iz;
-            IndexToIndicies(iv, ix, iy, iz);
-            --ix; --iy; --iz;
-
-            long element = iz * (grid_size[IB_X] - 2) * (grid_size[IB_Y] - 2) + iy * (grid_size[IB_X] - 2) + ix;
-            if (IsEndpoint(iv)) element = -1 * element;
-
-            // endpoints get a negative value
-            if (fwrite(&element, sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
-        }
-
-        // free memory
-        delete[] skeleton;
-        delete[] penalties;
-        delete[] PDRF;
-        delete[] inside;
-        delete[] DBF;
-
-        // reset global variables
-        segmentation = NULL;
-        skeleton = NULL;
-        penalties = NULL;
-        PDRF = NULL;
-        inside = NULL;
-        DBF = NULL;
-
-        t2 = clock();
-
-        running_times[label] = (double)(t2 - t1) / CLOCKS_PER_SEC;
+        if (num && fwrite(&(skeletons[label][0]), sizeof(long), num, wfp) != (unsigned long) num) { fprintf(stderr, "Failed to write to %s\n", output_filename); exit(-1); }
     }
 
-    // close the files
-    fclose(rfp);
+    // close the output file
     fclose(wfp);
 
     // save running time information
@@ -600,12 +604,18 @@ void CppTeaserSkeletonization(const char *prefix, long skeleton_resolution[3], b
 
         FILE *running_times_fp = fopen(running_times_filename, "wb");
         if (!running_times_fp) exit(-1);
-       
+
         if (fwrite(&max_label, sizeof(long), 1, running_times_fp) != 1) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); }
         if (fwrite(running_times, sizeof(double), max_label, running_times_fp) != (unsigned long) max_label) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); }
 
         fclose(running_times_fp);
     }
+    else if (CppRecordRunningTimes()) {
+        char running_times_filename[4096];
+        sprintf(running_times_filename, "%s/running-times/teaser-%03ldx%03ldx%03ld-%02ld-%02ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z], (long)(10 * scale), buffer);
+
+        CppWriteRunningTimes(running_times_filename, max_label, running_times);
+    }
 
 
     delete[] running_times;
@@ -675,6 +675,12 @@ void CppTopologicalThinning(const char *prefix, long skeleton_resolution[3], con
 
         fclose(running_times_fp);
     }
+    else if (CppRecordRunningTimes()) {
+        char running_times_filename[4096];
+        sprintf(running_times_filename, "%s/running-times/thinning-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+        CppWriteRunningTimes(running_times_filename, max_label, running_times);
+    }
 
     delete[] running_times;
 
@@ -1,18 +1,35 @@
 /* c++ file to upsample the skeletons to full resolution */
 
 #include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <algorithm>
+#include <unordered_map>
 #include <unordered_set>
-#include <map>
-#include <queue>
 #include <set>
+#include <vector>
 #include <string.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 #include "cpp-generate_skeletons.h"
 
 
 
 // global variables for upsampling operation
 
-static std::map<long, long> *down_to_up;
+// mapping from downsampled to upsampled indices, stored per label as arrays sorted by the
+// downsampled index (the label entries are in [down_to_up_offsets[label], down_to_up_offsets[label + 1]))
+// the arrays point into a memory mapped file that is shared between processes
+static long *down_to_up_mapping = NULL;
+static size_t down_to_up_mapping_size = 0;
+static long *down_to_up_offsets = NULL;
+static long *down_to_up_down = NULL;
+static long *down_to_up_up = NULL;
+// the mapping header holds the grid sizes, max_label and the signature of both input files
+static const long down_to_up_signature_size = 7;
+static const long down_to_up_header_size = 7 + 2 * down_to_up_signature_size;
 static long *segmentation;
 static unsigned char *skeleton;
 static std::set<std::pair<long, long> > connected_joints;
@@ -47,6 +64,33 @@ static void IndexToIndices(long iv, long &ix, long &iy, long &iz)
 
 
 
+static void ReleaseDown2Up(void)
+{
+    if (down_to_up_mapping) munmap(down_to_up_mapping, down_to_up_mapping_size);
+
+    down_to_up_mapping = NULL;
+    down_to_up_mapping_size = 0;
+    down_to_up_offsets = NULL;
+    down_to_up_down = NULL;
+    down_to_up_up = NULL;
+}
+
+
+
+// binary search for the upsampled index of this downsampled index (0 if the label does not contain it)
+static long DownToUp(long label, long down_index)
+{
+    long *first = down_to_up_down + down_to_up_offsets[label];
+    long *last = down_to_up_down + down_to_up_offsets[label + 1];
+
+    long *entry = std::lower_bound(first, last, down_index);
+    if (entry == last || *entry != down_index) return 0;
+
+    return down_to_up_up[entry - down_to_up_down];
+}
+
+
+
 void CppAStarSetMaxExpansion(double input_max_expansion)
 {
     max_expansion = input_max_expansion;
@@ -76,6 +120,160 @@ static bool operator<(const AStarNode &one, const AStarNode &two) {
 
 
 
+// g scores for one search direction, stored densely over the bounding box of the
+// current query and stamped with the query epoch so nothing needs to be reset
+
+struct AStarScores {
+    long *g;                                            // best g value so far (dense, bbox local)
+    unsigned long *stamp;                               // epoch if open, epoch + 1 if closed
+    long capacity;                                      // number of allocated entries
+    std::unordered_map<long, long> overflow_g;          // indices outside of the bbox
+    std::unordered_set<long> overflow_closed;
+
+    AStarScores() : g(NULL), stamp(NULL), capacity(0) {}
+};
+
+
+
+// search state that is reused between queries
+
+static AStarScores forward_scores;
+static AStarScores backward_scores;
+static std::vector<AStarNode> forward_queue;
+static std::vector<AStarNode> backward_queue;
+static unsigned long epoch = 0;
+static bool bidirectional_search = false;
+
+static long bbox_min[3];
+static long bbox_size[3];
+
+
+
+void CppAStarSetBidirectional(bool input_bidirectional)
+{
+    bidirectional_search = input_bidirectional;
+}
+
+
+
+// record the running times of every label outside of benchmarking
+static bool record_running_times = false;
+
+void CppSetRecordRunningTimes(bool input_record_running_times)
+{
+    record_running_times = input_record_running_times;
+}
+
+
+
+bool CppRecordRunningTimes(void)
+{
+    return record_running_times;
+}
+
+
+
+void CppWriteRunningTimes(const char *running_times_filename, long max_label, double *running_times)
+{
+    FILE *running_times_fp = fopen(running_times_filename, "wb");
+    if (!running_times_fp) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); return; }
+
+    if (fwrite(&max_label, sizeof(long), 1, running_times_fp) != 1) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); }
+    if (fwrite(running_times, sizeof(double), max_label, running_times_fp) != (unsigned long) max_label) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); }
+
+    fclose(running_times_fp);
+}
+
+
+
+static void ReserveScores(AStarScores &scores, long nentries)
+{
+    if (nentries <= scores.capacity) return;
+
+    delete[] scores.g;
+    delete[] scores.stamp;
+
+    scores.g = new long[nentries];
+    scores.stamp = new unsigned long[nentries];
+    for (long iv = 0; iv < nentries; ++iv) scores.stamp[iv] = 0;
+    scores.capacity = nentries;
+}
+
+
+
+static void ReleaseScores(AStarScores &scores)
+{
+    delete[] scores.g;
+    delete[] scores.stamp;
+
+    scores.g = NULL;
+    scores.stamp = NULL;
+    scores.capacity = 0;
+    scores.overflow_g.clear();
+    scores.overflow_closed.clear();
+}
+
+
+
+// return the index in the bounding box or -1 if outside
+static long BBoxIndex(long index)
+{
+    long iz = index / up_sheet_size - bbox_min[IB_Z];
+    long iy = (index % up_sheet_size) / up_row_size - bbox_min[IB_Y];
+    long ix = index % up_row_size - bbox_min[IB_X];
+
+    if (iz < 0 or iz >= bbox_size[IB_Z]) return -1;
+    if (iy < 0 or iy >= bbox_size[IB_Y]) return -1;
+    if (ix < 0 or ix >= bbox_size[IB_X]) return -1;
+
+    return iz * bbox_size[IB_Y] * bbox_size[IB_X] + iy * bbox_size[IB_X] + ix;
+}
+
+
+
+static bool IsClosed(AStarScores &scores, long index)
+{
+    long local_index = BBoxIndex(index);
+    if (local_index < 0) return scores.overflow_closed.find(index) != scores.overflow_closed.end();
+    return scores.stamp[local_index] == epoch + 1;
+}
+
+
+
+// returns the best g value so far or 0 if the node was never opened (mirrors std::map defaults)
+static long GScore(AStarScores &scores, long index)
+{
+    long local_index = BBoxIndex(index);
+    if (local_index < 0) {
+        std::unordered_map<long, long>::iterator it = scores.overflow_g.find(index);
+        if (it == scores.overflow_g.end()) return 0;
+        return it->second;
+    }
+    if (scores.stamp[local_index] < epoch) return 0;
+    return scores.g[local_index];
+}
+
+
+
+static void SetGScore(AStarScores &scores, long index, long g)
+{
+    long local_index = BBoxIndex(index);
+    if (local_index < 0) { scores.overflow_g[index] = g; return; }
+    scores.g[local_index] = g;
+    scores.stamp[local_index] = epoch;
+}
+
+
+
+static void SetClosed(AStarScores &scores, long index)
+{
+    long local_index = BBoxIndex(index);
+    if (local_index < 0) { scores.overflow_closed.insert(index); return; }
+    scores.stamp[local_index] = epoch + 1;
+}
+
+
+
 static long hscore(long index, long target_index)
 {
     long iz = index / up_sheet_size;
@@ -91,82 +289,173 @@ static long hscore(long index, long target_index)
 
 
 
-// find if a path exists between a source and target node
-static bool HasConnectedPath(long label, long source_index, long target_index)
+// restrict the g scores to the region that A* can expand for this query
+static void StartQuery(long source_index, long target_index, double max_distance)
 {
-    // upsample the source and target indices
-    source_index = down_to_up[label][source_index];
-    target_index = down_to_up[label][target_index];
+    // every expanded node has h <= max_distance so it is within sqrt(max_distance) of the target
+    long radius = (long) sqrt(max_distance) + 2;
+
+    long source[3], target[3];
+    source[IB_Z] = source_index / up_sheet_size;
+    source[IB_Y] = (source_index % up_sheet_size) / up_row_size;
+    source[IB_X] = source_index % up_row_size;
+    target[IB_Z] = target_index / up_sheet_size;
+    target[IB_Y] = (target_index % up_sheet_size) / up_row_size;
+    target[IB_X] = target_index % up_row_size;
+
+    long nentries = 1;
+    for (int dim = 0; dim < 3; ++dim) {
+        long low = std::max(std::min(source[dim], target[dim]) - radius, 0L);
+        long high = std::min(std::max(source[dim], target[dim]) + radius, up_grid_size[dim] - 1);
+        bbox_min[dim] = low;
+        bbox_size[dim] = high - low + 1;
+        nentries *= bbox_size[dim];
+    }
 
-    // don't allow the path to be max_expansion times the first h
-    long h = hscore(source_index, target_index);
-    double max_distance = max_expansion * h;
+    ReserveScores(forward_scores, nentries);
+    if (bidirectional_search) ReserveScores(backward_scores, nentries);
 
-    // add the source to the node list
-    AStarNode source_node = AStarNode(source_index, h, 0, h);
+    // a new epoch invalidates all previous open and closed marks
+    epoch += 2;
 
-    // priority queue for A* Search
-    std::priority_queue<AStarNode> open_queue;
-    open_queue.push(source_node);
+    forward_queue.clear();
+    backward_queue.clear();
+    forward_scores.overflow_g.clear();
+    forward_scores.overflow_closed.clear();
+    backward_scores.overflow_g.clear();
+    backward_scores.overflow_closed.clear();
+}
+
+
+
+static void PushNode(std::vector<AStarNode> &queue, const AStarNode &node)
+{
+    queue.push_back(node);
+    std::push_heap(queue.begin(), queue.end());
+}
 
-    // create a set of opened and closed nodes which should not be considered
-    std::map<long, long> open_list;
-    open_list[source_node.iv] = source_node.g;          // the mapping keeps track of best g value so far
-    std::set<long> closed_list;
 
-    while (!open_queue.empty()) {
+
+static AStarNode PopNode(std::vector<AStarNode> &queue)
+{
+    std::pop_heap(queue.begin(), queue.end());
+    AStarNode node = queue.back();
+    queue.pop_back();
+
+    return node;
+}
+
+
+
+// expand the current node in one direction, returns true if the other direction was met
+static bool ExpandNode(long label, const AStarNode &current, long target_index, double max_distance,
+                       std::vector<AStarNode> &queue, AStarScores &scores, AStarScores *other_scores)
+{
+    // get the cartesian indices
+    long iz = current.iv / up_sheet_size;
+    long iy = (current.iv - iz * up_sheet_size) / up_row_size;
+    long ix = current.iv % up_row_size;
+
+    for (long iw = -1; iw <= 1; ++iw) {
+        for (long iv = -1; iv <= 1; ++iv) {
+            for (long iu = -1; iu <= 1; ++iu) {
+                long ik = iz + iw;
+                long ij = iy + iv;
+                long ii = ix + iu;
+
+                long successor = ik * up_sheet_size + ij * up_row_size + ii;
+                if (successor < 0 or successor > up_nentries - 1) continue;
+                if (segmentation[successor] != label) continue;
+
+                // skip if already closed
+                if (IsClosed(scores, successor)) continue;
+
+                long successor_g = current.g + iw * iw + iv * iv + iu * iu;
+                long best_g = GScore(scores, successor);
+
+                // this is not the best path to this node
+                if (best_g and successor_g >= best_g) continue;
+
+                // add the node or update the value (keep the old one on the queue)
+                long g = successor_g;
+                long h = hscore(successor, target_index);
+                long f = g + h;
+                PushNode(queue, AStarNode(successor, f, g, h));
+                SetGScore(scores, successor, g);
+
+                // see if the search from the other direction already reached this node
+                if (other_scores) {
+                    long other_g = GScore(*other_scores, successor);
+                    if ((other_g or IsClosed(*other_scores, successor)) and g + other_g <= max_distance) return true;
+                }
+            }
+        }
+    }
+
+    return false;
+}
+
+
+
+static bool UnidirectionalSearch(long label, long source_index, long target_index, double max_distance, long h)
+{
+    // add the source to the node list
+    PushNode(forward_queue, AStarNode(source_index, h, 0, h));
+    SetGScore(forward_scores, source_index, 0);          // the scores keep track of best g value so far
+
+    while (!forward_queue.empty()) {
         // pop the current best node from the list
-        AStarNode current = open_queue.top(); open_queue.pop();
+        AStarNode current = PopNode(forward_queue);
 
         // if this node is the target we win!
         if (current.iv == target_index) return true;
-        if (current.g != open_list[current.iv]) continue;
+        if (current.g != GScore(forward_scores, current.iv)) continue;
         if (current.f > max_distance) break;
 
         // this node is now expanded
-        closed_list.insert(current.iv);
-
-        // get the cartesian indices
-        long iz = current.iv / up_sheet_size;
-        long iy = (current.iv - iz * up_sheet_size) / up_row_size;
-        long ix = current.iv % up_row_size;
-
-        for (long iw = -1; iw <= 1; ++iw) {
-            for (long iv = -1; iv <= 1; ++iv) {
-                for (long iu = -1; iu <= 1; ++iu) {
-                    long ik = iz + iw;
-                    long ij = iy + iv;
-                    long ii = ix + iu;
-
-                    long successor = ik * up_sheet_size + ij * up_row_size + ii;
-                    if (successor < 0 or successor > up_nentries - 1) continue;
-                    if (segmentation[successor] != label) continue;
-
-                    // skip if already closed
-                    if (closed_list.find(successor) != closed_list.end()) continue;
-
-                    long successor_g = current.g + iw * iw + iv * iv + iu * iu;
-                    if (!open_list[successor]) {
-                        long g = successor_g;
-                        long h = hscore(successor, target_index);
-                        long f = g + h;
-                        AStarNode successor_node = AStarNode(successor, f, g, h);
-                        open_queue.push(successor_node);
-                        open_list[successor] = g;
-                    }
-                    // this is not the best path to this node
-                    else if (successor_g >= open_list[successor]) continue;
-                    // update the value (keep the old one on the queue)
-                    else {
-                        long g = successor_g;
-                        long h = hscore(successor, target_index);
-                        long f = g + h;
-                        AStarNode successor_node = AStarNode(successor, f, g, h);
-                        open_queue.push(successor_node);
-                        open_list[successor] = g;
-                    }
-                }
-            }
+        SetClosed(forward_scores, current.iv);
+
+        ExpandNode(label, current, target_index, max_distance, forward_queue, forward_scores, NULL);
+    }
+
+    return false;
+}
+
+
+
+// grow the search from both ends and stop when the two frontiers meet within max_distance
+// (the pruning differs from the one sided search so a few more joints can end up connected)
+static bool BidirectionalSearch(long label, long source_index, long target_index, double max_distance, long h)
+{
+    PushNode(forward_queue, AStarNode(source_index, h, 0, h));
+    SetGScore(forward_scores, source_index, 0);
+    PushNode(backward_queue, AStarNode(target_index, h, 0, h));
+    SetGScore(backward_scores, target_index, 0);
+
+    bool forward_done = false;
+    bool backward_done = false;
+    while (!forward_done or !backward_done) {
+        for (int direction = 0; direction < 2; ++direction) {
+            bool &done = direction ? backward_done : forward_done;
+            if (done) continue;
+
+            std::vector<AStarNode> &queue = direction ? backward_queue : forward_queue;
+            AStarScores &scores = direction ? backward_scores : forward_scores;
+            AStarScores &other_scores = direction ? forward_scores : backward_scores;
+            long goal_index = direction ? source_index : target_index;
+
+            // skip stale entries on the queue
+            while (!queue.empty() and queue.front().g != GScore(scores, queue.front().iv) and queue.front().iv != goal_index)
+                PopNode(queue);
+            if (queue.empty()) { done = true; continue; }
+
+            AStarNode current = PopNode(queue);
+            if (current.iv == goal_index) return true;
+            if (current.f > max_distance) { done = true; continue; }
+
+            SetClosed(scores, current.iv);
+
+            if (ExpandNode(label, current, goal_index, max_distance, queue, scores, &other_scores)) return true;
         }
     }
 
@@ -175,6 +464,25 @@ static bool HasConnectedPath(long label, long source_index, long target_index)
 
 
 
+// find if a path exists between a source and target node
+static bool HasConnectedPath(long label, long source_index, long target_index)
+{
+    // upsample the source and target indices
+    source_index = DownToUp(label, source_index);
+    target_index = DownToUp(label, target_index);
+
+    // don't allow the path to be max_expansion times the first h
+    long h = hscore(source_index, target_index);
+    double max_distance = max_expansion * h;
+
+    StartQuery(source_index, target_index, max_distance);
+
+    if (bidirectional_search) return BidirectionalSearch(label, source_index, target_index, max_distance, h);
+    else return UnidirectionalSearch(label, source_index, target_index, max_distance, h);
+}
+
+
+
 static bool IsEndpoint(long source_index, long label)
 {
     short nneighbors = 0;
@@ -208,57 +516,190 @@ static bool IsEndpoint(long source_index, long label)
 
 
 
-static int MapDown2Up(const char *prefix, long skeleton_resolution[3], bool benchmark)
+// read the header (grid size, max_label) of an open downsample or upsample file with its size and
+// modification time in nanoseconds, which identify the file contents the mapping was built from
+static int ReadInputSignature(FILE *fp, const char *filename, long signature[down_to_up_signature_size])
 {
-    // get the downsample filename
-    char downsample_filename[4096];
-    if (benchmark) sprintf(downsample_filename, "benchmarks/skeleton/%s-downsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
-    else sprintf(downsample_filename, "%s/downsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    if (fread(signature, sizeof(long), 4, fp) != 4) { fprintf(stderr, "Failed to read %s\n", filename); return 0; }
 
-    FILE *dfp = fopen(downsample_filename, "rb"); 
-    if (!dfp) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
+    struct stat input_stat;
+    if (fstat(fileno(fp), &input_stat)) { fprintf(stderr, "Failed to read %s\n", filename); return 0; }
+    signature[4] = input_stat.st_size;
+    signature[5] = input_stat.st_mtim.tv_sec;
+    signature[6] = input_stat.st_mtim.tv_nsec;
 
-    // get the upsample filename
-    char upsample_filename[4096];
-    if (benchmark) sprintf(upsample_filename, "benchmarks/skeleton/%s-upsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
-    else sprintf(upsample_filename, "%s/upsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    return 1;
+}
 
-    FILE *ufp = fopen(upsample_filename, "rb");
-    if (!ufp) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
 
-    // read downsample header
-    long down_max_segment;
-    if (fread(&(down_grid_size[IB_Z]), sizeof(long), 1, dfp) != 1) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
-    if (fread(&(down_grid_size[IB_Y]), sizeof(long), 1, dfp) != 1) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
-    if (fread(&(down_grid_size[IB_X]), sizeof(long), 1, dfp) != 1) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
-    if (fread(&down_max_segment, sizeof(long), 1, dfp) != 1) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
-
-    // read upsample header
-    long up_max_segment;
-    if (fread(&(up_grid_size[IB_Z]), sizeof(long), 1, ufp) != 1) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
-    if (fread(&(up_grid_size[IB_Y]), sizeof(long), 1, ufp) != 1) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
-    if (fread(&(up_grid_size[IB_X]), sizeof(long), 1, ufp) != 1) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
-    if (fread(&up_max_segment, sizeof(long), 1, ufp) != 1) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
-
-    down_to_up = new std::map<long, long>[up_max_segment];
-    for (long label = 0; label < up_max_segment; ++label) {
-        down_to_up[label] = std::map<long, long>();
 
+// read the signatures and the (downsampled, upsampled) index pairs of every label from the open downsample and
+// upsample files, the pairs of every label are sorted by the downsampled index for binary search
+static int ReadDown2UpPairs(FILE *dfp, const char *downsample_filename, FILE *ufp, const char *upsample_filename, long down_signature[down_to_up_signature_size], \
+                            long up_signature[down_to_up_signature_size], std::vector<long> &offsets, std::vector<std::pair<long, long> > &pairs)
+{
+    if (!ReadInputSignature(dfp, downsample_filename, down_signature)) return 0;
+    if (!ReadInputSignature(ufp, upsample_filename, up_signature)) return 0;
+
+    long up_max_segment = up_signature[3];
+    offsets.assign(up_max_segment + 1, 0);
+    for (long label = 0; label < up_max_segment; ++label) {
         long down_nelements, up_nelements;
         if (fread(&down_nelements, sizeof(long), 1, dfp) != 1) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
         if (fread(&up_nelements, sizeof(long), 1, ufp) != 1) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
 
-        long *down_elements = new long[down_nelements];
-        long *up_elements = new long[up_nelements];
-        if (fread(down_elements, sizeof(long), down_nelements, dfp) != (unsigned long)down_nelements) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
-        if (fread(up_elements, sizeof(long), up_nelements, ufp) != (unsigned long)up_nelements) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
+        std::vector<long> down_elements(down_nelements);
+        std::vector<long> up_elements(up_nelements);
+        if (down_nelements && fread(&(down_elements[0]), sizeof(long), down_nelements, dfp) != (unsigned long)down_nelements) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
+        if (up_nelements && fread(&(up_elements[0]), sizeof(long), up_nelements, ufp) != (unsigned long)up_nelements) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
 
+        long start = pairs.size();
         for (long ie = 0; ie < down_nelements; ++ie)
-            down_to_up[label][down_elements[ie]] = up_elements[ie];
+            pairs.push_back(std::pair<long, long>(down_elements[ie], up_elements[ie]));
+        std::sort(pairs.begin() + start, pairs.end());
+
+        offsets[label + 1] = pairs.size();
+    }
+
+    return 1;
+}
+
+
+
+// build the sorted down_to_up mapping file from the downsample and upsample files
+// header: upsampled grid size, downsampled grid size, max_label, downsample and upsample signatures
+// body: max_label + 1 offsets, sorted downsampled indices, matching upsampled indices
+static int WriteDown2Up(const char *downsample_filename, const char *upsample_filename, const char *mapping_filename)
+{
+    FILE *dfp = fopen(downsample_filename, "rb"); 
+    if (!dfp) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
+
+    FILE *ufp = fopen(upsample_filename, "rb");
+    if (!ufp) { fprintf(stderr, "Failed to read %s\n", upsample_filename); fclose(dfp); return 0; }
+
+    // read the downsampled and upsampled elements of every label
+    long down_signature[down_to_up_signature_size];
+    long up_signature[down_to_up_signature_size];
+    std::vector<long> offsets;
+    std::vector<std::pair<long, long> > pairs;
+    int read_pairs = ReadDown2UpPairs(dfp, downsample_filename, ufp, upsample_filename, down_signature, up_signature, offsets, pairs);
+
+    fclose(dfp);
+    fclose(ufp);
+    if (!read_pairs) return 0;
+
+    for (int dim = 0; dim < 3; ++dim) {
+        down_grid_size[dim] = down_signature[dim];
+        up_grid_size[dim] = up_signature[dim];
+    }
+    long up_max_segment = up_signature[3];
+
+    std::vector<long> down_indices(pairs.size());
+    std::vector<long> up_indices(pairs.size());
+    for (unsigned long ie = 0; ie < pairs.size(); ++ie) {
+        down_indices[ie] = pairs[ie].first;
+        up_indices[ie] = pairs[ie].second;
     }
 
+    // write to a temporary file first so concurrent processes never map a partial file
+    char temporary_filename[4096];
+    sprintf(temporary_filename, "%s.%ld.tmp", mapping_filename, (long) getpid());
+
+    FILE *wfp = fopen(temporary_filename, "wb");
+    if (!wfp) { fprintf(stderr, "Failed to write to %s\n", temporary_filename); return 0; }
+
+    long header[down_to_up_header_size] = { up_grid_size[IB_Z], up_grid_size[IB_Y], up_grid_size[IB_X], down_grid_size[IB_Z], down_grid_size[IB_Y], down_grid_size[IB_X], up_max_segment };
+    for (long is = 0; is < down_to_up_signature_size; ++is) {
+        header[7 + is] = down_signature[is];
+        header[7 + down_to_up_signature_size + is] = up_signature[is];
+    }
+    long nelements = pairs.size();
+    bool written = (fwrite(header, sizeof(long), down_to_up_header_size, wfp) == (unsigned long) down_to_up_header_size) && \
+                   (fwrite(&(offsets[0]), sizeof(long), up_max_segment + 1, wfp) == (unsigned long)(up_max_segment + 1)) && \
+                   (!nelements || fwrite(&(down_indices[0]), sizeof(long), nelements, wfp) == (unsigned long)nelements) && \
+                   (!nelements || fwrite(&(up_indices[0]), sizeof(long), nelements, wfp) == (unsigned long)nelements);
+    if (fclose(wfp)) written = false;
+
+    // a partial temporary file is never left behind
+    if (!written) { fprintf(stderr, "Failed to write to %s\n", temporary_filename); remove(temporary_filename); return 0; }
+    if (rename(temporary_filename, mapping_filename)) { fprintf(stderr, "Failed to write to %s\n", mapping_filename); remove(temporary_filename); return 0; }
+
+    return 1;
+}
+
+
+
+// memory map the down_to_up mapping, creating it if it is missing or was built from other downsample files
+static int MapDown2Up(const char *prefix, long skeleton_resolution[3], bool benchmark)
+{
+    // get the downsample filename
+    char downsample_filename[4096];
+    if (benchmark) sprintf(downsample_filename, "benchmarks/skeleton/%s-downsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    else sprintf(downsample_filename, "%s/downsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+    // get the upsample filename
+    char upsample_filename[4096];
+    if (benchmark) sprintf(upsample_filename, "benchmarks/skeleton/%s-upsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    else sprintf(upsample_filename, "%s/upsample-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+    // get the mapping filename
+    char mapping_filename[4096];
+    if (benchmark) sprintf(mapping_filename, "benchmarks/skeleton/%s-down-to-up-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    else sprintf(mapping_filename, "%s/down-to-up-%03ldx%03ldx%03ld.bytes", prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+    // the inputs may be rewritten or restored within the same second, so the mapping is rebuilt
+    // unless it recorded exactly these headers, sizes and nanosecond modification times
+    long signatures[2 * down_to_up_signature_size];
+    FILE *dfp = fopen(downsample_filename, "rb");
+    if (!dfp) { fprintf(stderr, "Failed to read %s\n", downsample_filename); return 0; }
+    int read_downsample = ReadInputSignature(dfp, downsample_filename, signatures);
     fclose(dfp);
+    if (!read_downsample) return 0;
+
+    FILE *ufp = fopen(upsample_filename, "rb");
+    if (!ufp) { fprintf(stderr, "Failed to read %s\n", upsample_filename); return 0; }
+    int read_upsample = ReadInputSignature(ufp, upsample_filename, signatures + down_to_up_signature_size);
     fclose(ufp);
+    if (!read_upsample) return 0;
+
+    bool current = false;
+    FILE *mfp = fopen(mapping_filename, "rb");
+    if (mfp) {
+        long header[down_to_up_header_size];
+        if (fread(header, sizeof(long), down_to_up_header_size, mfp) == (unsigned long) down_to_up_header_size)
+            current = !memcmp(header + 7, signatures, 2 * down_to_up_signature_size * sizeof(long));
+        fclose(mfp);
+    }
+    if (!current) {
+        if (!WriteDown2Up(downsample_filename, upsample_filename, mapping_filename)) return 0;
+    }
+
+    struct stat mapping_stat;
+
+    int fd = open(mapping_filename, O_RDONLY);
+    if (fd < 0) { fprintf(stderr, "Failed to read %s\n", mapping_filename); return 0; }
+    if (fstat(fd, &mapping_stat)) { fprintf(stderr, "Failed to read %s\n", mapping_filename); close(fd); return 0; }
+
+    ReleaseDown2Up();
+    down_to_up_mapping_size = mapping_stat.st_size;
+    void *mapping = mmap(NULL, down_to_up_mapping_size, PROT_READ, MAP_SHARED, fd, 0);
+    close(fd);
+    if (mapping == MAP_FAILED) { fprintf(stderr, "Failed to map %s\n", mapping_filename); down_to_up_mapping_size = 0; return 0; }
+    down_to_up_mapping = (long *) mapping;
+
+    // read the header
+    up_grid_size[IB_Z] = down_to_up_mapping[0];
+    up_grid_size[IB_Y] = down_to_up_mapping[1];
+    up_grid_size[IB_X] = down_to_up_mapping[2];
+    down_grid_size[IB_Z] = down_to_up_mapping[3];
+    down_grid_size[IB_Y] = down_to_up_mapping[4];
+    down_grid_size[IB_X] = down_to_up_mapping[5];
+    long max_segment = down_to_up_mapping[6];
+
+    down_to_up_offsets = down_to_up_mapping + down_to_up_header_size;
+    long nelements = down_to_up_offsets[max_segment];
+    down_to_up_down = down_to_up_offsets + max_segment + 1;
+    down_to_up_up = down_to_up_down + nelements;
 
     return 1;
 }
@@ -424,7 +865,7 @@ void CppFindEndpointVectors(const char *prefix, long skeleton_resolution[3], flo
             FindEndpointVector(-1 * down_elements[ie], vx, vy, vz);
 
             // get the corresponding up element for this endpoint
-            long up_element = down_to_up[label][-1 * down_elements[ie]];
+            long up_element = DownToUp(label, -1 * down_elements[ie]);
 
             // save the up element with the vector
             if (fwrite(&up_element, sizeof(long), 1, wfp) != 1) { fprintf(stderr, "Failed to write to %s\n", output_filename); return; }
@@ -441,7 +882,7 @@ void CppFindEndpointVectors(const char *prefix, long skeleton_resolution[3], flo
     fclose(rfp);
     fclose(wfp);
 
-    delete[] down_to_up;
+    ReleaseDown2Up();
 }
 
 void CppFindEdges(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark)
@@ -553,8 +994,8 @@ void CppFindEdges(const char *prefix, long skeleton_resolution[3], float output_
         for (it = edges.begin(); it != edges.end(); ++it)
         {
             std::pair<long, long> edge = *it;
-            up_source_ids[edge_id] = down_to_up[label][edge.first];
-            up_target_ids[edge_id] = down_to_up[label][edge.second];
+            up_source_ids[edge_id] = DownToUp(label, edge.first);
+            up_target_ids[edge_id] = DownToUp(label, edge.second);
             edge_id++;
         }
         
@@ -578,7 +1019,7 @@ void CppFindEdges(const char *prefix, long skeleton_resolution[3], float output_
     fclose(rfp);
     fclose(wfp);
 
-    delete[] down_to_up;
+    ReleaseDown2Up();
 
     if (benchmark) {
         char running_times_filename[4096];
@@ -592,11 +1033,211 @@ void CppFindEdges(const char *prefix, long skeleton_resolution[3], float output_
 
         fclose(running_times_fp);
     }
+    else if (CppRecordRunningTimes()) {
+        char running_times_filename[4096];
+        sprintf(running_times_filename, "%s/running-times/%s-%03ldx%03ldx%03ld-edge-times.bytes", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+        CppWriteRunningTimes(running_times_filename, max_label, running_times);
+    }
+
+    delete[] running_times;
+}
+
+
+
+// find the endpoint vectors and the edges of every skeleton in one pass over the labels
+void CppFindEndpointVectorsAndEdges(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark)
+{
+    // get the mapping from downsampled locations to upsampled ones
+    if (!MapDown2Up(prefix, skeleton_resolution, benchmark)) return;
+
+    // get downsample ratios
+    zdown = ((float) skeleton_resolution[IB_Z]) / output_resolution[IB_Z];
+    ydown = ((float) skeleton_resolution[IB_Y]) / output_resolution[IB_Y];
+    xdown = ((float) skeleton_resolution[IB_X]) / output_resolution[IB_X];
+
+    // set global variables
+    up_nentries = up_grid_size[IB_Z] * up_grid_size[IB_Y] * up_grid_size[IB_X];
+    up_sheet_size = up_grid_size[IB_Y] * up_grid_size[IB_X];
+    up_row_size = up_grid_size[IB_X];
+
+    down_nentries = down_grid_size[IB_Z] * down_grid_size[IB_Y] * down_grid_size[IB_X];
+    down_sheet_size = down_grid_size[IB_Y] * down_grid_size[IB_X];
+    down_row_size = down_grid_size[IB_X];
+
+    // I/O filenames
+    char input_filename[4096];
+    if (benchmark) sprintf(input_filename, "benchmarks/skeleton/%s-%s-%03ldx%03ldx%03ld-downsample-skeleton.pts", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    else sprintf(input_filename, "%s/%s-%03ldx%03ldx%03ld-downsample-skeleton.pts", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+    char vectors_filename[4096];
+    if (benchmark) sprintf(vectors_filename, "benchmarks/skeleton/%s-%s-%03ldx%03ldx%03ld-endpoint-vectors.vec", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    else sprintf(vectors_filename, "%s/%s-%03ldx%03ldx%03ld-endpoint-vectors.vec", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+    char edges_filename[4096];
+    if (benchmark) sprintf(edges_filename, "benchmarks/skeleton/%s-%s-%03ldx%03ldx%03ld-upsample-skeleton.edges", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+    else sprintf(edges_filename, "%s/%s-%03ldx%03ldx%03ld-upsample-skeleton.edges", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+    // open files for read/write
+    FILE *rfp = fopen(input_filename, "rb");
+    if (!rfp) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+
+    FILE *vfp = fopen(vectors_filename, "wb");
+    if (!vfp) { fprintf(stderr, "Failed to write %s\n", vectors_filename); return; }
+
+    FILE *efp = fopen(edges_filename, "wb");
+    if (!efp) { fprintf(stderr, "Failed to write %s\n", edges_filename); return; }
+
+    // read header
+    long max_label;
+    long input_grid_size[3];
+    if (fread(&(input_grid_size[IB_Z]), sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+    if (fread(&(input_grid_size[IB_Y]), sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+    if (fread(&(input_grid_size[IB_X]), sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+    if (fread(&max_label, sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+
+    // write the headers
+    FILE *output_fps[2] = { vfp, efp };
+    const char *output_filenames[2] = { vectors_filename, edges_filename };
+    for (int io = 0; io < 2; ++io) {
+        if (fwrite(&(up_grid_size[IB_Z]), sizeof(long), 1, output_fps[io]) != 1) { fprintf(stderr, "Failed to write %s\n", output_filenames[io]); return; }
+        if (fwrite(&(up_grid_size[IB_Y]), sizeof(long), 1, output_fps[io]) != 1) { fprintf(stderr, "Failed to write %s\n", output_filenames[io]); return; }
+        if (fwrite(&(up_grid_size[IB_X]), sizeof(long), 1, output_fps[io]) != 1) { fprintf(stderr, "Failed to write %s\n", output_filenames[io]); return; }
+        if (fwrite(&max_label, sizeof(long), 1, output_fps[io]) != 1) { fprintf(stderr, "Failed to write %s\n", output_filenames[io]); return; }
+    }
+
+    double *running_times = new double[max_label];
+
+    // the skeleton is allocated once and only the elements of the current label are set and cleared
+    skeleton = new unsigned char[down_nentries];
+    for (long iv = 0; iv < down_nentries; ++iv) skeleton[iv] = 0;
+
+    std::vector<long> down_elements;
+    std::vector<std::pair<long, long> > edges;
+    std::vector<long> up_source_ids;
+    std::vector<long> up_target_ids;
+    for (long label = 0; label < max_label; ++label) {
+        clock_t t1, t2;
+        t1 = clock();
+
+        long nelements;
+        if (fread(&nelements, sizeof(long), 1, rfp) != 1) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+
+        // read in points of this skeleton
+        down_elements.resize(nelements);
+        if (nelements && fread(&(down_elements[0]), sizeof(long), nelements, rfp) != (unsigned long)nelements) { fprintf(stderr, "Failed to read %s\n", input_filename); return; }
+
+        long nendpoints = 0;
+        for (long ie = 0; ie < nelements; ++ie) {
+            if (down_elements[ie] < 0) {
+                skeleton[-1 * down_elements[ie]] = 1;
+                nendpoints++;
+            }
+            else skeleton[down_elements[ie]] = 1;
+        }
+
+        // write the endpoints with their vectors
+        if (fwrite(&nendpoints, sizeof(long), 1, vfp) != 1) { fprintf(stderr, "Failed to write to %s\n", vectors_filename); return; }
+        for (long ie = 0; ie < nelements; ++ie) {
+            if (down_elements[ie] >= 0) continue;
+
+            double vx, vy, vz;
+            FindEndpointVector(-1 * down_elements[ie], vx, vy, vz);
+
+            // get the corresponding up element for this endpoint
+            long up_element = DownToUp(label, -1 * down_elements[ie]);
+
+            // save the up element with the vector
+            if (fwrite(&up_element, sizeof(long), 1, vfp) != 1) { fprintf(stderr, "Failed to write to %s\n", vectors_filename); return; }
+            if (fwrite(&vz, sizeof(double), 1, vfp) != 1) { fprintf(stderr, "Failed to write to %s\n", vectors_filename); return; }
+            if (fwrite(&vy, sizeof(double), 1, vfp) != 1) { fprintf(stderr, "Failed to write to %s\n", vectors_filename); return; }
+            if (fwrite(&vx, sizeof(double), 1, vfp) != 1) { fprintf(stderr, "Failed to write to %s\n", vectors_filename); return; }
+        }
+
+        // find all 26-neighbors with greater index that are present in skeleton
+        edges.clear();
+        for (long ie = 0; ie < nelements; ++ie) {
+            long source_index = down_elements[ie];
+            // if endpoint, recast into positive coordinates
+            if (source_index < 0) source_index = -1 * source_index;
+
+            long ix, iy, iz;
+            IndexToIndices(source_index, ix, iy, iz);
+            for (long iw = iz - 1; iw <= iz + 1; ++iw) {
+                if (iw < 0 or iw >= down_grid_size[IB_Z]) continue;
+                for (long iv = iy - 1; iv <= iy + 1; ++iv) {
+                    if (iv < 0 or iv >= down_grid_size[IB_Y]) continue;
+                    for (long iu = ix - 1; iu <= ix + 1; ++iu) {
+                        if (iu < 0 or iu >= down_grid_size[IB_X]) continue;
+
+                        long target_index = iw * down_grid_size[IB_Y] * down_grid_size[IB_X] + iv * down_grid_size[IB_X] + iu;
+                        if (target_index <= source_index) continue;
+                        if (!skeleton[target_index]) continue;
+                        edges.push_back(std::pair<long, long>(source_index, target_index));
+                    }
+                }
+            }
+        }
+
+        // keep the edges in the same order as CppFindEdges
+        std::sort(edges.begin(), edges.end());
+
+        long nedges = edges.size();
+        up_source_ids.resize(nedges);
+        up_target_ids.resize(nedges);
+        for (long edge_id = 0; edge_id < nedges; ++edge_id) {
+            up_source_ids[edge_id] = DownToUp(label, edges[edge_id].first);
+            up_target_ids[edge_id] = DownToUp(label, edges[edge_id].second);
+        }
+
+        // write all edges as upsampled source and target vertices (endpoints are kept positive)
+        if (fwrite(&nedges, sizeof(long), 1, efp) != 1) { fprintf(stderr, "Failed to write %s\n", edges_filename); return; }
+        if (nedges && fwrite(&(up_source_ids[0]), sizeof(long), nedges, efp) != (unsigned long)nedges) { fprintf(stderr, "Failed to write %s\n", edges_filename); return; }
+        if (nedges && fwrite(&(up_target_ids[0]), sizeof(long), nedges, efp) != (unsigned long)nedges) { fprintf(stderr, "Failed to write %s\n", edges_filename); return; }
+
+        // clear this skeleton
+        for (long ie = 0; ie < nelements; ++ie) {
+            if (down_elements[ie] < 0) skeleton[-1 * down_elements[ie]] = 0;
+            else skeleton[down_elements[ie]] = 0;
+        }
+
+        t2 = clock();
+        running_times[label] = (double)(t2 - t1) / CLOCKS_PER_SEC;
+    }
+
+    // close the files
+    fclose(rfp);
+    fclose(vfp);
+    fclose(efp);
+
+    delete[] skeleton;
+    ReleaseDown2Up();
+
+    // the running times of the fused stage replace the edge times
+    if (benchmark) {
+        char running_times_filename[4096];
+        sprintf(running_times_filename, "benchmarks/skeleton/%s-%s-%03ldx%03ldx%03ld-edge-times.bytes", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+        FILE *running_times_fp = fopen(running_times_filename, "wb");
+        if (!running_times_fp) exit(-1);
+
+        if (fwrite(&max_label, sizeof(long), 1, running_times_fp) != 1) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); }
+        if (fwrite(running_times, sizeof(double), max_label, running_times_fp) != (unsigned long) max_label) { fprintf(stderr, "Failed to write to %s\n", running_times_filename); }
+
+        fclose(running_times_fp);
+    }
+    else if (CppRecordRunningTimes()) {
+        char running_times_filename[4096];
+        sprintf(running_times_filename, "%s/running-times/%s-%03ldx%03ldx%03ld-edge-times.bytes", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]);
+
+        CppWriteRunningTimes(running_times_filename, max_label, running_times);
+    }
 
     delete[] running_times;
 }
 
 
+
 // operation that takes downsampled skeletons and generates upsampled versions
 void CppApplyUpsampleOperation(const char *prefix, const char *params, long *input_segmentation, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, double astar_expansion, bool benchmark)
 {
@@ -682,10 +1323,10 @@ void CppApplyUpsampleOperation(const char *prefix, const char *params, long *inp
 
                 if (down_index < 0) {
                     down_index = -1 * down_index;
-                    up_elements[ie] = -1 * down_to_up[label][down_index];
+                    up_elements[ie] = -1 * DownToUp(label, down_index);
                 }
                 else {
-                    up_elements[ie] = down_to_up[label][down_index];
+                    up_elements[ie] = DownToUp(label, down_index);
                 }
             }
             
@@ -738,7 +1379,7 @@ void CppApplyUpsampleOperation(const char *prefix, const char *params, long *inp
                 long down_index = down_elements[ie];
 
                 // see if this skeleton location is actually an endpoint
-                up_elements[ie] = down_to_up[label][down_index];
+                up_elements[ie] = DownToUp(label, down_index);
                 if (IsEndpoint(down_index, label)) up_elements[ie] = -1 * up_elements[ie];
             }
 
@@ -758,7 +1399,11 @@ void CppApplyUpsampleOperation(const char *prefix, const char *params, long *inp
     }
 
     // free memory
-    delete[] down_to_up;
+    ReleaseDown2Up();
+    ReleaseScores(forward_scores);
+    ReleaseScores(backward_scores);
+    std::vector<AStarNode>().swap(forward_queue);
+    std::vector<AStarNode>().swap(backward_queue);
 
     // close the files
     fclose(rfp);
@@ -776,6 +1421,12 @@ void CppApplyUpsampleOperation(const char *prefix, const char *params, long *inp
 
         fclose(running_times_fp);
     }
+    else if (CppRecordRunningTimes()) {
+        char running_times_filename[4096];
+        sprintf(running_times_filename, "%s/running-times/%s-%03ldx%03ldx%03ld-upsample-%s.bytes", prefix, skeleton_algorithm, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z], output_params);
+
+        CppWriteRunningTimes(running_times_filename, max_label, running_times);
+    }
 
     delete[] running_times;
 }
@@ -3,6 +3,8 @@ import time
 import os
 import struct
 import inspect
+import itertools
+import multiprocessing
 
 
 cimport cython
@@ -10,11 +12,10 @@ cimport numpy as np
 from libcpp cimport bool
 import ctypes
 import numpy as np
-import skimage.morphology
 
 from ibex.utilities import dataIO
 from ibex.utilities.constants import *
-from medial_axis_util import PostProcess
+from medial_axis_util import ReadDownsampleElements, SkeletonizeLabelStar
 
 
 cdef extern from 'cpp-generate_skeletons.h':
@@ -23,15 +24,38 @@ cdef extern from 'cpp-generate_skeletons.h':
     void CppFindEndpointVectors(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark)
     void CppApplyUpsampleOperation(const char *prefix, const char *params, long *input_segmentation, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, double astar_exspanion, bool benchmark)
     void CppFindEdges(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark)
+    void CppFindEndpointVectorsAndEdges(const char *prefix, long skeleton_resolution[3], float output_resolution[3], const char *skeleton_algorithm, bool benchmark)
+    void CppAStarSetBidirectional(bool input_bidirectional)
+    void CppTeaserSetCropping(bool input_crop_labels)
+    void CppTeaserSetThreads(long input_nthreads)
+    void CppTeaserSetVoxelSize(double input_voxel_size[3])
+    void CppSetRecordRunningTimes(bool input_record_running_times)
+
+
+
+# write per label running times to {prefix}/running-times outside of benchmarking
+record_running_times = False
+
+def RecordRunningTimes(record=True):
+    global record_running_times
+
+    record_running_times = record
+    CppSetRecordRunningTimes(record)
+
+
+
+def CreateRunningTimesDirectory(prefix, benchmark):
+    if record_running_times and not benchmark and not os.path.isdir('{}/running-times'.format(prefix)): os.makedirs('{}/running-times'.format(prefix))
 
 
 # generate skeletons for this volume
-def TopologicalThinning(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchmark=False, astar_expansion=0):
+def TopologicalThinning(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchmark=False, astar_expansion=0, astar_bidirectional=False):
     # everything needs to be long ints to work with c++
     assert (input_segmentation.dtype == np.int64)
 
     if benchmark and not os.path.isdir('benchmarks/skeleton'): os.mkdir('benchmarks/skeleton')
     elif not benchmark and not os.path.isdir('{}'.format(prefix)): os.mkdir('{}'.format(prefix))
+    CreateRunningTimesDirectory(prefix, benchmark)
 
     start_time = time.time()
     
@@ -47,6 +71,7 @@ def TopologicalThinning(prefix, input_segmentation, skeleton_resolution=(80, 80,
     cdef np.ndarray[float, ndim=1, mode='c'] cpp_output_resolution = np.ascontiguousarray(dataIO.Resolution(prefix), dtype=ctypes.c_float)
     params = ""
 
+    CppAStarSetBidirectional(astar_bidirectional)
     CppApplyUpsampleOperation(prefix, params, &(cpp_input_segmentation[0,0,0]), &(cpp_skeleton_resolution[0]), &(cpp_output_resolution[0]), 'thinning', astar_expansion, benchmark)
         
     print 'Topological thinning time for {}: {}'.format((skeleton_resolution[0], skeleton_resolution[1], skeleton_resolution[2]), time.time() - start_time)
@@ -54,12 +79,13 @@ def TopologicalThinning(prefix, input_segmentation, skeleton_resolution=(80, 80,
 
 
 # use scipy skeletonization for thinning
-def MedialAxis(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchmark=False, astar_expansion=0):
+def MedialAxis(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchmark=False, astar_expansion=0, astar_bidirectional=False, medial_axis_processes=1):
     # everything needs to be long ints to work with c++
     assert (input_segmentation.dtype == np.int64)
 
     if benchmark and not os.path.isdir('benchmarks/skeleton'): os.mkdir('benchmarks/skeleton')
     elif not benchmark and not os.path.isdir('skeletons/{}'.format(prefix)): os.mkdir('skeletons/{}'.format(prefix))
+    CreateRunningTimesDirectory(prefix, benchmark)
 
     start_time = time.time()
 
@@ -70,39 +96,33 @@ def MedialAxis(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), ben
     if benchmark: output_filename = 'benchmarks/skeleton/{}-medial-axis-{:03d}x{:03d}x{:03d}-downsample-skeleton.pts'.format(prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z])
     else: output_filename = 'skeletons/{}/medial-axis-{:03d}x{:03d}x{:03d}-downsample-skeleton.pts'.format(prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z]) 
 
-    with open(input_filename, 'rb') as rfd, open(output_filename, 'wb') as wfd:
-        zres, yres, xres, max_label = struct.unpack('qqqq', rfd.read(32))
-
-        running_times = []
-
-        wfd.write(struct.pack('q', zres))
-        wfd.write(struct.pack('q', yres))
-        wfd.write(struct.pack('q', xres))
-        wfd.write(struct.pack('q', max_label))
+    grid_size, elements = ReadDownsampleElements(input_filename)
+    max_label = len(elements)
+    zres, yres, xres = grid_size
 
-        # go through all labels
-        for label in range(max_label):
-            label_time = time.time()
-            segmentation = np.zeros((zres, yres, xres), dtype=np.bool)
-
-            # find topological downsampled locations
-            nelements, = struct.unpack('q', rfd.read(8))
-            for _ in range(nelements):
-                iv, = struct.unpack('q', rfd.read(8))
+    # skeletonize every label on its bounding box, in parallel if requested
+    jobs = [(elements[label], grid_size) for label in range(max_label)]
+    if medial_axis_processes > 1:
+        pool = multiprocessing.Pool(medial_axis_processes)
+        results = pool.imap(SkeletonizeLabelStar, jobs, chunksize=max(1, max_label / (4 * medial_axis_processes)))
+    else:
+        pool = None
+        results = itertools.imap(SkeletonizeLabelStar, jobs)
 
-                iz = iv / (xres * yres)
-                iy = (iv - iz * xres * yres) / xres
-                ix = iv % xres
+    running_times = []
 
-                segmentation[iz,iy,ix] = 1
+    with open(output_filename, 'wb') as wfd:
+        wfd.write(struct.pack('qqqq', zres, yres, xres, max_label))
 
-            skeleton = PostProcess(skimage.morphology.skeletonize_3d(segmentation))
+        # results arrive in label order
+        for skeleton, running_time in results:
+            wfd.write(struct.pack('q', skeleton.size))
+            wfd.write(skeleton.tobytes())
+            running_times.append(running_time)
 
-            nelements = len(skeleton)
-            wfd.write(struct.pack('q', nelements))
-            for element in skeleton:
-                wfd.write(struct.pack('q', element))
-            running_times.append(time.time() - label_time)
+    if pool is not None:
+        pool.close()
+        pool.join()
 
     if benchmark:
        running_times_filename = 'benchmarks/skeleton/running-times/skeleton-times/{}-medial-axis-{:03d}x{:03d}x{:03d}.bytes'.format(prefix, skeleton_resolution[0], skeleton_resolution[1], skeleton_resolution[2])
@@ -110,6 +130,11 @@ def MedialAxis(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), ben
         fd.write(struct.pack('q', max_label))
         for label in range(max_label):
             fd.write(struct.pack('d', running_times[label]))
+    elif record_running_times:
+        running_times_filename = '{}/running-times/medial-axis-{:03d}x{:03d}x{:03d}.bytes'.format(prefix, skeleton_resolution[IB_X], skeleton_resolution[IB_Y], skeleton_resolution[IB_Z])
+        with open(running_times_filename, 'wb') as fd:
+            fd.write(struct.pack('q', max_label))
+            fd.write(np.array(running_times, dtype=np.float64).tobytes())
 
     # call the upsampling operation
     cdef np.ndarray[long, ndim=1, mode='c'] cpp_skeleton_resolution = np.ascontiguousarray(skeleton_resolution, dtype=ctypes.c_int64)
@@ -117,6 +142,7 @@ def MedialAxis(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), ben
     cdef np.ndarray[float, ndim=1, mode='c'] cpp_output_resolution = np.ascontiguousarray(dataIO.Resolution(prefix), dtype=ctypes.c_float)
     params = ""
 
+    CppAStarSetBidirectional(astar_bidirectional)
     CppApplyUpsampleOperation(prefix, params, &(cpp_input_segmentation[0,0,0]), &(cpp_skeleton_resolution[0]), &(cpp_output_resolution[0]), 'medial-axis', astar_expansion, benchmark)
 
     print 'Medial axis thinning time for {}: {}'.format((skeleton_resolution[0], skeleton_resolution[1], skeleton_resolution[2]), time.time() - start_time)
@@ -124,19 +150,26 @@ def MedialAxis(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), ben
 
 
 # use TEASER algorithm to generate skeletons
-def TEASER(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchmark=False, teaser_scale=1.3, teaser_buffer=2, astar_expansion=0):
+def TEASER(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchmark=False, teaser_scale=1.3, teaser_buffer=2, astar_expansion=0, astar_bidirectional=False, teaser_crop=True, teaser_threads=1, teaser_anisotropic=False):
     # everything needs to be long ints to work with c++
     assert (input_segmentation.dtype == np.int64)
 
     if benchmark and not os.path.isdir('benchmarks/skeleton'): os.mkdir('benchmarks/skeleton')
     elif not benchmark and not os.path.isdir('skeletons/{}'.format(prefix)): os.mkdir('skeletons/{}'.format(prefix))
+    CreateRunningTimesDirectory(prefix, benchmark)
 
     start_time = time.time()
 
     # convert to numpy array for c++ call
     cdef np.ndarray[long, ndim=1, mode='c'] cpp_skeleton_resolution = np.ascontiguousarray(skeleton_resolution, dtype=ctypes.c_int64)
-
-    # call the teaser skeletonization algorithm
+    # distances are measured in units of the smallest voxel size (or in voxels unless teaser_anisotropic)
+    voxel_size = np.array(skeleton_resolution, dtype=np.float64) / min(skeleton_resolution) if teaser_anisotropic else np.ones(3)
+    cdef np.ndarray[double, ndim=1, mode='c'] cpp_voxel_size = np.ascontiguousarray(voxel_size, dtype=ctypes.c_double)
+
+    # call the teaser skeletonization algorithm (on padded label bounding boxes if teaser_crop)
+    CppTeaserSetCropping(teaser_crop)
+    CppTeaserSetThreads(teaser_threads)
+    CppTeaserSetVoxelSize(&(cpp_voxel_size[0]))
     CppTeaserSkeletonization(prefix, &(cpp_skeleton_resolution[0]), benchmark, teaser_scale, teaser_buffer)
 
     # call the upsampling operation
@@ -145,6 +178,7 @@ def TEASER(prefix, input_segmentation, skeleton_resolution=(80, 80, 80), benchma
     #params = "{:02d}-{:02d}".format(long(10 * teaser_scale), teaser_buffer)
     params = ""
 
+    CppAStarSetBidirectional(astar_bidirectional)
     CppApplyUpsampleOperation(prefix, params, &(cpp_input_segmentation[0,0,0]), &(cpp_skeleton_resolution[0]), &(cpp_output_resolution[0]), 'teaser', astar_expansion, benchmark)
 
     print 'TEASER skeletonization time for {}: {}'.format((skeleton_resolution[0], skeleton_resolution[1], skeleton_resolution[2]), time.time() - start_time)
@@ -169,6 +203,8 @@ def FindEndpointVectors(prefix, skeleton_resolution=(80, 80, 80), skeleton_algor
 
 # find edges for skeleton (only works for A*=0), tested only for 'thinning' algorithm
 def FindEdges(prefix, skeleton_resolution=(80, 80, 80), skeleton_algorithm='thinning', benchmark=False):
+    CreateRunningTimesDirectory(prefix, benchmark)
+
     start_time = time.time()
 
     # convert to numpy array for c++ call
@@ -178,3 +214,19 @@ def FindEdges(prefix, skeleton_resolution=(80, 80, 80), skeleton_algorithm='thin
     CppFindEdges(prefix, &(cpp_skeleton_resolution[0]), &(cpp_output_resolution[0]), skeleton_algorithm, benchmark)
 
     print 'Edge finding time for {}: {}'.format((skeleton_resolution[0], skeleton_resolution[1], skeleton_resolution[2]), time.time() - start_time)
+
+
+
+# find endpoint vectors and edges for skeleton in a single pass (same outputs as FindEndpointVectors and FindEdges)
+def FindEndpointVectorsAndEdges(prefix, skeleton_resolution=(80, 80, 80), skeleton_algorithm='thinning', benchmark=False):
+    CreateRunningTimesDirectory(prefix, benchmark)
+
+    start_time = time.time()
+
+    # convert to numpy array for c++ call
+    cdef np.ndarray[long, ndim=1, mode='c'] cpp_skeleton_resolution = np.ascontiguousarray(skeleton_resolution, dtype=ctypes.c_int64)
+    cdef np.ndarray[float, ndim=1, mode='c'] cpp_output_resolution = np.ascontiguousarray(dataIO.Resolution(prefix), dtype=ctypes.c_float)
+
+    CppFindEndpointVectorsAndEdges(prefix, &(cpp_skeleton_resolution[0]), &(cpp_output_resolution[0]), skeleton_algorithm, benchmark)
+
+    print 'Endpoint vector and edge finding time for {}: {}'.format((skeleton_resolution[0], skeleton_resolution[1], skeleton_resolution[2]), time.time() - start_time)
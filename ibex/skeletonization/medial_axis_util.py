@@ -1,36 +1,86 @@
-from numba import jit
+import time
+
+import numpy as np
+
+
+
+# classify the sorted linear indices of a skeleton on a grid and return them in the .pts
+# encoding, where negative values indicate endpoints (at most one skeleton neighbor)
+def ClassifySkeletonIndices(indices, grid_size):
+    zres, yres, xres = grid_size
+    indices = np.unique(np.asarray(indices, dtype=np.int64))
+    if not indices.size: return indices
+
+    iz, iy, ix = np.unravel_index(indices, grid_size)
+
+    # count the skeleton voxels in the 3x3x3 neighborhood (including the voxel itself)
+    nneighbors = np.zeros(indices.size, dtype=np.int64)
+    for dz in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                valid = (iz + dz >= 0) & (iz + dz < zres) & (iy + dy >= 0) & (iy + dy < yres) & (ix + dx >= 0) & (ix + dx < xres)
+                neighbors = indices[valid] + (dz * yres * xres + dy * xres + dx)
+
+                # look up the neighbors in the sorted skeleton indices
+                positions = np.minimum(np.searchsorted(indices, neighbors), indices.size - 1)
+                nneighbors[valid] += (indices[positions] == neighbors)
+
+    joints = indices.copy()
+    joints[nneighbors <= 2] *= -1
+
+    return joints
 
 
 
 # function takes the skeleton from the medial axis algorithm and returns
-# a list of joints with negative values indicating endpoints
-@jit(nopython=True)
+# an array of joints with negative values indicating endpoints
 def PostProcess(skeleton):
-    zres, yres, xres = skeleton.shape
+    return ClassifySkeletonIndices(np.flatnonzero(skeleton), skeleton.shape)
 
-    # keep track of all the endpoints
-    joints = []
 
-    for iz in range(zres):
-        for iy in range(yres):
-            for ix in range(xres):
-                if not skeleton[iz,iy,ix]: continue
 
-                linear_index = iz * yres * xres + iy * xres + ix
+# read the downsampled elements of every label from a downsample file
+def ReadDownsampleElements(input_filename):
+    data = np.fromfile(input_filename, dtype=np.int64)
+    zres, yres, xres, max_label = data[:4]
 
-                # find out how many element in the local neighborhood are skeleton
-                nneighbors = 0
-                for iw in range(iz - 1, iz + 2):
-                    if iw < 0 or iw > zres - 1: continue
-                    for iv in range(iy - 1, iy + 2):
-                        if iv < 0 or iv > yres - 1: continue
-                        for iu in range(ix - 1, ix + 2):
-                            if iu < 0 or iu > xres - 1: continue
+    elements = []
+    offset = 4
+    for label in range(max_label):
+        nelements = data[offset]
+        elements.append(data[offset + 1:offset + 1 + nelements])
+        offset += 1 + nelements
 
-                            if skeleton[iw,iv,iu]: nneighbors += 1
+    return (zres, yres, xres), elements
 
-                if nneighbors <= 2: joints.append(-1 * linear_index)
-                else: joints.append(linear_index)
-    
-    # return the list of all the endpoint
-    return joints
+
+
+# skeletonize the elements of one label on its bounding box with one voxel of padding
+# and return the skeleton in the .pts encoding with the running time
+def SkeletonizeLabel(elements, grid_size):
+    start_time = time.time()
+
+    if not elements.size: return np.zeros(0, dtype=np.int64), time.time() - start_time
+
+    iz, iy, ix = np.unravel_index(elements, grid_size)
+    zmin, ymin, xmin = iz.min(), iy.min(), ix.min()
+    crop_size = (iz.max() - zmin + 3, iy.max() - ymin + 3, ix.max() - xmin + 3)
+
+    segmentation = np.zeros(crop_size, dtype=np.bool)
+    segmentation[iz - zmin + 1, iy - ymin + 1, ix - xmin + 1] = 1
+
+    # skimage loads its io plugins (and matplotlib), so it is only imported by the medial axis workers
+    import skimage.morphology
+    joints = PostProcess(skimage.morphology.skeletonize_3d(segmentation))
+
+    # convert the cropped indices back to the entire grid, keeping the endpoint sign
+    jz, jy, jx = np.unravel_index(np.abs(joints), crop_size)
+    skeleton = np.ravel_multi_index((jz + zmin - 1, jy + ymin - 1, jx + xmin - 1), grid_size).astype(np.int64)
+    skeleton[joints < 0] *= -1
+
+    return skeleton, time.time() - start_time
+
+
+
+def SkeletonizeLabelStar(args):
+    return SkeletonizeLabel(*args)
@@ -5,9 +5,10 @@ import numpy as np
 extensions = [
     Extension(
         name='generate_skeletons',
-        include_dirs=[np.get_include()],
-        sources=['generate_skeletons.pyx', 'cpp-teaser.cpp', 'cpp-thinning.cpp', 'cpp-upsample.cpp', 'cpp-MinBinaryHeap.cpp'],
-        extra_compile_args=['-O4', '-std=c++0x'],
+        include_dirs=[np.get_include(), '../transforms'],
+        sources=['generate_skeletons.pyx', 'cpp-teaser.cpp', 'cpp-thinning.cpp', 'cpp-upsample.cpp', 'cpp-MinBinaryHeap.cpp', '../transforms/cpp-edt.cpp'],
+        extra_compile_args=['-O4', '-std=c++0x', '-pthread'],
+        extra_link_args=['-pthread'],
         language='c++'
     )
 ]
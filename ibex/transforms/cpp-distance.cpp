@@ -3,6 +3,7 @@
 #include <stdio.h>
 #include <vector>
 #include <stdlib.h>
+#include "cpp-edt.h"
 
 // constant variables
 
@@ -39,10 +40,8 @@ float *CppTwoDimensionalDistanceTransform(long *data, long grid_size[3])
 
     infinity = grid_size[IB_Z] * grid_size[IB_Z] + grid_size[IB_Y] * grid_size[IB_Y] + grid_size[IB_X] * grid_size[IB_X];
 
-    float *DBF = new float[nentries];
-
     // allocate memory for bounday map and distance transform
-    float *b = new float[nentries];
+    double *b = new double[nentries];
     for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
         for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
             for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
@@ -61,108 +60,18 @@ float *CppTwoDimensionalDistanceTransform(long *data, long grid_size[3])
         }
     }
 
-    // go along the y dimension second for every (z, x) coordinate
-    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-        for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-
-            long k = 0;
-            long *v = new long[grid_size[IB_Y] + 1];
-            float *z = new float[grid_size[IB_Y] + 1];
-
-            v[0] = 0;
-            z[0] = -1 * infinity;
-            z[1] = infinity;
-
-            for (long q = 1; q < grid_size[IB_Y]; ++q) {
-                // label for jump statement
-                ylabel:
-                float s = ((b[IndicesToIndex(ix, q, iz)] + q * q) - (b[IndicesToIndex(ix, v[k], iz)] + v[k] * v[k])) / (float)(2 * q - 2 * v[k]);
-
-                if (s <= z[k]) {
-                    --k;
-                    goto ylabel;
-                }
-                else {
-                    ++k; 
-                    v[k] = q;
-                    z[k] = s;
-                    z[k + 1] = infinity;
-                }
-            }
-
-            k = 0;
-            for (long q = 0; q < grid_size[IB_Y]; ++q) {
-                while (z[k + 1] < q)
-                    ++k;
-                DBF[IndicesToIndex(ix, q, iz)] = (q - v[k]) * (q - v[k]) + b[IndicesToIndex(ix, v[k], iz)];
-            }
-
-            // free memory
-            delete[] v;
-            delete[] z;
-        }
-    }
-
-    // update the boundary values with this distance
-    for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-        for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
-            for (long ix = 0; ix < grid_size[IB_X]; ++ix) {
-                b[IndicesToIndex(ix, iy, iz)] = DBF[IndicesToIndex(ix, iy, iz)];
-            }
-        }
-    }
-
-
-    // go along the x dimension last for every (y, z) coordinate
-    for (long iy = 0; iy < grid_size[IB_Y]; ++iy) {
-        for (long iz = 0; iz < grid_size[IB_Z]; ++iz) {
-
-            long k = 0;
-            long *v = new long[grid_size[IB_X] + 1];
-            float *z = new float[grid_size[IB_X] + 1];
-
-            v[0] = 0;
-            z[0] = -1 * infinity;
-            z[1] = infinity;
-
-            for (long q = 1; q < grid_size[IB_X]; ++q) {
-                // label for jump statement
-                xlabel:
-                float s = ((b[IndicesToIndex(q, iy, iz)] + q * q) - (b[IndicesToIndex(v[k], iy, iz)] +  v[k] * v[k])) / (float)(2 * q - 2 * v[k]);
-
-                if (s <= z[k]) {
-                    --k;
-                    goto xlabel;
-                }
-                else {
-                    ++k;
-                    v[k] = q;
-                    z[k] = s;
-                    z[k + 1] = infinity;
-                }
-            }
-
-            k = 0;
-            for (long q = 0;  q < grid_size[IB_X]; ++q) {
-                while (z[k + 1] < q)
-                    ++k;
-
-                DBF[IndicesToIndex(q, iy, iz)] = (q - v[k]) * (q - v[k]) + b[IndicesToIndex(v[k], iy, iz)];
-            }
+    // go along the y and x dimensions of every slice with the shared transform (the z resolution of 0 skips z)
+    double resolution[3] = { 0, 1, 1 };
+    CppSquaredDistanceField(b, grid_size, resolution, 1, NULL);
 
-            // free memory
-            delete[] v;
-            delete[] z;
-        }
-    }
+    // update the distances to be euclidean instead of euclidean squared
+    float *DBF = new float[nentries];
+    for (long iv = 0; iv < nentries; ++iv)
+        DBF[iv] = sqrt(b[iv]);
 
     // free memory
     delete[] b;
 
-    // update the distances to be euclidean instead of euclidean squared
-    for (long iv = 0; iv < nentries; ++iv)
-        DBF[iv] = sqrt(DBF[iv]);
-
     return DBF;
 }
 
@@ -0,0 +1,249 @@
+/* c++ file for the shared anisotropic euclidean distance transform */
+
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <atomic>
+#include <thread>
+#include <vector>
+#include "cpp-edt.h"
+
+// constant variables
+
+static const int IB_Z = 0;
+static const int IB_Y = 1;
+static const int IB_X = 2;
+
+
+
+// scratch buffers
+
+void CppEDTInitializeBuffers(EDTBuffers &buffers)
+{
+    memset(&buffers, 0, sizeof(EDTBuffers));
+}
+
+
+
+// rows of length up to length fit in the buffers, which only grow when needed
+void CppEDTReserveBuffers(EDTBuffers &buffers, long length)
+{
+    if (length + 1 <= buffers.capacity) return;
+
+    CppEDTReleaseBuffers(buffers);
+    buffers.capacity = length + 1;
+    buffers.v = new long[buffers.capacity];
+    buffers.z = new double[buffers.capacity];
+    buffers.f = new double[buffers.capacity];
+}
+
+
+
+void CppEDTReleaseBuffers(EDTBuffers &buffers)
+{
+    delete[] buffers.v;
+    delete[] buffers.z;
+    delete[] buffers.f;
+
+    CppEDTInitializeBuffers(buffers);
+}
+
+
+
+// one dimensional transforms
+
+// lower envelope of the parabolas (Felzenszwalb and Huttenlocher) along one row with voxel spacing w
+static void DistanceRow(double *field, long start, long stride, long length, double w, EDTBuffers &buffers)
+{
+    long *v = buffers.v;
+    double *z = buffers.z;
+    double *f = buffers.f;
+
+    for (long q = 0; q < length; ++q)
+        f[q] = field[start + q * stride];
+
+    long k = 0;
+    v[0] = 0;
+    z[0] = -HUGE_VAL;
+    z[1] = HUGE_VAL;
+
+    for (long q = 1; q < length; ++q) {
+        double s = ((f[q] + (q * w) * (q * w)) - (f[v[k]] + (v[k] * w) * (v[k] * w))) / (2 * w * (q - v[k]));
+        while (s <= z[k]) {
+            --k;
+            s = ((f[q] + (q * w) * (q * w)) - (f[v[k]] + (v[k] * w) * (v[k] * w))) / (2 * w * (q - v[k]));
+        }
+
+        ++k;
+        v[k] = q;
+        z[k] = s;
+        z[k + 1] = HUGE_VAL;
+    }
+
+    k = 0;
+    for (long q = 0; q < length; ++q) {
+        while (z[k + 1] < q * w)
+            ++k;
+
+        field[start + q * stride] = (w * (q - v[k])) * (w * (q - v[k])) + f[v[k]];
+    }
+}
+
+
+
+// transform the rows [first_row, last_row) along axis, consecutive rows are neighbors in memory
+static void DistanceRows(double *field, long grid_size[3], int axis, double w, long first_row, long last_row, EDTBuffers *buffers)
+{
+    long strides[3] = { grid_size[IB_Y] * grid_size[IB_X], grid_size[IB_X], 1 };
+    int outer = (axis == IB_Z) ? IB_Y : IB_Z;
+    int inner = (axis == IB_X) ? IB_Y : IB_X;
+
+    CppEDTReserveBuffers(*buffers, grid_size[axis]);
+    for (long ir = first_row; ir < last_row; ++ir) {
+        long start = (ir / grid_size[inner]) * strides[outer] + (ir % grid_size[inner]) * strides[inner];
+        DistanceRow(field, start, strides[axis], grid_size[axis], w, *buffers);
+    }
+}
+
+
+
+void CppSquaredDistanceField(double *field, long grid_size[3], double resolution[3], long nthreads, EDTBuffers *buffers)
+{
+    // every thread needs its own scratch space
+    if (nthreads < 1) nthreads = 1;
+    std::vector<EDTBuffers> thread_buffers(nthreads);
+    for (long it = 0; it < nthreads; ++it)
+        CppEDTInitializeBuffers(thread_buffers[it]);
+    if (!buffers) buffers = &(thread_buffers[0]);
+
+    // go along the z dimension first, then y and x
+    for (int axis = IB_Z; axis <= IB_X; ++axis) {
+        if (resolution[axis] <= 0 || grid_size[axis] < 2) continue;
+
+        long nrows = grid_size[IB_Z] * grid_size[IB_Y] * grid_size[IB_X] / grid_size[axis];
+        if (nthreads == 1 || nrows < nthreads) DistanceRows(field, grid_size, axis, resolution[axis], 0, nrows, buffers);
+        else {
+            std::vector<std::thread> threads;
+            for (long it = 0; it < nthreads; ++it) {
+                EDTBuffers *scratch = it ? &(thread_buffers[it]) : buffers;
+                threads.push_back(std::thread(DistanceRows, field, grid_size, axis, resolution[axis], it * nrows / nthreads, (it + 1) * nrows / nthreads, scratch));
+            }
+            for (long it = 0; it < nthreads; ++it)
+                threads[it].join();
+        }
+    }
+
+    for (long it = 0; it < nthreads; ++it)
+        CppEDTReleaseBuffers(thread_buffers[it]);
+}
+
+
+
+// label distance transforms
+
+static void LabelDistanceWorker(long *segmentation, long grid_size[3], double resolution[3], float *distances, long *labels, std::vector<long> *bounding_boxes, \
+                                long nlabels, long row_threads, std::atomic<long> *next_label)
+{
+    EDTBuffers buffers;
+    CppEDTInitializeBuffers(buffers);
+    std::vector<double> field;
+
+    long sheet_size = grid_size[IB_Y] * grid_size[IB_X];
+    long row_size = grid_size[IB_X];
+
+    // larger than any squared distance in the grid
+    double infinity = 1;
+    for (int dim = 0; dim < 3; ++dim)
+        if (resolution[dim] > 0) infinity += (grid_size[dim] * resolution[dim]) * (grid_size[dim] * resolution[dim]);
+
+    for (long il = (*next_label)++; il < nlabels; il = (*next_label)++) {
+        long label = labels[il];
+        long *box = &((*bounding_boxes)[6 * il]);
+        if (box[IB_Z] > box[3 + IB_Z]) continue;
+
+        // the label and one voxel of padding, where every voxel has another label
+        long min_index[3], crop_size[3];
+        for (int dim = 0; dim < 3; ++dim) {
+            min_index[dim] = (box[dim] > 0) ? box[dim] - 1 : 0;
+            long max_index = (box[3 + dim] < grid_size[dim] - 1) ? box[3 + dim] + 1 : grid_size[dim] - 1;
+            crop_size[dim] = max_index - min_index[dim] + 1;
+        }
+        long crop_entries = crop_size[IB_Z] * crop_size[IB_Y] * crop_size[IB_X];
+        if ((long) field.size() < crop_entries) field.resize(crop_entries);
+
+        long ic = 0;
+        for (long iz = min_index[IB_Z]; iz < min_index[IB_Z] + crop_size[IB_Z]; ++iz) {
+            for (long iy = min_index[IB_Y]; iy < min_index[IB_Y] + crop_size[IB_Y]; ++iy) {
+                long *row = segmentation + iz * sheet_size + iy * row_size + min_index[IB_X];
+                for (long ix = 0; ix < crop_size[IB_X]; ++ix, ++ic)
+                    field[ic] = (row[ix] == label) ? infinity : 0;
+            }
+        }
+
+        CppSquaredDistanceField(&(field[0]), crop_size, resolution, row_threads, &buffers);
+
+        // every label only writes its own voxels, voxels without another label in reach are infinitely far
+        ic = 0;
+        for (long iz = min_index[IB_Z]; iz < min_index[IB_Z] + crop_size[IB_Z]; ++iz) {
+            for (long iy = min_index[IB_Y]; iy < min_index[IB_Y] + crop_size[IB_Y]; ++iy) {
+                long offset = iz * sheet_size + iy * row_size + min_index[IB_X];
+                for (long ix = 0; ix < crop_size[IB_X]; ++ix, ++ic) {
+                    if (segmentation[offset + ix] != label) continue;
+                    distances[offset + ix] = (field[ic] >= infinity) ? HUGE_VALF : sqrt(field[ic]);
+                }
+            }
+        }
+    }
+
+    CppEDTReleaseBuffers(buffers);
+}
+
+
+
+void CppLabelDistanceTransform(long *segmentation, long grid_size[3], double resolution[3], float *distances, long *labels, long nlabels, long nthreads)
+{
+    if (nthreads < 1) nthreads = 1;
+    long nentries = grid_size[IB_Z] * grid_size[IB_Y] * grid_size[IB_X];
+    long sheet_size = grid_size[IB_Y] * grid_size[IB_X];
+    long row_size = grid_size[IB_X];
+
+    // index of every requested label
+    long max_label = -1;
+    for (long il = 0; il < nlabels; ++il)
+        if (labels[il] > max_label) max_label = labels[il];
+    std::vector<long> label_index(max_label + 1, -1);
+    for (long il = 0; il < nlabels; ++il)
+        if (labels[il] >= 0) label_index[labels[il]] = il;
+
+    // bounding boxes (min z, y, x, max z, y, x) of all requested labels in one pass
+    std::vector<long> bounding_boxes(6 * nlabels);
+    for (long il = 0; il < nlabels; ++il) {
+        for (int dim = 0; dim < 3; ++dim) {
+            bounding_boxes[6 * il + dim] = grid_size[dim];
+            bounding_boxes[6 * il + 3 + dim] = -1;
+        }
+    }
+    for (long iv = 0; iv < nentries; ++iv) {
+        long label = segmentation[iv];
+        if (label < 0 || label > max_label || label_index[label] < 0) continue;
+
+        long *box = &(bounding_boxes[6 * label_index[label]]);
+        long indices[3] = { iv / sheet_size, (iv % sheet_size) / row_size, iv % row_size };
+        for (int dim = 0; dim < 3; ++dim) {
+            if (indices[dim] < box[dim]) box[dim] = indices[dim];
+            if (indices[dim] > box[3 + dim]) box[3 + dim] = indices[dim];
+        }
+    }
+
+    // threads take whole labels if there are enough of them, otherwise they share the rows of every label
+    std::atomic<long> next_label(0);
+    if (nthreads == 1 || nlabels < nthreads) LabelDistanceWorker(segmentation, grid_size, resolution, distances, labels, &bounding_boxes, nlabels, nthreads, &next_label);
+    else {
+        std::vector<std::thread> threads;
+        for (long it = 0; it < nthreads; ++it)
+            threads.push_back(std::thread(LabelDistanceWorker, segmentation, grid_size, resolution, distances, labels, &bounding_boxes, nlabels, 1, &next_label));
+        for (long it = 0; it < nthreads; ++it)
+            threads[it].join();
+    }
+}
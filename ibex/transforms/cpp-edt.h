@@ -0,0 +1,22 @@
+#ifndef __CPP_EDT__
+#define __CPP_EDT__
+
+// scratch space for the one dimensional transforms of one thread, reused between rows and calls
+struct EDTBuffers {
+    long *v;
+    double *z;
+    double *f;
+    long capacity;
+};
+
+void CppEDTInitializeBuffers(EDTBuffers &buffers);
+void CppEDTReserveBuffers(EDTBuffers &buffers, long length);
+void CppEDTReleaseBuffers(EDTBuffers &buffers);
+
+// squared euclidean distance transform of field in place, axes with resolution <= 0 are skipped
+void CppSquaredDistanceField(double *field, long grid_size[3], double resolution[3], long nthreads, EDTBuffers *buffers);
+
+// distance of every voxel of labels to the closest voxel with another label, computed per label on its bounding box
+void CppLabelDistanceTransform(long *segmentation, long grid_size[3], double resolution[3], float *distances, long *labels, long nlabels, long nthreads);
+
+#endif
@@ -1,67 +1,152 @@
 #include <stdio.h>
-#include <unordered_map>
+#include <stdint.h>
+#include <algorithm>
+#include <vector>
+#include <thread>
 
 
 
-long *CppMapping(long *segmentation, long *gold, long nentries, double match_threshold, double nonzero_threshold)
+// contingency table of the last overlap computation, sorted by packed (segment, gold) key
+static std::vector<unsigned long> overlap_keys;
+static std::vector<long> overlap_counts;
+
+// voxels converted and packed at once by every thread
+static const long overlap_block_size = 1 << 16;
+static const long max_packed_id = 1L << 32;
+
+
+
+template <typename Type>
+static void ReadBlock(const void *data, long start, long nelements, long *output)
 {
-    // find the maximum segmentation value
-    long max_segmentation_value = 0;
-    for (long iv = 0; iv < nentries; ++iv) {
-        if (segmentation[iv] > max_segmentation_value)
-            max_segmentation_value = segmentation[iv];
-    }
-    max_segmentation_value++;
+    const Type *input = (const Type *) data + start;
+    for (long ie = 0; ie < nelements; ++ie)
+        output[ie] = (long) input[ie];
+}
 
-    // find the maximum gold value
-    long max_gold_value = 0;
-    for (long iv = 0; iv < nentries; ++iv) {
-        if (gold[iv] > max_gold_value) 
-            max_gold_value = gold[iv];
+static void ReadIdentities(const void *data, long nbytes, bool is_signed, long start, long nelements, long *output)
+{
+    if (nbytes == 1) is_signed ? ReadBlock<int8_t>(data, start, nelements, output) : ReadBlock<uint8_t>(data, start, nelements, output);
+    else if (nbytes == 2) is_signed ? ReadBlock<int16_t>(data, start, nelements, output) : ReadBlock<uint16_t>(data, start, nelements, output);
+    else if (nbytes == 4) is_signed ? ReadBlock<int32_t>(data, start, nelements, output) : ReadBlock<uint32_t>(data, start, nelements, output);
+    else is_signed ? ReadBlock<int64_t>(data, start, nelements, output) : ReadBlock<uint64_t>(data, start, nelements, output);
+}
+
+// sort (key, count) pairs and merge the counts of equal keys
+static void MergeRuns(std::vector<std::pair<unsigned long, long> > &runs)
+{
+    std::sort(runs.begin(), runs.end());
+    long nunique = 0;
+    for (long ir = 0; ir < (long) runs.size(); ++ir) {
+        if (nunique && runs[nunique - 1].first == runs[ir].first) runs[nunique - 1].second += runs[ir].second;
+        else runs[nunique++] = runs[ir];
     }
-    max_gold_value++;
-
-    // find the number of voxels per segment
-    unsigned long *nvoxels_per_segment = new unsigned long[max_segmentation_value];
-    for (long iv = 0; iv < max_segmentation_value; ++iv)
-        nvoxels_per_segment[iv] = 0;
-    for (long iv = 0; iv < nentries; ++iv)
-        nvoxels_per_segment[segmentation[iv]]++;
-
-    std::unordered_map<long, std::unordered_map<long, long> > seg2gold_overlap = std::unordered_map<long, std::unordered_map<long, long> >();   
-    for (long is = 0; is < max_segmentation_value; ++is) {
-        if (nvoxels_per_segment[is]) seg2gold_overlap.insert(std::pair<long, std::unordered_map<long, long> >(is, std::unordered_map<long, long>()));
+    runs.resize(nunique);
+}
+
+static void OverlapWorker(const void *segmentation, long segmentation_bytes, bool segmentation_signed, const void *gold, long gold_bytes, bool gold_signed, \
+                          long start, long end, std::vector<std::pair<unsigned long, long> > *runs, bool *out_of_range)
+{
+    std::vector<long> segmentation_block(overlap_block_size);
+    std::vector<long> gold_block(overlap_block_size);
+
+    unsigned long previous_key = 0;
+    long previous_count = 0;
+    // the merged runs hold every pair seen so far, so the buffer may double before the next merge
+    long merge_size = 4 * overlap_block_size;
+    for (long ib = start; ib < end; ib += overlap_block_size) {
+        long nelements = std::min(overlap_block_size, end - ib);
+        ReadIdentities(segmentation, segmentation_bytes, segmentation_signed, ib, nelements, &(segmentation_block[0]));
+        ReadIdentities(gold, gold_bytes, gold_signed, ib, nelements, &(gold_block[0]));
+
+        for (long ie = 0; ie < nelements; ++ie) {
+            long segment = segmentation_block[ie];
+            long label = gold_block[ie];
+            if (segment < 0 || segment >= max_packed_id || label < 0 || label >= max_packed_id) { *out_of_range = true; return; }
+
+            // neighboring voxels mostly share the pair so runs are counted before sorting
+            unsigned long key = ((unsigned long) segment << 32) | (unsigned long) label;
+            if (previous_count && key == previous_key) { previous_count++; continue; }
+            if (previous_count) runs->push_back(std::pair<unsigned long, long>(previous_key, previous_count));
+            previous_key = key;
+            previous_count = 1;
+        }
+
+        // keep the run buffer small without sorting the unique pairs after every block
+        if ((long) runs->size() > merge_size) {
+            MergeRuns(*runs);
+            merge_size = 2 * runs->size() + overlap_block_size;
+        }
     }
-    
-    for (long iv = 0; iv < nentries; ++iv) {
-        seg2gold_overlap[segmentation[iv]][gold[iv]]++;
+    if (previous_count) runs->push_back(std::pair<unsigned long, long>(previous_key, previous_count));
+    MergeRuns(*runs);
+}
+
+
+
+long CppSeg2GoldOverlap(const void *segmentation, long segmentation_bytes, bool segmentation_signed, const void *gold, long gold_bytes, bool gold_signed, long nentries, long nthreads)
+{
+    if (nthreads < 1) nthreads = 1;
+    if (nthreads > nentries / overlap_block_size + 1) nthreads = nentries / overlap_block_size + 1;
+
+    // every thread counts the pairs of one chunk of the volume
+    std::vector<std::vector<std::pair<unsigned long, long> > > runs(nthreads);
+    bool *out_of_range = new bool[nthreads];
+    long chunk_size = (nentries + nthreads - 1) / nthreads;
+    if (nthreads == 1) {
+        out_of_range[0] = false;
+        OverlapWorker(segmentation, segmentation_bytes, segmentation_signed, gold, gold_bytes, gold_signed, 0, nentries, &(runs[0]), &(out_of_range[0]));
     }
-    
-    // create the mapping
-    long *segmentation_to_gold = new long[max_segmentation_value];
-    for (long is = 0; is < max_segmentation_value; ++is) {
-        if (!nvoxels_per_segment[is]) { segmentation_to_gold[is] = 0; continue; }
-        long gold_id = 0;
-        long gold_max_value = 0;
-
-        // only gets label of 0 if the number of non zero voxels is below threshold
-        for (std::unordered_map<long, long>::iterator iter = seg2gold_overlap[is].begin(); iter != seg2gold_overlap[is].end(); ++iter) {
-            if (not iter->first) continue;
-            if (iter->second > gold_max_value) {
-                gold_max_value = iter->second;
-                gold_id = iter->first;
-            }
+    else {
+        std::vector<std::thread> threads;
+        for (long it = 0; it < nthreads; ++it) {
+            out_of_range[it] = false;
+            long start = std::min(it * chunk_size, nentries);
+            long end = std::min(start + chunk_size, nentries);
+            threads.push_back(std::thread(OverlapWorker, segmentation, segmentation_bytes, segmentation_signed, gold, gold_bytes, gold_signed, start, end, &(runs[it]), &(out_of_range[it])));
         }
+        for (long it = 0; it < nthreads; ++it)
+            threads[it].join();
+    }
+
+    bool valid = true;
+    for (long it = 0; it < nthreads; ++it)
+        if (out_of_range[it]) valid = false;
+    delete[] out_of_range;
+
+    overlap_keys.clear();
+    overlap_counts.clear();
+    // identities must be in [0, 2^32) to be packed
+    if (!valid) return -1;
 
-        // number of non zero pixels must be greater than the nonzero threshold
-        if ((double)(nvoxels_per_segment[is] - seg2gold_overlap[is][0]) / nvoxels_per_segment[is] < nonzero_threshold) segmentation_to_gold[is] = 0;
-        // the number of matching gold values divided by the number of non zero pixels must be greater than the match threshold or it is a merge error
-        else if (gold_max_value / (double)(nvoxels_per_segment[is] - seg2gold_overlap[is][0]) < match_threshold) segmentation_to_gold[is] = -1;
-        else segmentation_to_gold[is] = gold_id;
+    // merge the tables of all threads
+    for (long it = 1; it < nthreads; ++it) {
+        runs[0].insert(runs[0].end(), runs[it].begin(), runs[it].end());
+        std::vector<std::pair<unsigned long, long> >().swap(runs[it]);
+    }
+    MergeRuns(runs[0]);
+
+    overlap_keys.resize(runs[0].size());
+    overlap_counts.resize(runs[0].size());
+    for (long ir = 0; ir < (long) runs[0].size(); ++ir) {
+        overlap_keys[ir] = runs[0][ir].first;
+        overlap_counts[ir] = runs[0][ir].second;
+    }
+
+    return overlap_keys.size();
+}
+
+
+
+void CppSeg2GoldOverlapTable(long *segmentation_ids, long *gold_ids, long *counts)
+{
+    for (long ie = 0; ie < (long) overlap_keys.size(); ++ie) {
+        segmentation_ids[ie] = (long) (overlap_keys[ie] >> 32);
+        gold_ids[ie] = (long) (overlap_keys[ie] & 0xffffffffUL);
+        counts[ie] = overlap_counts[ie];
     }
 
     // free memory
-    delete[] nvoxels_per_segment;
-    
-    return segmentation_to_gold;
+    std::vector<unsigned long>().swap(overlap_keys);
+    std::vector<long>().swap(overlap_counts);
 }
@@ -1 +1,2 @@
-long *CppMapping(long *segmentation, long *gold, long nentries, double match_threshold, double nonzero_threshold);
+long CppSeg2GoldOverlap(const void *segmentation, long segmentation_bytes, bool segmentation_signed, const void *gold, long gold_bytes, bool gold_signed, long nentries, long nthreads);
+void CppSeg2GoldOverlapTable(long *segmentation_ids, long *gold_ids, long *counts);
@@ -235,7 +235,7 @@ void CppDownsampleMapping(const char *prefix, long *segmentation, float input_re
 
     // write the downsampling information
     char downsample_filename[4096];
-    if (benchmark) sprintf(downsample_filename, "benchmarks/%s-downsample-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
+    if (benchmark) sprintf(downsample_filename, "benchmarks/skeleton/%s-downsample-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
     else sprintf(downsample_filename, "%s/downsample-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
 
     // open the output file
@@ -244,7 +244,7 @@ void CppDownsampleMapping(const char *prefix, long *segmentation, float input_re
 
     // write the upsampling information
     char upsample_filename[4096];
-    if (benchmark) sprintf(upsample_filename, "benchmarks/%s-upsample-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
+    if (benchmark) sprintf(upsample_filename, "benchmarks/skeleton/%s-upsample-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
     else sprintf(upsample_filename, "%s/upsample-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
 
     // open the output file
@@ -318,6 +318,12 @@ void CppDownsampleMapping(const char *prefix, long *segmentation, float input_re
     fclose(dfp);
     fclose(ufp);
 
+    // remove the sorted down to up mapping of the previous files (rebuilt when the skeletons need it)
+    char mapping_filename[4096];
+    if (benchmark) sprintf(mapping_filename, "benchmarks/skeleton/%s-down-to-up-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
+    else sprintf(mapping_filename, "%s/down-to-up-%03ldx%03ldx%03ld.bytes", prefix, output_resolution[IB_X], output_resolution[IB_Y], output_resolution[IB_Z]);
+    remove(mapping_filename);
+
     // free memory
     delete[] downsample_sets;
 }
@@ -4,11 +4,16 @@ cimport numpy as np
 import ctypes
 import numpy as np
 
+from ibex.utilities import dataIO
+
 
 cdef extern from 'cpp-distance.h':
     float *CppTwoDimensionalDistanceTransform(long *data, long grid_size[3])
     void CppDilateData(long *data, long grid_size[3], float distance)
 
+cdef extern from 'cpp-edt.h':
+    void CppLabelDistanceTransform(long *segmentation, long grid_size[3], double resolution[3], float *distances, long *labels, long nlabels, long nthreads)
+
 
 # get the two dimensional distance transform
 def TwoDimensionalDistanceTransform(data):
@@ -40,4 +45,30 @@ def DilateData(data, distance):
     # dilate the data by distance
     CppDilateData(&(cpp_data[0,0,0]), &(cpp_input_grid_size[0]), float(distance))
 
-    del cpp_input_grid_size
\ No newline at end of file
+    del cpp_input_grid_size
+
+
+
+# get the anisotropic euclidean distance of every voxel to the closest voxel with another label
+def DistanceTransform(segmentation, resolution=None, prefix=None, labels=None, nthreads=1):
+    # the voxel sizes (z, y, x) default to the resolution in the meta file of prefix
+    if resolution is None: resolution = dataIO.Resolution(prefix) if prefix is not None else (1, 1, 1)
+    # every non zero label by default, outside of labels the distance is 0
+    if labels is None:
+        labels = np.unique(segmentation)
+        labels = labels[labels != 0]
+    if not segmentation.dtype == np.int64: segmentation = segmentation.astype(np.int64)
+
+    # convert numpy arrays to c++
+    cdef np.ndarray[long, ndim=3, mode='c'] cpp_segmentation = np.ascontiguousarray(segmentation, dtype=ctypes.c_int64)
+    cdef np.ndarray[long, ndim=1, mode='c'] cpp_grid_size = np.ascontiguousarray(segmentation.shape, dtype=ctypes.c_int64)
+    cdef np.ndarray[double, ndim=1, mode='c'] cpp_resolution = np.ascontiguousarray(resolution, dtype=ctypes.c_double)
+    # one extra entry so that an empty list of labels still has an address
+    cdef np.ndarray[long, ndim=1, mode='c'] cpp_labels = np.ascontiguousarray(np.append(labels, 0), dtype=ctypes.c_int64)
+    cdef np.ndarray[float, ndim=3, mode='c'] distances = np.zeros(segmentation.shape, dtype=np.float32)
+
+    # every label is transformed on its bounding box
+    if segmentation.size:
+        CppLabelDistanceTransform(&(cpp_segmentation[0,0,0]), &(cpp_grid_size[0]), &(cpp_resolution[0]), &(distances[0,0,0]), &(cpp_labels[0]), cpp_labels.size - 1, nthreads)
+
+    return distances
@@ -1,69 +1,197 @@
 cimport cython
 cimport numpy as np
+from libcpp cimport bool
 
 import os
 import struct
+import zlib
+import hashlib
 import numpy as np
 import ctypes
 
 from ibex.utilities import dataIO
+from ibex.data_structures import meta_data
 
+np.import_array()
 
 
 cdef extern from 'cpp-seg2gold.h':
-    long *CppMapping(long *segmentation, long *gold, long nentries, double match_threshold, double nonzero_threshold)
+    long CppSeg2GoldOverlap(const void *segmentation, long segmentation_bytes, bool segmentation_signed, const void *gold, long gold_bytes, bool gold_signed, long nentries, long nthreads)
+    void CppSeg2GoldOverlapTable(long *segmentation_ids, long *gold_ids, long *counts)
+
+
+
+# cache files are a header followed by a memory mapped int64 array
+SEG2GOLD_MAGIC = 'SEG2GOLD'
+SEG2GOLD_VERSION = 2
+SEG2GOLD_HEADER = struct.Struct('8sq40sddq')
+
+
+
+def InputHash(prefix, segmentation=None, gold=None):
+    # hash the given volumes or the name, size and modification time of the files they are read from
+    sha = hashlib.sha1()
+    for name, volume, filename in (('segmentation', segmentation, meta_data.CachedMetaData(prefix).SegmentationFilename if segmentation is None else None), \
+                                   ('gold', gold, meta_data.CachedMetaData(prefix).GoldFilename if gold is None else None)):
+        sha.update(name)
+        if volume is None:
+            filename, dataset = filename()
+            stat = os.stat(filename)
+            sha.update(repr((os.path.abspath(filename), dataset, stat.st_size, stat.st_mtime)))
+        else:
+            volume = np.ascontiguousarray(volume)
+            sha.update(str(volume.dtype))
+            sha.update(str(volume.shape))
+            # a crc32 of every chunk validates the cache at a fraction of the cost of hashing the data
+            data = volume.reshape(-1).view(np.uint8)
+            for start in range(0, data.size, 1 << 26):
+                sha.update(str(zlib.crc32(buffer(data[start:start + (1 << 26)])) & 0xffffffff))
+
+    return sha.hexdigest()
+
+
+
+def WriteSeg2GoldCache(filename, input_hash, data, match_threshold=0.0, nonzero_threshold=0.0):
+    if not os.path.exists(os.path.dirname(filename)):
+        os.makedirs(os.path.dirname(filename))
+
+    # write to a temporary file so readers never see a partial cache
+    temporary_filename = '{}.tmp{}'.format(filename, os.getpid())
+    with open(temporary_filename, 'wb') as fd:
+        fd.write(SEG2GOLD_HEADER.pack(SEG2GOLD_MAGIC, SEG2GOLD_VERSION, input_hash, match_threshold, nonzero_threshold, data.size))
+        np.ascontiguousarray(data, dtype=np.int64).tofile(fd)
+    os.rename(temporary_filename, filename)
+
+
+
+def ReadSeg2GoldCache(filename, input_hash=None, match_threshold=None, nonzero_threshold=None):
+    # return the memory mapped array or None if the cache is missing or was computed from other inputs or thresholds
+    if not os.path.isfile(filename): return None
+
+    with open(filename, 'rb') as fd:
+        header = fd.read(SEG2GOLD_HEADER.size)
+    if len(header) < SEG2GOLD_HEADER.size: return None
+    magic, version, cached_hash, cached_match_threshold, cached_nonzero_threshold, nentries = SEG2GOLD_HEADER.unpack(header)
+
+    if magic != SEG2GOLD_MAGIC or version != SEG2GOLD_VERSION: return None
+    if input_hash is not None and cached_hash != input_hash: return None
+    if match_threshold is not None and cached_match_threshold != match_threshold: return None
+    if nonzero_threshold is not None and cached_nonzero_threshold != nonzero_threshold: return None
+    if not nentries: return np.zeros(0, dtype=np.int64)
+
+    return np.memmap(filename, dtype=np.int64, mode='r', offset=SEG2GOLD_HEADER.size, shape=(nentries,))
 
 
 
 def CachedSeg2GoldMapping(prefix):
     # make sure the cache exists
     seg2gold_filename = 'cache/{}-seg2gold.map'.format(prefix)
-    assert (os.path.isfile(seg2gold_filename))
+    seg2gold_mapping = ReadSeg2GoldCache(seg2gold_filename)
+    assert (seg2gold_mapping is not None)
 
-    with open(seg2gold_filename, 'rb') as fd:
-        max_label, = struct.unpack('q', fd.read(8))
+    return seg2gold_mapping
 
-        seg2gold_mapping = np.zeros(max_label, dtype=np.int64)
-        for label in range(max_label):
-            seg2gold_mapping[label], = struct.unpack('q', fd.read(8))
 
-    return seg2gold_mapping
 
+# get the contingency table of two volumes of any integer dtype as (segmentation ids, gold ids, counts) sorted by segmentation and gold id
+def Overlap(segmentation, gold, nthreads=1):
+    assert (segmentation.shape == gold.shape)
+    assert (segmentation.dtype.kind in 'iu' and gold.dtype.kind in 'iu')
 
+    cdef np.ndarray cpp_segmentation = np.ascontiguousarray(segmentation)
+    cdef np.ndarray cpp_gold = np.ascontiguousarray(gold)
 
-def Mapping(prefix, segmentation=None, gold=None, match_threshold=0.80, nonzero_threshold=0.40):
-    # see if the cache exists and use it if it does
-    seg2gold_filename = 'cache/{}-seg2gold.map'.format(prefix)
-    if os.path.isfile(seg2gold_filename): 
-        return CachedSeg2GoldMapping(prefix)
+    cdef long nentries = CppSeg2GoldOverlap(np.PyArray_DATA(cpp_segmentation), cpp_segmentation.dtype.itemsize, cpp_segmentation.dtype.kind == 'i', \
+                                            np.PyArray_DATA(cpp_gold), cpp_gold.dtype.itemsize, cpp_gold.dtype.kind == 'i', cpp_segmentation.size, nthreads)
 
-    if segmentation == None:
+    # sparse or negative ids do not fit in the packed keys and are relabeled first
+    if nentries < 0:
+        unique_segmentation, dense_segmentation = np.unique(cpp_segmentation, return_inverse=True)
+        unique_gold, dense_gold = np.unique(cpp_gold, return_inverse=True)
+        dense_segmentation_ids, dense_gold_ids, dense_counts = Overlap(dense_segmentation.astype(np.uint32), dense_gold.astype(np.uint32), nthreads)
+        return unique_segmentation[dense_segmentation_ids].astype(np.int64), unique_gold[dense_gold_ids].astype(np.int64), dense_counts
+
+    cdef np.ndarray[long, ndim=1, mode='c'] segmentation_ids = np.zeros(nentries, dtype=ctypes.c_int64)
+    cdef np.ndarray[long, ndim=1, mode='c'] gold_ids = np.zeros(nentries, dtype=ctypes.c_int64)
+    cdef np.ndarray[long, ndim=1, mode='c'] counts = np.zeros(nentries, dtype=ctypes.c_int64)
+    if nentries:
+        CppSeg2GoldOverlapTable(&(segmentation_ids[0]), &(gold_ids[0]), &(counts[0]))
+    else:
+        CppSeg2GoldOverlapTable(NULL, NULL, NULL)
+
+    return segmentation_ids, gold_ids, counts
+
+
+
+# get the gold label of every segment from the contingency table (0 for mostly unlabeled segments, -1 for merge errors)
+def MappingFromOverlap(segmentation_ids, gold_ids, counts, match_threshold=0.80, nonzero_threshold=0.40):
+    max_segmentation = np.amax(segmentation_ids) + 1 if segmentation_ids.size else 1
+
+    nvoxels_per_segment = np.zeros(max_segmentation, dtype=np.int64)
+    np.add.at(nvoxels_per_segment, segmentation_ids, counts)
+    nonzero = gold_ids != 0
+    nzero_per_segment = np.zeros(max_segmentation, dtype=np.int64)
+    nzero_per_segment[segmentation_ids[~nonzero]] = counts[~nonzero]
+
+    # the most overlapping non zero gold label of every segment
+    gold_id = np.zeros(max_segmentation, dtype=np.int64)
+    gold_max_value = np.zeros(max_segmentation, dtype=np.int64)
+    order = np.lexsort((counts[nonzero], segmentation_ids[nonzero]))
+    sorted_segmentation_ids = segmentation_ids[nonzero][order]
+    last = np.append(sorted_segmentation_ids[1:] != sorted_segmentation_ids[:-1], True)[:sorted_segmentation_ids.size]
+    gold_id[sorted_segmentation_ids[last]] = gold_ids[nonzero][order][last]
+    gold_max_value[sorted_segmentation_ids[last]] = counts[nonzero][order][last]
+
+    nvoxels_nonzero = (nvoxels_per_segment - nzero_per_segment).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # number of non zero pixels must be greater than the nonzero threshold
+        unlabeled = nvoxels_nonzero / nvoxels_per_segment < nonzero_threshold
+        # the number of matching gold values divided by the number of non zero pixels must be greater than the match threshold or it is a merge error
+        merged = gold_max_value / nvoxels_nonzero < match_threshold
+
+    seg2gold_mapping = np.where(unlabeled, 0, np.where(merged, -1, gold_id))
+    seg2gold_mapping[nvoxels_per_segment == 0] = 0
+
+    return seg2gold_mapping.astype(np.int64)
+
+
+
+# get the contingency table of prefix from the cache or compute and cache it
+def CachedOverlap(prefix, segmentation=None, gold=None, nthreads=1, input_hash=None):
+    overlap_filename = 'cache/{}-seg2gold.overlap'.format(prefix)
+    if input_hash is None:
+        input_hash = InputHash(prefix, segmentation, gold)
+
+    overlap = ReadSeg2GoldCache(overlap_filename, input_hash)
+    if overlap is not None:
+        segmentation_ids, gold_ids, counts = overlap.reshape(3, -1)
+        return segmentation_ids, gold_ids, counts
+
+    if segmentation is None:
         segmentation = dataIO.ReadSegmentationData(prefix)
-    if gold == None:
+    if gold is None:
         gold = dataIO.ReadGoldData(prefix)
 
-    # everything needs to be long ints to work with c++
-    assert (segmentation.dtype == np.int64)
-    assert (gold.dtype == np.int64)
+    segmentation_ids, gold_ids, counts = Overlap(segmentation, gold, nthreads)
+    WriteSeg2GoldCache(overlap_filename, input_hash, np.concatenate([segmentation_ids, gold_ids, counts]))
 
-    cdef np.ndarray[long, ndim=3, mode='c'] cpp_segmentation = np.ascontiguousarray(segmentation, dtype=ctypes.c_int64)
-    cdef np.ndarray[long, ndim=3, mode='c'] cpp_gold = np.ascontiguousarray(gold, dtype=ctypes.c_int64)
-    max_segmentation = np.amax(segmentation) + 1
+    return segmentation_ids, gold_ids, counts
 
-    cdef long *mapping = CppMapping(&(cpp_segmentation[0,0,0]), &(cpp_gold[0,0,0]), segmentation.size, match_threshold, nonzero_threshold)
 
-    cdef long[:] tmp_mapping = <long[:max_segmentation]> mapping;
-    seg2gold_mapping = np.asarray(tmp_mapping)
 
-    if not os.path.exists('cache'):
-        os.mkdir('cache')
+def Mapping(prefix, segmentation=None, gold=None, match_threshold=0.80, nonzero_threshold=0.40, nthreads=1):
+    # see if the cache exists for these inputs and thresholds and use it if it does
+    seg2gold_filename = 'cache/{}-seg2gold.map'.format(prefix)
+    input_hash = InputHash(prefix, segmentation, gold)
+    seg2gold_mapping = ReadSeg2GoldCache(seg2gold_filename, input_hash, match_threshold, nonzero_threshold)
+    if seg2gold_mapping is not None:
+        return seg2gold_mapping
 
-    # create cache
-    with open(seg2gold_filename, 'wb') as fd:
-        max_label = seg2gold_mapping.size
-        fd.write(struct.pack('q', max_label))
+    # the overlap counts do not depend on the thresholds
+    segmentation_ids, gold_ids, counts = CachedOverlap(prefix, segmentation, gold, nthreads, input_hash)
+    seg2gold_mapping = MappingFromOverlap(segmentation_ids, gold_ids, counts, match_threshold, nonzero_threshold)
 
-        for label in range(max_label):
-            fd.write(struct.pack('q', seg2gold_mapping[label]))
+    # create cache
+    WriteSeg2GoldCache(seg2gold_filename, input_hash, seg2gold_mapping, match_threshold, nonzero_threshold)
 
-    return seg2gold_mapping
\ No newline at end of file
+    return seg2gold_mapping
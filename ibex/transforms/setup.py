@@ -6,15 +6,17 @@ extensions = [
     Extension(
         name='distance',
         include_dirs=[np.get_include()],
-        sources=['distance.pyx', 'cpp-distance.cpp'],
-        extra_compile_args=['-O4', '-std=c++0x'],
+        sources=['distance.pyx', 'cpp-distance.cpp', 'cpp-edt.cpp'],
+        extra_compile_args=['-O4', '-std=c++0x', '-pthread'],
+        extra_link_args=['-pthread'],
         language='c++'
     ),
     Extension(
         name='seg2gold',
         include_dirs=[np.get_include()],
         sources=['seg2gold.pyx', 'cpp-seg2gold.cpp'],
-        extra_compile_args=['-O4', '-std=c++0x'],
+        extra_compile_args=['-O4', '-std=c++0x', '-pthread'],
+        extra_link_args=['-pthread'],
         language='c++'
     ),
     Extension(
@@ -1,11 +1,12 @@
 import os
+import time
+import zlib
+import itertools
 import h5py
-import imageio
-import tifffile
 import struct
 
 import numpy as np
-from PIL import Image
+from multiprocessing.pool import ThreadPool
 
 from ibex.data_structures import meta_data, skeleton_points
 from ibex.utilities.constants import *
@@ -13,30 +14,36 @@ from ibex.utilities.constants import *
 
 def GetWorldBBox(prefix):
     # return the bounding box for this segment
-    return meta_data.MetaData(prefix).WorldBBox()
+    return meta_data.CachedMetaData(prefix).WorldBBox()
 
 
 
 def GridSize(prefix):
     # return the size of this dataset
-    return meta_data.MetaData(prefix).GridSize()
+    return meta_data.CachedMetaData(prefix).GridSize()
 
 
 def CroppingBox(prefix):
     # return which locations are valid for training and validation
-    return meta_data.MetaData(prefix).CroppingBox()
+    return meta_data.CachedMetaData(prefix).CroppingBox()
 
 
 
 def ReadMetaData(prefix):
     # return the meta data for this prefix
-    return meta_data.MetaData(prefix)
+    return meta_data.CachedMetaData(prefix)
+
+
+
+def SetMetaData(prefix, resolution=None, grid_size=None):
+    # pass the resolution and grid size (z, y, x) of prefix instead of reading meta.txt
+    meta_data.SetMetaData(prefix, resolution, grid_size)
 
 
 
 def Resolution(prefix):
     # return the resolution for this prefix
-    return meta_data.MetaData(prefix).Resolution()
+    return meta_data.CachedMetaData(prefix).Resolution()
 
 
 
@@ -59,16 +66,86 @@ def IsIsotropic(prefix):
 
 
 
-def WriteH5File(data, filename, dataset, compression=True):
+def H5Filter(compression=True, compression_level=4):
+    # h5py arguments for gzip (True), lzf or no (None or False) compression
+    if compression is True or compression == 'gzip': return {'compression': 'gzip', 'compression_opts': compression_level}
+    elif compression == 'lzf': return {'compression': 'lzf'}
+    else: return {}
+
+
+
+def DeflateChunk(args):
+    # zlib streams are what the hdf5 deflate filter stores
+    origin, chunk, compression_level = args
+    return origin, zlib.compress(chunk.tobytes(), compression_level)
+
+
+
+def WriteH5Block(h5dataset, block, offset, pool=None, compression_level=4):
+    # write block at offset, with a pool gzip chunks that the block covers are deflated in parallel and written directly
+    ndim = len(h5dataset.shape)
+    chunks = h5dataset.chunks
+    end = [offset[dim] + block.shape[dim] for dim in range(ndim)]
+    aligned = pool is not None and h5dataset.compression == 'gzip' and not h5dataset.shuffle and not h5dataset.fletcher32 and \
+              all(offset[dim] % chunks[dim] == 0 and (end[dim] % chunks[dim] == 0 or end[dim] == h5dataset.shape[dim]) for dim in range(ndim))
+    if not aligned:
+        h5dataset[tuple(slice(offset[dim], end[dim]) for dim in range(ndim))] = block
+        return
+
+    def Chunks():
+        for origin in itertools.product(*[range(0, block.shape[dim], chunks[dim]) for dim in range(ndim)]):
+            chunk = block[tuple(slice(origin[dim], origin[dim] + chunks[dim]) for dim in range(ndim))]
+            # chunks at the end of the dataset are padded to the chunk shape
+            if chunk.shape != chunks:
+                padded = np.zeros(chunks, dtype=h5dataset.dtype)
+                padded[tuple(slice(0, size) for size in chunk.shape)] = chunk
+                chunk = padded
+            yield tuple(origin[dim] + offset[dim] for dim in range(ndim)), np.ascontiguousarray(chunk, dtype=h5dataset.dtype), compression_level
+
+    # deflate a batch of chunks at a time to bound the memory
+    jobs = Chunks()
+    while True:
+        batch = list(itertools.islice(jobs, 64))
+        if not batch: break
+        for origin, data in pool.map(DeflateChunk, batch):
+            h5dataset.id.write_direct_chunk(origin, data)
+
+
+
+def WriteH5Dataset(hf, dataset, data, compression=True, chunks=None, compression_level=4, nthreads=1, shape=None, dtype=None):
+    # data is an array or a generator of z slabs (appended in order) or (offset, block) tuples, which needs shape and dtype
+    if isinstance(data, np.ndarray):
+        shape, dtype, blocks = data.shape, data.dtype, [data]
+    else:
+        blocks = data
+    filters = H5Filter(compression, compression_level)
+    h5dataset = hf.create_dataset(dataset, shape, dtype=dtype, chunks=chunks, **filters)
+
+    # independent chunks are only compressed in parallel with gzip
+    pool = ThreadPool(nthreads) if nthreads > 1 and filters.get('compression') == 'gzip' else None
+    zoffset = 0
+    for block in blocks:
+        if isinstance(block, tuple): offset, block = block
+        else: offset = (zoffset,) + (0,) * (len(shape) - 1)
+        zoffset = offset[0] + block.shape[0]
+        WriteH5Block(h5dataset, block, offset, pool, compression_level)
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    return h5dataset
+
+
+
+def WriteH5File(data, filename, dataset, compression=True, chunks=None, compression_level=4, nthreads=1, shape=None, dtype=None):
     with h5py.File(filename, 'w') as hf:
         # should cover all cases of affinities/images
-        if compression: hf.create_dataset(dataset, data=data, compression='gzip')
-        else: hf.create_dataset(dataset, data=data)
+        WriteH5Dataset(hf, dataset, data, compression, chunks, compression_level, nthreads, shape, dtype)
 
 
 
 def ReadAffinityData(prefix):
-    filename, dataset = meta_data.MetaData(prefix).AffinityFilename()
+    filename, dataset = meta_data.CachedMetaData(prefix).AffinityFilename()
 
     affinities = ReadH5File(filename, dataset).astype(np.float32)
 
@@ -80,21 +157,21 @@ def ReadAffinityData(prefix):
 
 
 def ReadSegmentationData(prefix):
-    filename, dataset = meta_data.MetaData(prefix).SegmentationFilename()
+    filename, dataset = meta_data.CachedMetaData(prefix).SegmentationFilename()
 
     return ReadH5File(filename, dataset).astype(np.int64)
 
 
 
 def ReadGoldData(prefix):
-    filename, dataset = meta_data.MetaData(prefix).GoldFilename()
+    filename, dataset = meta_data.CachedMetaData(prefix).GoldFilename()
 
     return ReadH5File(filename, dataset).astype(np.int64)
 
 
 
 def ReadImageData(prefix):
-    filename, dataset = meta_data.MetaData(prefix).ImageFilename()
+    filename, dataset = meta_data.CachedMetaData(prefix).ImageFilename()
 
     return ReadH5File(filename, dataset)
 
@@ -165,53 +242,127 @@ def ReadSkeletons(prefix, skeleton_algorithm='thinning', read_edges=False, downs
 
 
 def ReadImage(filename):
+    # image backends are only loaded when images are used
+    from PIL import Image
     return np.array(Image.open(filename))
 
 
 
 def WriteImage(image, filename):
+    import imageio
     imageio.imwrite(filename, image)
 
 
 
-def H52Tiff(stack, output_prefix):
+def EncodeSlice(args):
+    # write one slice as tif (zlib level compression) or png (compress_level compression)
+    image, filename, compression = args
+    if filename.endswith('.tif'):
+        import tifffile
+        if compression is None: tifffile.imsave(filename, image)
+        else: tifffile.imsave(filename, image, compress=compression)
+    else:
+        from PIL import Image
+        if compression is None: Image.fromarray(image).save(filename)
+        else: Image.fromarray(image).save(filename, compress_level=compression)
+
+
+
+def ExportSlices(stack, output_prefix, extension, slab_size=16, nthreads=1, compression=None, dataset=None):
+    # read z slabs lazily (from an array, h5py dataset or h5 filename) and encode their slices in a thread pool
+    hf = None
+    if isinstance(stack, basestring):
+        hf = h5py.File(stack, 'r')
+        stack = hf[dataset] if dataset is not None else hf[hf.keys()[0]]
     zres, _, _ = stack.shape
 
-    for iz in range(zres):
-        image = stack[iz,:,:]
-        tifffile.imsave('{}-{:05d}.tif'.format(output_prefix, iz), image)
+    start_time = time.time()
+    pool = ThreadPool(nthreads) if nthreads > 1 else None
+    slab = np.asarray(stack[0:slab_size,:,:])
+    for iz in range(0, zres, slab_size):
+        jobs = [(slab[iv,:,:], '{}-{:05d}.{}'.format(output_prefix, iz + iv, extension), compression) for iv in range(slab.shape[0])]
+        if pool is None:
+            map(EncodeSlice, jobs)
+            if iz + slab_size < zres: slab = np.asarray(stack[iz + slab_size:iz + 2 * slab_size,:,:])
+        else:
+            # read the next slab while this one is encoded
+            encoded = pool.map_async(EncodeSlice, jobs)
+            if iz + slab_size < zres: slab = np.asarray(stack[iz + slab_size:iz + 2 * slab_size,:,:])
+            encoded.get()
 
+    if pool is not None:
+        pool.close()
+        pool.join()
+    if hf is not None:
+        hf.close()
 
+    slices_per_second = zres / max(time.time() - start_time, 1e-9)
+    print 'Exported {} slices at {:.1f} slices/s'.format(zres, slices_per_second)
 
-def H52PNG(stack, output_prefix):
-    zres, _, _ = stack.shape
+    return slices_per_second
 
-    for iz in range(zres):
-        image = stack[iz,:,:]
-        im = Image.fromarray(image)
-        im.save('{}-{:05d}.png'.format(output_prefix, iz))
 
 
+def H52Tiff(stack, output_prefix, slab_size=16, nthreads=1, compression=None, dataset=None):
+    return ExportSlices(stack, output_prefix, 'tif', slab_size, nthreads, compression, dataset)
+
+
+
+def H52PNG(stack, output_prefix, slab_size=16, nthreads=1, compression=None, dataset=None):
+    return ExportSlices(stack, output_prefix, 'png', slab_size, nthreads, compression, dataset)
+
+
+
+def ImageToSlice(image, dtype):
+    # pack rgb into ids for integer types, average the channels for uint8
+    if len(image.shape) == 3 and dtype == np.uint8:
+        return (image[:,:,:3].astype(np.uint16).sum(axis=2) / 3).astype(np.uint8)
+    elif len(image.shape) == 3:
+        return (image[:,:,0].astype(dtype) << 16) | (image[:,:,1].astype(dtype) << 8) | image[:,:,2].astype(dtype)
+    else:
+        return image.astype(dtype)
 
-def PNG2H5(directory, filename, dataset, dtype=np.int32):
-    # get all of the png files
-    png_files = sorted(os.listdir(directory))
 
-    # what is the size of the output file
-    zres = len(png_files)
-    for iz, png_filename in enumerate(png_files):
-        im = np.array(Image.open('{}/{}'.format(directory, png_filename)))
 
-        # create the output if this is the first slice
-        if not iz:
-            if len(im.shape) == 2: yres, xres = im.shape
-            else: yres, xres, _ = im.shape
+def DecodeSlice(args):
+    filename, dtype = args
+    from PIL import Image
+    return ImageToSlice(np.array(Image.open(filename)), dtype)
 
-        h5output = np.zeros((zres, yres, xres), dtype=dtype)
 
-        # add this element
-        if len(im.shape) == 3 and dtype == np.int32: h5output[iz,:,:] = 65536 * im[:,:,0] + 256 * im[:,:,1] + im[:,:,2]
-        elif len(im.shape) == 3 and dtype == np.uint8: h5output[iz,:,:] = ((im[:,:,0].astype(np.uint16) + im[:,:,1].astype(np.uint16) + im[:,:,2].astype(np.uint16)) / 3).astype(np.uint8)
-        else: h5output[iz,:,:] = im[:,:]
 
-        WriteH5File(h5output, filename, dataset)
+def ImagesToH5(filenames, filename, dataset, dtype=np.int32, slab_size=16, nthreads=1, compression=True):
+    # decode the images in a thread pool and append them slab by slab to a chunked dataset
+    zres = len(filenames)
+    yres, xres = DecodeSlice((filenames[0], dtype)).shape
+    slab_size = max(1, min(slab_size, zres))
+
+    pool = ThreadPool(nthreads) if nthreads > 1 else None
+    def DecodeSlab(iz):
+        jobs = [(image_filename, dtype) for image_filename in filenames[iz:iz + slab_size]]
+        # decode the next slab while the current one is written
+        if pool is None: return map(DecodeSlice, jobs)
+        else: return pool.map_async(DecodeSlice, jobs)
+
+    def Slabs():
+        slab = DecodeSlab(0)
+        for iz in range(0, zres, slab_size):
+            slices = slab if pool is None else slab.get()
+            if iz + slab_size < zres: slab = DecodeSlab(iz + slab_size)
+            yield np.stack(slices)
+
+    # chunks are aligned to the slabs so they are compressed in parallel as well
+    chunks = (slab_size, min(yres, 256), min(xres, 256))
+    WriteH5File(Slabs(), filename, dataset, compression, chunks, nthreads=nthreads, shape=(zres, yres, xres), dtype=dtype)
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+
+
+def PNG2H5(directory, filename, dataset, dtype=np.int32, slab_size=16, nthreads=1):
+    # get all of the png files
+    png_files = sorted(os.listdir(directory))
+
+    ImagesToH5(['{}/{}'.format(directory, png_filename) for png_filename in png_files], filename, dataset, dtype, slab_size, nthreads)
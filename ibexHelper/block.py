@@ -0,0 +1,326 @@
+import os
+import shutil
+import struct
+import multiprocessing
+from fractions import Fraction
+
+import numpy as np
+import h5py
+from scipy.spatial import cKDTree
+
+from ibex.transforms.seg2seg import DownsampleMapping
+from ibex.skeletonization.generate_skeletons import TopologicalThinning, TEASER, MedialAxis, FindEdges
+from skel import CreateMetaFile
+
+# block layout
+##################
+def BlockAlignment(in_res, out_res):
+    """
+    Returns the number of voxels per axis that block boundaries must be a multiple of so
+    that every block starts on a downsampled cell (the numerator of out_res / in_res)
+    """
+    return [Fraction(int(out_res[dim]), int(in_res[dim])).numerator for dim in range(3)]
+
+def BlockGrid(shape, block_size, overlap, in_res, out_res):
+    """
+    Splits a volume into blocks whose cores partition the volume
+    Args:
+        shape (tuple): volume size (z, y, x) in voxels
+        block_size (tuple): core size (z, y, x) in voxels, rounded to the block alignment
+        overlap (int): number of downsampled cells read on each side of the core
+    Returns a list of dicts with the core and read ranges (start, stop) per axis
+    """
+    alignment = BlockAlignment(in_res, out_res)
+    step = [max(alignment[dim], block_size[dim] // alignment[dim] * alignment[dim]) for dim in range(3)]
+    # overlap in voxels, rounded up to the block alignment
+    margin = [-(-int(np.ceil(overlap * float(out_res[dim]) / in_res[dim])) // alignment[dim]) * alignment[dim] for dim in range(3)]
+
+    blocks = []
+    for z0 in range(0, shape[0], step[0]):
+        for y0 in range(0, shape[1], step[1]):
+            for x0 in range(0, shape[2], step[2]):
+                start = (z0, y0, x0)
+                core = [(start[dim], min(start[dim] + step[dim], shape[dim])) for dim in range(3)]
+                read = [(max(0, core[dim][0] - margin[dim]), min(shape[dim], core[dim][1] + margin[dim])) for dim in range(3)]
+                blocks.append({'index': len(blocks), 'core': core, 'read': read})
+    return blocks
+
+def DownsampleOffset(voxel, in_res, out_res, dim):
+    # downsampled cell of an aligned voxel coordinate
+    return int(Fraction(int(voxel)) / Fraction(int(out_res[dim]), int(in_res[dim])))
+
+# block skeletons
+##################
+def ReadPointFile(filename):
+    # returns the elements of every label in a .pts (or .bytes) file
+    data = np.fromfile(filename, dtype=np.int64)
+    max_label = data[3]
+    elements, offset = [], 4
+    for label in range(max_label):
+        nelements = data[offset]
+        elements.append(data[offset + 1:offset + 1 + nelements])
+        offset += 1 + nelements
+    return tuple(data[:3]), elements
+
+def ReadEdgeFile(filename):
+    # returns the (sources, targets) of every label in a .edges file
+    data = np.fromfile(filename, dtype=np.int64)
+    max_label = data[3]
+    edges, offset = [], 4
+    for label in range(max_label):
+        nedges = data[offset]
+        edges.append((data[offset + 1:offset + 1 + nedges], data[offset + 1 + nedges:offset + 1 + 2 * nedges]))
+        offset += 1 + 2 * nedges
+    return edges
+
+def SkeletonFilenames(prefix, algorithm, out_res, astar_expansion=0):
+    res = '%03dx%03dx%03d' % (out_res[2], out_res[1], out_res[0])
+    return {'downsample': '%s/%s-%s-downsample-skeleton.pts' % (prefix, algorithm, res),
+            'upsample': '%s/%s-%s-upsample-%02d-skeleton.pts' % (prefix, algorithm, res, int(10 * astar_expansion)),
+            'vectors': '%s/%s-%s-endpoint-vectors.vec' % (prefix, algorithm, res),
+            'edges': '%s/%s-%s-upsample-skeleton.edges' % (prefix, algorithm, res)}
+
+def SkeletonizeVolume(prefix, segment, in_res, out_res, algorithm='thinning', astar_expansion=0):
+    """
+    Runs the skeleton stages that the stitching needs on an in-memory segmentation
+    """
+    if not os.path.exists(prefix):
+        os.makedirs(prefix)
+    # medial axis and teaser read their input from skeletons/<prefix>
+    if algorithm != 'thinning':
+        link = os.path.join('skeletons', prefix.lstrip(os.sep))
+        if not os.path.exists(os.path.dirname(link)):
+            os.makedirs(os.path.dirname(link))
+        if not os.path.lexists(link):
+            os.symlink(os.path.relpath(os.path.abspath(prefix), os.path.abspath(os.path.dirname(link))), link)
+    CreateMetaFile(in_res, segment.shape, prefix)
+
+    DownsampleMapping(prefix, segment, output_resolution=out_res)
+    if algorithm == 'thinning':
+        TopologicalThinning(prefix, segment, skeleton_resolution=out_res, astar_expansion=astar_expansion)
+    elif algorithm == 'teaser':
+        TEASER(prefix, segment, skeleton_resolution=out_res, astar_expansion=astar_expansion)
+    elif algorithm == 'medial-axis':
+        MedialAxis(prefix, segment, skeleton_resolution=out_res, astar_expansion=astar_expansion)
+    else:
+        raise ValueError('unknown skeleton algorithm %s' % algorithm)
+    FindEdges(prefix, skeleton_resolution=out_res, skeleton_algorithm=algorithm)
+
+def SkeletonizeBlock(job):
+    """
+    Reads one block from the HDF5 file, skeletonizes it and returns its owned fragments
+    Returns the block and a dict from label to (up_index, down_coordinates, up_coordinates,
+    owned, sources, targets) with global indices and coordinates, the ownership of every
+    point and the edges (as point positions) that have at least one owned point
+    """
+    block, filename, dataset, shape, in_res, out_res, algorithm, astar_expansion, block_folder = job
+    read, core = block['read'], block['core']
+
+    with h5py.File(filename, 'r') as fid:
+        segment = np.array(fid[dataset][read[0][0]:read[0][1], read[1][0]:read[1][1], read[2][0]:read[2][1]])
+
+    # relabel to consecutive ids so the per label arrays stay small
+    labels = np.unique(segment)
+    if not labels.size or labels[0] != 0:
+        labels = np.concatenate([[0], labels])
+    if labels.size == 1:
+        return block, {}
+    segment = np.searchsorted(labels, segment).astype(np.int64)
+
+    prefix = os.path.join(block_folder, '%06d' % block['index'])
+    SkeletonizeVolume(prefix, segment, in_res, out_res, algorithm, astar_expansion)
+
+    filenames = SkeletonFilenames(prefix, algorithm, out_res, astar_expansion)
+    down_grid, down_elements = ReadPointFile(filenames['downsample'])
+    _, up_elements = ReadPointFile(filenames['upsample'])
+    edges = ReadEdgeFile(filenames['edges'])
+    if algorithm != 'thinning':
+        os.remove(os.path.join('skeletons', prefix.lstrip(os.sep)))
+    shutil.rmtree(prefix)
+
+    # offsets from the block to the global grids
+    read_offset = np.array([read[dim][0] for dim in range(3)])
+    down_offset = np.array([DownsampleOffset(read[dim][0], in_res, out_res, dim) for dim in range(3)])
+    core_start = np.array([DownsampleOffset(core[dim][0], in_res, out_res, dim) for dim in range(3)])
+    core_stop = np.array([DownsampleOffset(core[dim][1], in_res, out_res, dim) if core[dim][1] < shape[dim] else np.iinfo(np.int64).max for dim in range(3)])
+    block_shape = segment.shape
+
+    fragments = {}
+    for label in range(1, len(up_elements)):
+        if not up_elements[label].size:
+            continue
+        down_index = np.abs(down_elements[label])
+        down_coordinates = np.stack(np.unravel_index(down_index, down_grid), axis=1) + down_offset
+        up_coordinates = np.stack(np.unravel_index(np.abs(up_elements[label]), block_shape), axis=1) + read_offset
+        up_index = np.ravel_multi_index(up_coordinates.T, shape)
+
+        # a point belongs to the block whose core contains its downsampled cell
+        owned = np.all((down_coordinates >= core_start) & (down_coordinates < core_stop), axis=1)
+        if not owned.any():
+            continue
+
+        # keep the edges with at least one owned point
+        local_up = np.abs(up_elements[label])
+        order = np.argsort(local_up)
+        sources = order[np.searchsorted(local_up[order], edges[label][0])]
+        targets = order[np.searchsorted(local_up[order], edges[label][1])]
+        keep = (owned[sources] | owned[targets]) & (sources != targets)
+
+        fragments[int(labels[label])] = (up_index, down_coordinates, up_coordinates, owned, sources[keep], targets[keep])
+
+    return block, fragments
+
+# stitching
+##################
+def StitchFragments(fragments, in_res, max_distance):
+    """
+    Joins the fragments of one label from every block into one skeleton
+    Edges that cross a seam end at a point owned by the neighboring block, which is
+    replaced by the closest owned point of the label within max_distance (nm)
+    Returns the node indices, their downsampled coordinates and the edges
+    """
+    up_index = np.concatenate([fragment[0][fragment[3]] for fragment in fragments])
+    down_coordinates = np.concatenate([fragment[1][fragment[3]] for fragment in fragments])
+    up_coordinates = np.concatenate([fragment[2][fragment[3]] for fragment in fragments])
+    up_index, unique = np.unique(up_index, return_index=True)
+    down_coordinates, up_coordinates = down_coordinates[unique], up_coordinates[unique]
+
+    tree = cKDTree(up_coordinates * np.array(in_res, dtype=np.float64))
+    edges = set()
+    for fragment_index, up_fragment, coordinates, owned, sources, targets in \
+            [(ii,) + (fragment[0], fragment[2], fragment[3], fragment[4], fragment[5]) for ii, fragment in enumerate(fragments)]:
+        # every point of the fragment in the stitched skeleton
+        node = np.searchsorted(up_index, up_fragment)
+        node[~owned] = -1
+        foreign = np.unique(np.concatenate([sources[~owned[sources]], targets[~owned[targets]]]))
+        if foreign.size:
+            distances, nearest = tree.query(coordinates[foreign] * np.array(in_res, dtype=np.float64), distance_upper_bound=max_distance)
+            node[foreign] = np.where(np.isinf(distances), -1, nearest)
+        for source, target in zip(node[sources], node[targets]):
+            if source < 0 or target < 0 or source == target:
+                continue
+            edges.add((min(source, target), max(source, target)))
+
+    edges = np.array(sorted(edges), dtype=np.int64).reshape(-1, 2)
+    return up_index, down_coordinates, edges
+
+def EndpointVectors(down_coordinates, edges, endpoints):
+    # follow at most three edges from every endpoint along non-branching nodes (as in FindEndpointVector)
+    neighbors = [[] for _ in range(len(down_coordinates))]
+    for source, target in edges:
+        neighbors[source].append(target)
+        neighbors[target].append(source)
+
+    vectors = []
+    for endpoint in endpoints:
+        path = [endpoint]
+        while len(path) < 4:
+            candidates = [neighbor for neighbor in neighbors[path[-1]] if neighbor not in path]
+            if len(candidates) != 1:
+                break
+            path.append(candidates[0])
+        vector = (down_coordinates[path[0]] - down_coordinates[path[-1]]).astype(np.float64)
+        norm = np.linalg.norm(vector)
+        vectors.append(vector / norm if norm > 0 else np.zeros(3))
+    return vectors
+
+def WriteStitchedSkeletons(out_folder, shape, skeletons, max_label, algorithm, out_res, astar_expansion=0):
+    """
+    Writes the stitched skeletons as .pts (negative indices are endpoints), .vec and .edges
+    """
+    filenames = SkeletonFilenames(out_folder, algorithm, out_res, astar_expansion)
+    header = struct.pack('qqqq', shape[0], shape[1], shape[2], max_label)
+    with open(filenames['upsample'], 'wb') as pfd, open(filenames['vectors'], 'wb') as vfd, open(filenames['edges'], 'wb') as efd:
+        for fd in (pfd, vfd, efd):
+            fd.write(header)
+        for label in range(max_label):
+            if label not in skeletons:
+                for fd in (pfd, vfd, efd):
+                    fd.write(struct.pack('q', 0))
+                continue
+            up_index, down_coordinates, edges = skeletons[label]
+
+            degree = np.bincount(edges.ravel(), minlength=up_index.size)
+            endpoints = np.flatnonzero(degree <= 1)
+            elements = up_index.copy()
+            elements[endpoints] *= -1
+            pfd.write(struct.pack('q', elements.size))
+            pfd.write(elements.astype(np.int64).tobytes())
+
+            vfd.write(struct.pack('q', endpoints.size))
+            for endpoint, vector in zip(endpoints, EndpointVectors(down_coordinates, edges, endpoints)):
+                vfd.write(struct.pack('qddd', up_index[endpoint], vector[0], vector[1], vector[2]))
+
+            efd.write(struct.pack('q', edges.shape[0]))
+            efd.write(up_index[edges[:, 0]].astype(np.int64).tobytes())
+            efd.write(up_index[edges[:, 1]].astype(np.int64).tobytes())
+    return filenames
+
+def CreateSkeletonsBlockwise(filename, out_folder='temp/', dataset='main', in_res=(30, 6, 6), out_res=(80, 80, 80), \
+                             block_size=(256, 1024, 1024), overlap=4, algorithm='thinning', astar_expansion=0, nprocesses=1):
+    """
+    Skeletonizes a segmentation that does not fit in memory. Overlapping blocks are read
+    from the HDF5 file, skeletonized independently (in parallel) and the fragments of
+    every label are stitched across the block seams into one skeleton per label.
+
+    ====================
+    INPUTS:
+    ====================
+
+    filename:   HDF5 file with the segmentation in dataset (z, y, x)
+
+    block_size: Tuple of three integers, the core size of a block in voxels. Rounded so
+                that blocks start on downsampled cells.
+
+    overlap:    Number of downsampled cells read on each side of the block core. Points
+                are only kept by the block whose core contains them, the overlap lets
+                fragments see across the seam.
+
+    nprocesses: Number of blocks skeletonized in parallel.
+
+    algorithm:  'thinning' or 'medial-axis'. Both are local, so a label that is cut into
+                pieces by a block is skeletonized piece by piece. 'teaser' only follows
+                the component of its source voxel and is not suited for blocks.
+
+    ====================
+    OUTPUTS:
+    ====================
+    filenames:  The .pts, .vec and .edges files in out_folder (readable with ReadSkeletons).
+
+    """
+    if not os.path.exists(out_folder):
+        os.makedirs(out_folder)
+    block_folder = os.path.join(out_folder, 'blocks')
+
+    with h5py.File(filename, 'r') as fid:
+        shape = fid[dataset].shape
+    CreateMetaFile(in_res, shape, out_folder)
+
+    blocks = BlockGrid(shape, block_size, overlap, in_res, out_res)
+    jobs = [(block, filename, dataset, shape, in_res, out_res, algorithm, astar_expansion, block_folder) for block in blocks]
+
+    # gather the fragments of every label
+    fragments = {}
+    if nprocesses > 1:
+        pool = multiprocessing.Pool(nprocesses)
+        results = pool.imap_unordered(SkeletonizeBlock, jobs)
+    else:
+        pool = None
+        results = (SkeletonizeBlock(job) for job in jobs)
+    for block, block_fragments in results:
+        for label, fragment in block_fragments.items():
+            fragments.setdefault(label, []).append(fragment)
+    if pool is not None:
+        pool.close()
+        pool.join()
+    if os.path.isdir(block_folder):
+        shutil.rmtree(block_folder)
+
+    # seam points are matched within two downsampled cells
+    max_distance = 2 * np.linalg.norm(np.array(out_res, dtype=np.float64))
+    skeletons = {}
+    for label in fragments:
+        skeletons[label] = StitchFragments(fragments[label], in_res, max_distance)
+
+    max_label = max(fragments) + 1 if fragments else 1
+    return WriteStitchedSkeletons(out_folder, shape, skeletons, max_label, algorithm, out_res, astar_expansion)
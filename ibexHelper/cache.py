@@ -0,0 +1,177 @@
+import os
+import json
+import shutil
+import hashlib
+import cPickle as pickle
+
+import numpy as np
+
+# stage cache
+##################
+def HashArray(sha, array):
+    # hash the dtype, shape and content of an array
+    array = np.ascontiguousarray(array)
+    sha.update(str(array.dtype))
+    sha.update(str(array.shape))
+    sha.update(memoryview(array.reshape(-1).view(np.uint8)))
+
+class StageCache(object):
+    """
+    Content addressed cache for the outputs of pipeline stages. A stage is keyed by the hash
+    of its inputs (arrays, strings or the keys of earlier stages) and its parameters, so a
+    stage is only recomputed when something it depends on changed. The least recently used
+    entries are evicted once the cache grows beyond max_bytes.
+    """
+    value_filename = 'value.pkl'
+
+    def __init__(self, directory='cache/stages', max_bytes=10 * 2 ** 30):
+        """
+        Attributes:
+            directory (str): folder with one subfolder per cached stage
+            max_bytes (int): size of the cache before least recently used entries are evicted
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def key(self, stage, inputs=(), params=None):
+        """
+        Returns the key of stage for these inputs and parameters
+        Args:
+            stage (str): stage name
+            inputs (list): ndarrays, strings (e.g. earlier keys) or numbers
+            params (dict): json serializable stage parameters
+        """
+        sha = hashlib.sha1()
+        sha.update(stage)
+        for value in inputs:
+            if isinstance(value, np.ndarray):
+                HashArray(sha, value)
+            else:
+                sha.update(repr(value))
+        sha.update(json.dumps(params, sort_keys=True))
+        return sha.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def has(self, key):
+        return os.path.isdir(self.path(key))
+
+    def touch(self, key):
+        # mark the entry as recently used
+        os.utime(self.path(key), None)
+
+    def fetch_files(self, key, out_folder):
+        """copies the files cached for key to out_folder, returns False if key is not cached"""
+        if not self.has(key):
+            return False
+        # another process may evict the entry while it is copied, which is a miss
+        try:
+            for filename in os.listdir(self.path(key)):
+                shutil.copy(os.path.join(self.path(key), filename), os.path.join(out_folder, filename))
+            self.touch(key)
+        except (IOError, OSError):
+            return False
+        return True
+
+    def store_files(self, key, filenames):
+        """caches the files for key (the base names are kept)"""
+        temporary = self.path(key) + '.tmp%d' % os.getpid()
+        os.makedirs(temporary)
+        for filename in filenames:
+            shutil.copy(filename, os.path.join(temporary, os.path.basename(filename)))
+        self.commit(key, temporary)
+
+    def load(self, key, default=None):
+        """returns the object cached for key or default if key is not cached"""
+        if not self.has(key):
+            return default
+        # another process may evict the entry while it is read, which is a miss
+        try:
+            with open(os.path.join(self.path(key), self.value_filename), 'rb') as fd:
+                value = pickle.load(fd)
+            self.touch(key)
+        except (IOError, OSError):
+            return default
+        return value
+
+    def save(self, key, value):
+        """caches a picklable object for key"""
+        temporary = self.path(key) + '.tmp%d' % os.getpid()
+        os.makedirs(temporary)
+        with open(os.path.join(temporary, self.value_filename), 'wb') as fd:
+            pickle.dump(value, fd, protocol=pickle.HIGHEST_PROTOCOL)
+        self.commit(key, temporary)
+
+    def commit(self, key, temporary):
+        # entries are written to a temporary folder and renamed so they are never partial
+        if self.has(key):
+            shutil.rmtree(temporary)
+        else:
+            try:
+                os.rename(temporary, self.path(key))
+            except OSError:
+                # another process committed the same key in the meantime
+                if not self.has(key):
+                    raise
+                shutil.rmtree(temporary)
+        self.evict()
+
+    def entries(self):
+        """returns (last use, bytes, key) for every entry"""
+        entries = []
+        for prefix in os.listdir(self.directory):
+            for key in os.listdir(os.path.join(self.directory, prefix)):
+                path = os.path.join(self.directory, prefix, key)
+                if '.tmp' in key or not os.path.isdir(path):
+                    continue
+                # entries evicted by another process meanwhile are skipped
+                try:
+                    nbytes = sum(os.path.getsize(os.path.join(path, filename)) for filename in os.listdir(path))
+                    entries.append((os.path.getmtime(path), nbytes, key))
+                except OSError:
+                    continue
+        return entries
+
+    def evict(self):
+        """removes the least recently used entries until the cache fits in max_bytes"""
+        entries = sorted(self.entries())
+        total = sum(entry[1] for entry in entries)
+        for _, nbytes, key in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self.path(key), ignore_errors=True)
+            total -= nbytes
+
+    def clear(self):
+        shutil.rmtree(self.directory)
+        os.makedirs(self.directory)
+
+def CachedFiles(cache, key, out_folder, filenames, compute):
+    """
+    Runs compute() unless the files for key are cached, in which case they are copied
+    to out_folder. Returns True if the stage was skipped.
+    """
+    if cache is None:
+        compute()
+        return False
+    if cache.fetch_files(key, out_folder):
+        return True
+    compute()
+    cache.store_files(key, filenames)
+    return False
+
+# marks a cache miss, so that a cached None is a hit
+missing_value = object()
+
+def CachedValue(cache, key, compute):
+    """returns the cached value for key or computes and caches it"""
+    if cache is None:
+        return compute()
+    value = cache.load(key, missing_value)
+    if value is missing_value:
+        value = compute()
+        cache.save(key, value)
+    return value
@@ -0,0 +1,97 @@
+import numpy as np
+
+from skel2graph import GetERLArraysFromSkeleton
+
+# grouping
+##################
+def GroupKeys(keys):
+    """
+    Groups the rows of keys (a list of equally long integer arrays)
+    Returns the sorting order, the group index of every sorted entry and the
+    position of the first entry of every group in the sorted order
+    """
+    order = np.lexsort(keys[::-1])
+    if order.size == 0:
+        return order, np.zeros(0, np.int64), np.zeros(0, np.int64)
+    change = np.zeros(order.size, dtype=bool)
+    change[0] = True
+    for key in keys:
+        change[1:] |= key[order][1:] != key[order][:-1]
+    return order, np.cumsum(change) - 1, np.flatnonzero(change)
+
+# erl evaluation
+##################
+def ExpectedRunLengthFromArrays(skeleton_ids, edge_ids, lengths, segment_ids, return_stats=False):
+    """
+    Computes the expected run length of every segmentation with the rules of
+    funlib.evaluate.expected_run_length: an edge is correct if both its nodes are in the
+    same non zero segment and that segment touches no other skeleton
+
+    ====================
+    INPUTS:
+    ====================
+
+    skeleton_ids:   array (N) with the skeleton id of every node
+    edge_ids:       array (E x 2) with the nodes of every edge
+    lengths:        array (E) with the physical length of every edge
+    segment_ids:    array (S x N) with the segment id of every node in each of S segmentations
+
+    ====================
+    OUTPUTS:
+    ====================
+
+    erl:            array (S) with the expected run length of every segmentation
+    stats:          (if return_stats) dict of arrays (S) with the number of 'correct',
+                    'merged', 'split' and 'omitted' edges of every segmentation
+    """
+    segment_ids = np.atleast_2d(np.asarray(segment_ids, dtype=np.int64))
+    skeleton_ids = np.asarray(skeleton_ids, dtype=np.int64)
+    edge_ids = np.asarray(edge_ids, dtype=np.int64).reshape(-1, 2)
+    lengths = np.asarray(lengths, dtype=np.float64)
+    nsegmentations, nnodes = segment_ids.shape
+
+    # a segment merges if it holds nodes of more than one skeleton
+    rows = np.repeat(np.arange(nsegmentations), nnodes)
+    node_skeletons = np.tile(skeleton_ids, nsegmentations)
+    node_segments = segment_ids.reshape(-1)
+    order, pair_index, pair_start = GroupKeys([rows, node_segments, node_skeletons])
+    _, segment_index, segment_start = GroupKeys([rows[order][pair_start], node_segments[order][pair_start]])
+    merging = np.bincount(segment_index, minlength=segment_start.size) > 1
+    merging_nodes = np.zeros(rows.size, dtype=bool)
+    merging_nodes[order] = merging[segment_index][pair_index]
+    merging_nodes = merging_nodes.reshape(nsegmentations, nnodes)
+
+    # classify the edges of all segmentations at once
+    segment_u, segment_v = segment_ids[:, edge_ids[:, 0]], segment_ids[:, edge_ids[:, 1]]
+    omitted = (segment_u == 0) | (segment_v == 0)
+    split = ~omitted & (segment_u != segment_v)
+    merged = ~omitted & ~split & merging_nodes[:, edge_ids[:, 0]]
+    correct = ~omitted & ~split & ~merged
+
+    # length of the correct edges of every (segmentation, skeleton, segment)
+    skeleton_lengths = np.bincount(skeleton_ids[edge_ids[:, 0]], lengths, minlength=skeleton_ids.max() + 1 if skeleton_ids.size else 0)
+    total_length = skeleton_lengths.sum()
+    correct_rows, correct_edges = np.nonzero(correct)
+    correct_keys = [correct_rows, skeleton_ids[edge_ids[correct_edges, 0]], segment_u[correct_rows, correct_edges]]
+    order, run_index, run_start = GroupKeys(correct_keys)
+    run_lengths = np.bincount(run_index, lengths[correct_edges][order], minlength=run_start.size)
+
+    # every skeleton contributes its length weighted erl: (l_s / L) * sum(c^2 / l_s) = sum(c^2) / L
+    erl = np.bincount(correct_rows[order][run_start], run_lengths ** 2, minlength=nsegmentations)
+    if total_length > 0:
+        erl /= total_length
+
+    if return_stats:
+        stats = {'correct': correct.sum(axis=1), 'merged': merged.sum(axis=1), \
+                 'split': split.sum(axis=1), 'omitted': omitted.sum(axis=1)}
+        return erl, stats
+    return erl
+
+def ExpectedRunLength(nodes, edges, seg_list, res, return_stats=False):
+    """
+    Computes the expected run length of every segmentation in seg_list for the skeletons
+    given as nodes[k] (N x 3, zyx voxels) and edges[k] (E x 2, indices into nodes[k]),
+    without building a networkx graph (see ExpectedRunLengthFromArrays)
+    """
+    _, skeleton_ids, edge_ids, lengths, segment_ids = GetERLArraysFromSkeleton(nodes, edges, seg_list, res)
+    return ExpectedRunLengthFromArrays(skeleton_ids, edge_ids, lengths, segment_ids, return_stats)
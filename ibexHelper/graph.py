@@ -1,7 +1,10 @@
-import os,sys
+import os,sys,time
+from collections import OrderedDict
 import numpy as np
 import networkx as nx
 from networkx.drawing.nx_agraph import graphviz_layout
+from instrument import ProfileStage
+from cache import CachedValue
 
 # post-process graph
 #####################
@@ -129,8 +132,9 @@ def ShrinkGraph(G, threshold=[0,0], debug=False, prune_jns=True, percentile=None
         if orphan_node is not None:
             m, n = G[orphan_node].keys()
             wm, wn = G[orphan_node][m]['weight'], G[orphan_node][n]['weight']
-            # add edge between m and n
-            G.add_edge(m, n, weight=(wm+wn))
+            tm, tn = G[orphan_node][m]['thick'], G[orphan_node][n]['thick']
+            # add edge between m and n (length weighted thickness)
+            G.add_edge(m, n, weight=(wm+wn), thick=(wm*tm+wn*tn)/max(wm+wn, 1e-6))
             # delete orphan node
             G.remove_node(orphan_node)
             if path_dict is not None:
@@ -306,7 +310,32 @@ def PrintLeafWts(G):
             leaves += [G[n][adj_[0]]['weight']]
     print(sorted(leaves))
 
-def PlotGraph(G,show_wt=True,show_th=True):
+# graph layout
+#####################
+# layouts of the most recently drawn graph structures per graphviz program
+graph_layouts = OrderedDict()
+max_graph_layouts = 32
+
+def GraphLayout(G, prog='neato', cache=None):
+    """
+    Returns the graphviz layout of G. The layout only depends on the nodes and edges, so
+    it is computed once per structure and program and reused by later drawings while it is
+    among the max_graph_layouts most recently used (and by other processes if a
+    cache.StageCache is given).
+    """
+    structure = (sorted(G.nodes()), sorted(tuple(sorted(e)) for e in G.edges()))
+    key = (prog, repr(structure))
+    if key in graph_layouts:
+        # move the layout to the most recently used end
+        graph_layouts[key] = graph_layouts.pop(key)
+    else:
+        stage_key = None if cache is None else cache.key('layout', [key[1]], {'prog': prog})
+        graph_layouts[key] = CachedValue(cache, stage_key, lambda: graphviz_layout(G, prog=prog))
+        while len(graph_layouts) > max_graph_layouts:
+            graph_layouts.popitem(last=False)
+    return graph_layouts[key]
+
+def PlotGraph(G,show_wt=True,show_th=True,ax=None,sz=1,labels=False):
     if not show_wt and not show_th:
         nx.draw_networkx(G)
     else:
@@ -315,12 +344,12 @@ def PlotGraph(G,show_wt=True,show_th=True):
                                                          e[1]['thick']) for e in G.edges.items()}
         else:
             edge_dict = {e[0]: '{:.1f}'.format(e[1]['weight']) for e in G.edges.items()}
-        pos=graphviz_layout(G)
+        pos=GraphLayout(G)
         nx.draw_networkx(G, pos=pos, node_size=sz, ax=ax, with_labels=labels,
                         font_size=5, font_color='white', font_weight='bold') #, edge_color='red')        
 def DrawGraph(ax, edgelist, sz=1, labels=False, weighted=False, threshold=1.0, show_th=False, \
              show_wts=False, save_graphx=False, gx_dir=None, seg_id=None, percentile=None, \
-             percent=None, prune_jns=True, is_tree=False):
+             percent=None, prune_jns=True, is_tree=False, cache=None, graph_key=None):
    
     def ShrinkGraph(G, threshold, debug=False, prune_jns=True):
         """ 
@@ -412,7 +441,7 @@ def DrawGraph(ax, edgelist, sz=1, labels=False, weighted=False, threshold=1.0, s
     G = nx.Graph()
     if not weighted:
         G.add_edges_from(edgelist)
-        pos=graphviz_layout(G)
+        pos=GraphLayout(G)
         nx.draw_networkx(G, pos=pos, node_size=sz, ax=ax, with_labels=labels,
                         font_size=8, font_color='white', font_weight='bold', edge_color='red')    
     else:
@@ -420,30 +449,39 @@ def DrawGraph(ax, edgelist, sz=1, labels=False, weighted=False, threshold=1.0, s
         
         t0_shrink = time.time()
 
-        if is_tree:
-            if True:
-                factor = 5.0**(-3)
-                wt = GetWt(G)
-                t = factor*wt
-                G = MergeTwoEdges(G)
-
-                q0 = 20
-                t0 = GetLeafPercentile(G, perc=q0)
-                print('Original {:.0f}%ile weight {:.2f}'.format(q0, t0))
-                for p in [25, 40, 80, 40, 20]:
-                    t = GetLeafPercentile(G, perc=p)
-                    G = DeLeaf(G, thresh=t)
+        def Shrink(G):
+            if is_tree:
+                if True:
+                    factor = 5.0**(-3)
+                    wt = GetWt(G)
+                    t = factor*wt
                     G = MergeTwoEdges(G)
 
-                G = ShrinkGraph(G, threshold=t0, prune_jns=True)
-                G = DeLeaf(G, thresh=t0)
-                G = MergeTwoEdges(G)
-                max_n, max_deg = GetMaxDegree(G)
+                    q0 = 20
+                    t0 = GetLeafPercentile(G, perc=q0)
+                    print('Original {:.0f}%ile weight {:.2f}'.format(q0, t0))
+                    for p in [25, 40, 80, 40, 20]:
+                        t = GetLeafPercentile(G, perc=p)
+                        G = DeLeaf(G, thresh=t)
+                        G = MergeTwoEdges(G)
 
-                if max_n in G.nodes.keys():
-                    AddCenter(G, max_n)
-        else:
-            G = ShrinkGraph(G, threshold=threshold, prune_jns=True)
+                    G = ShrinkGraph(G, threshold=t0, prune_jns=True)
+                    G = DeLeaf(G, thresh=t0)
+                    G = MergeTwoEdges(G)
+                    max_n, max_deg = GetMaxDegree(G)
+
+                    if max_n in G.nodes.keys():
+                        AddCenter(G, max_n)
+            else:
+                G = ShrinkGraph(G, threshold=threshold, prune_jns=True)
+            return G
+
+        # the shrunk graph only depends on the edge list (graph_key) and the shrinking parameters
+        shrink_key = None
+        if cache is not None and graph_key is not None:
+            shrink_key = cache.key('shrink', [graph_key], {'threshold': threshold, 'prune_jns': prune_jns, \
+                                                           'percentile': percentile, 'is_tree': is_tree})
+        G = CachedValue(cache, shrink_key, lambda: Shrink(G))
 
         if save_graphx:
             nx.write_gpickle(G, os.path.join(gx_dir, str(seg_id) + '_networkx.obj'))
@@ -453,7 +491,7 @@ def DrawGraph(ax, edgelist, sz=1, labels=False, weighted=False, threshold=1.0, s
                                                          e[1]['thick']) for e in G.edges.items()}
         else:
             edge_dict = {e[0]: '{:.1f}'.format(e[1]['weight']) for e in G.edges.items()}
-        pos=graphviz_layout(G)
+        pos=GraphLayout(G)
         nx.draw_networkx(G, pos=pos, node_size=sz, ax=ax, with_labels=labels,
                         font_size=5, font_color='white', font_weight='bold') #, edge_color='red')    
         if show_wts:
@@ -463,7 +501,7 @@ def MakeAndPlotGraph(voxel_dir, seg_id, graph_dir='./', threshold=0.0, show_grap
                      save_graph=True, skel=None, dt=None, use_dt=False, show_orig=False, \
                     gx_dir=None, save_graphx=False, percentile=None, in_res=(30,30,30), \
                     out_res=(30,30,30), show_wts=False, return_graph=False, prune_jns=True, \
-                    modified_bfs=True):
+                    modified_bfs=True, profile=None, cache=None):
     """
     ==================================================
     INPUTS
@@ -508,6 +546,13 @@ def MakeAndPlotGraph(voxel_dir, seg_id, graph_dir='./', threshold=0.0, show_grap
     prune_jns:      Boolean. True for Pyramidal Cells and False for Mitochondria. If True then even those
                     edges, both of whose ends are Key Nodes, will be collapsed if they are shorter than
                     threshold.
+
+    profile:        instrument.Profile object. If given, the timing of every stage is recorded in it
+                    for label seg_id.
+
+    cache:          cache.StageCache object. If given, the edge list of the graph is reused when the
+                    same skeleton (and distance transform) was converted before, and the shrunk
+                    graph when it was also shrunk with the same parameters.
     """
     
     is_tree = False
@@ -516,51 +561,66 @@ def MakeAndPlotGraph(voxel_dir, seg_id, graph_dir='./', threshold=0.0, show_grap
     
     # Create skeleton from voxels
     if skel is None:
-        if use_dt:
-            skel, dt = CreateSkeleton(voxel_dir, seg_id, return_dt=True, \
-                                     in_res=in_res, out_res=out_res)
-        else:
-            skel = CreateSkeleton(voxel_dir, seg_id, return_dt=False, \
-                                     in_res=in_res, out_res=out_res)
+        with ProfileStage(profile, 'skeleton', label=seg_id):
+            if use_dt:
+                skel, dt = CreateSkeleton(voxel_dir, seg_id, return_dt=True, \
+                                         in_res=in_res, out_res=out_res)
+            else:
+                skel = CreateSkeleton(voxel_dir, seg_id, return_dt=False, \
+                                         in_res=in_res, out_res=out_res)
     # Create graph from skeleton
-    t0_gr = time.time()
-    new_graph, wt_dict, th_dict = GetGraphFromSkeleton(skel, dt=dt, \
-                                                       modified_bfs=modified_bfs)
-    print('Graph generated in {:.3f}s'.format(time.time() - t0_gr))
+    def CreateEdgeList():
+        t0_gr = time.time()
+        with ProfileStage(profile, 'graph', label=seg_id):
+            new_graph, wt_dict, th_dict, _ = GetGraphFromSkeleton(skel, dt=dt, \
+                                                                  modified_bfs=modified_bfs)
+        print('Graph generated in {:.3f}s'.format(time.time() - t0_gr))
+        with ProfileStage(profile, 'edgelist', label=seg_id):
+            return GetEdgeList(new_graph, wt_dict, th_dict)
+
+    graph_key = None
+    if cache is not None:
+        inputs = [skel.get_nodes(), skel.get_edges()]
+        if dt is not None:
+            inputs.append(np.asarray(dt))
+        graph_key = cache.key('graph', inputs, {'modified_bfs': modified_bfs})
     
     # Create edge_lists to be used for plotting graph
     t0_ed = time.time()
-    edgelist_new = GetEdgeList(new_graph, wt_dict, th_dict)
+    edgelist_new = CachedValue(cache, graph_key, CreateEdgeList)
     if show_orig:
-        edgelist_orig = GetEdgeList(GetAdjDict(sh.get_adj(skel)))
+        with ProfileStage(profile, 'edgelist', label=seg_id):
+            edgelist_orig = GetEdgeList(GetAdjDict(sh.get_adj(skel)))
     print('Retrieved edgelists for plotting in {:.3f}s'.format(time.time() - t0_ed))
     
-    if show_graph:
-        if show_orig:
-            fig, ax = plt.subplots(2,1)
-            DrawGraph(ax[0], edgelist_orig, sz=10) 
-            ax[0].set_title('Skeleton Graph (All Nodes)', fontsize=14, fontweight='bold');
-            DrawGraph(ax[1], edgelist_new, weighted=True, threshold=threshold, gx_dir=gx_dir, \
-                     seg_id=seg_id, save_graphx=save_graphx, show_wts=show_wts, percentile=percentile, \
-                     prune_jns=prune_jns, is_tree=is_tree)
-            ax[1].set_title('Skeleton Graph (Only Junction Nodes)', fontsize=14, fontweight='bold');
-            for i in [0,1]:
-                ax[i].get_xaxis().set_visible(False)
-                ax[i].get_yaxis().set_visible(False)
-            fig.set_size_inches(18, 14)
-        else:
-            fig, ax = plt.subplots()
-            print('Plotting graph..', is_tree)
-            DrawGraph(ax, edgelist_new, weighted=True, threshold=threshold, gx_dir=gx_dir, \
-                     seg_id=seg_id, save_graphx=save_graphx, show_wts=show_wts, percentile=percentile, \
-                     prune_jns=prune_jns, is_tree=is_tree)
-            ax.set_title('Skeleton Graph (Only Junction Nodes)', fontsize=14, fontweight='bold');
-            ax.get_xaxis().set_visible(False)
-            ax.get_yaxis().set_visible(False)
-            fig.set_size_inches(18, 7)
-        if save_graph:
-            fig.savefig(os.path.join(graph_dir, 'graph' + str(seg_id) + \
-                                     '_thresh_{:.1f}.png'.format(threshold)))
+    with ProfileStage(profile, 'plot', label=seg_id):
+        if show_graph:
+            import matplotlib.pyplot as plt
+            if show_orig:
+                fig, ax = plt.subplots(2,1)
+                DrawGraph(ax[0], edgelist_orig, sz=10) 
+                ax[0].set_title('Skeleton Graph (All Nodes)', fontsize=14, fontweight='bold');
+                DrawGraph(ax[1], edgelist_new, weighted=True, threshold=threshold, gx_dir=gx_dir, \
+                         seg_id=seg_id, save_graphx=save_graphx, show_wts=show_wts, percentile=percentile, \
+                         prune_jns=prune_jns, is_tree=is_tree, cache=cache, graph_key=graph_key)
+                ax[1].set_title('Skeleton Graph (Only Junction Nodes)', fontsize=14, fontweight='bold');
+                for i in [0,1]:
+                    ax[i].get_xaxis().set_visible(False)
+                    ax[i].get_yaxis().set_visible(False)
+                fig.set_size_inches(18, 14)
+            else:
+                fig, ax = plt.subplots()
+                print('Plotting graph..', is_tree)
+                DrawGraph(ax, edgelist_new, weighted=True, threshold=threshold, gx_dir=gx_dir, \
+                         seg_id=seg_id, save_graphx=save_graphx, show_wts=show_wts, percentile=percentile, \
+                         prune_jns=prune_jns, is_tree=is_tree, cache=cache, graph_key=graph_key)
+                ax.set_title('Skeleton Graph (Only Junction Nodes)', fontsize=14, fontweight='bold');
+                ax.get_xaxis().set_visible(False)
+                ax.get_yaxis().set_visible(False)
+                fig.set_size_inches(18, 7)
+            if save_graph:
+                fig.savefig(os.path.join(graph_dir, 'graph' + str(seg_id) + \
+                                         '_thresh_{:.1f}.png'.format(threshold)))
     if return_graph:
         G = nx.Graph()
         G.add_edges_from(edgelist_new)
@@ -0,0 +1,212 @@
+import multiprocessing
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+# compact graphs
+##################
+def GraphArrays(G):
+    """
+    Returns the number of nodes, the degree of every node and the edges (E x 2, node
+    indices in [0, N)) of G, which are cheap to pickle and to compare
+    """
+    index = dict((node, i) for i, node in enumerate(G.nodes()))
+    edges = np.array([[index[u], index[v]] for u, v in G.edges() if u != v], dtype=np.int64).reshape(-1, 2)
+    degrees = np.bincount(edges.reshape(-1), minlength=len(index)).astype(np.int64)
+    return len(index), degrees, edges
+
+def GraphSignature(arrays, nspectrum=16):
+    """
+    Returns the cheap invariants of a graph used to filter pairs before the assignment:
+    node and edge counts, degree histogram and the nspectrum largest Laplacian eigenvalues
+    """
+    nnodes, degrees, edges = arrays
+    laplacian = np.diag(degrees.astype(np.float64))
+    np.add.at(laplacian, (edges[:, 0], edges[:, 1]), -1)
+    np.add.at(laplacian, (edges[:, 1], edges[:, 0]), -1)
+    spectrum = np.zeros(nspectrum)
+    if nnodes:
+        eigenvalues = np.linalg.eigvalsh(laplacian)[::-1][:nspectrum]
+        spectrum[:eigenvalues.size] = eigenvalues
+    return {'nodes': nnodes, 'edges': edges.shape[0], 'degree_histogram': np.bincount(degrees), 'spectrum': spectrum}
+
+# prefilters
+##################
+def DegreeHistogramDistance(signature1, signature2):
+    # l1 distance between the degree histograms
+    histogram1, histogram2 = signature1['degree_histogram'], signature2['degree_histogram']
+    size = max(histogram1.size, histogram2.size)
+    return np.abs(np.pad(histogram1, (0, size - histogram1.size), 'constant') - np.pad(histogram2, (0, size - histogram2.size), 'constant')).sum()
+
+def SpectralDistance(signature1, signature2):
+    # l2 distance between the largest Laplacian eigenvalues
+    return np.linalg.norm(signature1['spectrum'] - signature2['spectrum'])
+
+def CountLowerBound(nnodes1, nedges1, nnodes2, nedges2, node_cost=1.0, edge_cost=1.0):
+    # every missing node and edge has to be inserted
+    return node_cost * abs(nnodes1 - nnodes2) + edge_cost * abs(nedges1 - nedges2)
+
+# approximate graph edit distance
+##################
+def StructuralOrder(arrays):
+    # nodes sorted by degree, nodes of equal degree in breadth first (Cuthill-McKee) order
+    nnodes, degrees, edges = arrays
+    adjacency = coo_matrix((np.ones(edges.shape[0]), (edges[:, 0], edges[:, 1])), shape=(nnodes, nnodes)).tocsr()
+    rank = np.empty(nnodes, dtype=np.int64)
+    rank[reverse_cuthill_mckee(adjacency, symmetric_mode=False)] = np.arange(nnodes)
+    return np.lexsort((rank, degrees))
+
+def DegreeAssignment(degrees1, degrees2, node_cost=1.0, edge_cost=1.0):
+    """
+    Solves the assignment of sorted degrees1 (n1 >= n2) to sorted degrees2 where a
+    substitution costs half the degree difference and every node of degrees1 that is not
+    substituted is deleted at node_cost plus half its incident edges
+    Returns the cost and the pairs (i, j) of substituted nodes
+    """
+    n1, n2 = degrees1.size, degrees2.size
+    deletion = node_cost + 0.5 * edge_cost * degrees1
+    # the costs only depend on the degrees, so an optimal assignment never crosses and
+    # the n1 x n2 dynamic program replaces the (n1 + n2) x (n1 + n2) assignment problem
+    cost = np.full(n2 + 1, np.inf)
+    cost[0] = 0
+    substituted = np.zeros((n1, n2 + 1), dtype=bool)
+    for i in range(n1):
+        substitution = np.full(n2 + 1, np.inf)
+        substitution[1:] = cost[:-1] + 0.5 * edge_cost * np.abs(degrees1[i] - degrees2)
+        cost += deletion[i]
+        substituted[i] = substitution < cost
+        cost = np.minimum(cost, substitution)
+
+    pairs = []
+    j = n2
+    for i in range(n1 - 1, -1, -1):
+        if substituted[i, j]:
+            j -= 1
+            pairs.append((i, j))
+    return cost[n2], np.array(pairs[::-1], dtype=np.int64).reshape(-1, 2)
+
+def ApproximateGED(arrays1, arrays2, node_cost=1.0, edge_cost=1.0):
+    """
+    Bounds the graph edit distance (unit node and edge insertion/deletion costs, free
+    substitution of unlabeled elements) with the bipartite assignment of Riesen and Bunke
+
+    ====================
+    INPUTS:
+    ====================
+
+    arrays1, arrays2:   Compact graphs from GraphArrays (or networkx graphs).
+    node_cost:          Cost of inserting or deleting a node.
+    edge_cost:          Cost of inserting or deleting an edge.
+
+    ====================
+    OUTPUTS:
+    ====================
+
+    lower:  Lower bound, the assignment cost with half of the incident edge costs per node.
+    upper:  Upper bound, the exact edit cost of the node mapping found by the assignment.
+
+    """
+    if not isinstance(arrays1, tuple): arrays1 = GraphArrays(arrays1)
+    if not isinstance(arrays2, tuple): arrays2 = GraphArrays(arrays2)
+    # the costs are symmetric, so the larger graph is the one losing nodes
+    if arrays1[0] < arrays2[0]: arrays1, arrays2 = arrays2, arrays1
+    n1, degrees1, edges1 = arrays1
+    n2, degrees2, edges2 = arrays2
+    if n1 + n2 == 0:
+        return 0.0, 0.0
+
+    order1, order2 = StructuralOrder(arrays1), StructuralOrder(arrays2)
+    lower, pairs = DegreeAssignment(degrees1[order1], degrees2[order2], node_cost, edge_cost)
+
+    # edit cost of the mapping: unmatched nodes and edges that are not preserved
+    mapping = -np.ones(n1, dtype=np.int64)
+    mapping[order1[pairs[:, 0]]] = order2[pairs[:, 1]]
+    preserved = 0
+    if edges1.shape[0] and edges2.shape[0]:
+        mapped = mapping[edges1]
+        mapped = mapped[(mapped >= 0).all(axis=1)]
+        keys2 = set((edges2.min(axis=1) * n2 + edges2.max(axis=1)).tolist())
+        preserved = sum(key in keys2 for key in (mapped.min(axis=1) * n2 + mapped.max(axis=1)).tolist())
+    upper = node_cost * (n1 + n2 - 2 * pairs.shape[0]) + edge_cost * (edges1.shape[0] + edges2.shape[0] - 2 * preserved)
+    return max(lower, CountLowerBound(n1, edges1.shape[0], n2, edges2.shape[0], node_cost, edge_cost)), float(upper)
+
+# batch comparison
+##################
+# the graphs every row is compared with, set once per worker process
+compare_columns = None
+
+def InitCompare(arrays_list, signatures, options):
+    global compare_columns
+    compare_columns = (arrays_list, signatures, options)
+
+def CompareRow(job):
+    # score one graph against all graphs of the other list that pass the filters
+    row, arrays1, signature1 = job
+    arrays_list, signatures, (node_cost, edge_cost, max_distance, max_spectral, max_degree) = compare_columns
+    result = np.full((4, len(arrays_list)), np.nan)
+    for column, (arrays2, signature2) in enumerate(zip(arrays_list, signatures)):
+        result[2, column] = SpectralDistance(signature1, signature2)
+        result[3, column] = DegreeHistogramDistance(signature1, signature2)
+        bound = CountLowerBound(signature1['nodes'], signature1['edges'], signature2['nodes'], signature2['edges'], node_cost, edge_cost)
+        if (max_distance is not None and bound > max_distance) or \
+           (max_spectral is not None and result[2, column] > max_spectral) or \
+           (max_degree is not None and result[3, column] > max_degree):
+            result[0, column] = bound
+            continue
+        result[0, column], result[1, column] = ApproximateGED(arrays1, arrays2, node_cost, edge_cost)
+    return row, result
+
+def CompareGraphs(graphs1, graphs2=None, node_cost=1.0, edge_cost=1.0, max_distance=None, max_spectral=None, \
+                  max_degree=None, nspectrum=16, nprocesses=1):
+    """
+    Scores every pair of graphs1 x graphs2 (e.g. reduced skeleton graphs from ShrinkGraph)
+    with the approximate graph edit distance. Pairs are filtered with cheap invariants
+    first so that only promising pairs pay for the assignment.
+
+    ====================
+    INPUTS:
+    ====================
+
+    graphs1, graphs2:   Lists of networkx graphs. graphs2 defaults to graphs1.
+    node_cost:          Cost of inserting or deleting a node.
+    edge_cost:          Cost of inserting or deleting an edge.
+    max_distance:       Pairs whose node/edge count bound exceeds this are not assigned.
+    max_spectral:       Pairs whose spectral distance exceeds this are not assigned.
+    max_degree:         Pairs whose degree histogram distance exceeds this are not assigned.
+    nspectrum:          Number of Laplacian eigenvalues compared by the spectral filter.
+    nprocesses:         Number of processes scoring the rows.
+
+    ====================
+    OUTPUTS:
+    ====================
+
+    scores:     Dict of N x M arrays: 'lower' and 'upper' bounds of the edit distance
+                ('upper' is nan for filtered pairs), 'spectral' and 'degree' distances.
+
+    """
+    if graphs2 is None: graphs2 = graphs1
+    # the graphs are converted and their invariants computed once, not once per pair
+    arrays1 = [GraphArrays(G) for G in graphs1]
+    arrays2 = arrays1 if graphs2 is graphs1 else [GraphArrays(G) for G in graphs2]
+    signatures1 = [GraphSignature(arrays, nspectrum) for arrays in arrays1]
+    signatures2 = signatures1 if graphs2 is graphs1 else [GraphSignature(arrays, nspectrum) for arrays in arrays2]
+
+    # the columns are sent to every process once, the jobs only carry their row
+    jobs = [(row, arrays1[row], signatures1[row]) for row in range(len(arrays1))]
+    columns = (arrays2, signatures2, (node_cost, edge_cost, max_distance, max_spectral, max_degree))
+    result = np.full((4, len(arrays1), len(arrays2)), np.nan)
+    if nprocesses > 1:
+        pool = multiprocessing.Pool(nprocesses, InitCompare, columns)
+        results = pool.imap_unordered(CompareRow, jobs)
+    else:
+        pool = None
+        InitCompare(*columns)
+        results = (CompareRow(job) for job in jobs)
+    for row, row_result in results:
+        result[:, row] = row_result
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    return {'lower': result[0], 'upper': result[1], 'spectral': result[2], 'degree': result[3]}
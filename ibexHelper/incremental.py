@@ -0,0 +1,201 @@
+import os
+import shutil
+
+import numpy as np
+
+from ibex.transforms.seg2seg import DownsampleMapping
+from ibex.skeletonization.generate_skeletons import TopologicalThinning, FindEndpointVectorsAndEdges
+from ibex.utilities.dataIO import Resolution, GridSize
+from ibex.data_structures import skeleton_points
+from block import BlockAlignment, DownsampleOffset, SkeletonFilenames
+from skel import CreateMetaFile
+
+# change detection
+##################
+def ChangedLabels(old_segment, new_segment, chunk_size=(64, 256, 256)):
+    """
+    Returns the (sorted, non-zero) labels whose voxels differ between two segmentations
+    The volumes (arrays or HDF5 datasets) are compared chunk by chunk and only the
+    voxels of chunks that differ are inspected
+    """
+    if tuple(old_segment.shape) != tuple(new_segment.shape):
+        raise ValueError('segmentations of shape %s and %s cannot be compared' % (old_segment.shape, new_segment.shape))
+    shape = new_segment.shape
+    changed = set()
+    for z0 in range(0, shape[0], chunk_size[0]):
+        for y0 in range(0, shape[1], chunk_size[1]):
+            for x0 in range(0, shape[2], chunk_size[2]):
+                chunk = (slice(z0, z0 + chunk_size[0]), slice(y0, y0 + chunk_size[1]), slice(x0, x0 + chunk_size[2]))
+                old_chunk, new_chunk = np.asarray(old_segment[chunk]), np.asarray(new_segment[chunk])
+                diff = old_chunk != new_chunk
+                if not diff.any():
+                    continue
+                changed.update(np.unique(old_chunk[diff]).tolist())
+                changed.update(np.unique(new_chunk[diff]).tolist())
+    changed.discard(0)
+    return np.array(sorted(changed), dtype=np.int64)
+
+def LabelCrop(segment, labels, in_res, out_res, margin=2):
+    """
+    Returns the (start, stop) per axis of the box around the voxels of labels, grown by
+    margin downsampled cells and aligned so that it starts on a downsampled cell, or None
+    if none of the labels is in segment
+    """
+    mask = np.isin(segment, labels)
+    if not mask.any():
+        return None
+    alignment = BlockAlignment(in_res, out_res)
+    crop = []
+    for dim in range(3):
+        axes = tuple(axis for axis in range(3) if axis != dim)
+        occupied = np.flatnonzero(mask.any(axis=axes))
+        # margin in voxels, rounded up to the alignment
+        pad = -(-int(np.ceil(margin * float(out_res[dim]) / in_res[dim])) // alignment[dim]) * alignment[dim]
+        start = max(0, (occupied[0] - pad) // alignment[dim] * alignment[dim])
+        stop = min(segment.shape[dim], occupied[-1] + 1 + pad)
+        crop.append((int(start), int(stop)))
+    return crop
+
+# splice
+##################
+# words (int64) per element and the stride of the indices in an element for every file
+RECORD_LAYOUT = {'pts': (1, 1), 'bytes': (1, 1), 'vec': (4, 4), 'edges': (2, 1)}
+
+def ReadLabelRecords(filename, words=1):
+    """
+    Returns the header and the raw int64 record of every label in a .pts, .bytes, .vec
+    or .edges file (a record holds nelements * words values)
+    """
+    data = np.fromfile(filename, dtype=np.int64)
+    records, offset = [], 4
+    for label in range(data[3]):
+        nelements = data[offset]
+        records.append(data[offset + 1:offset + 1 + words * nelements])
+        offset += 1 + words * nelements
+    return data[:4], records
+
+def CropToVolume(indices, crop_shape, offset, shape):
+    # linear indices of a crop to the volume, the sign (endpoint flag) is kept
+    sign = np.where(indices < 0, -1, 1)
+    coordinates = np.unravel_index(np.abs(indices), crop_shape)
+    return sign * np.ravel_multi_index([coordinates[dim] + offset[dim] for dim in range(3)], shape)
+
+def SpliceLabelFile(filename, update_filename, labels, update_labels, max_label, offset):
+    """
+    Replaces the records of labels in filename with the records of update_labels (their
+    ids in update_filename), moved by offset into the grid of filename
+    """
+    words, stride = RECORD_LAYOUT[os.path.splitext(filename)[1][1:]]
+    header, records = ReadLabelRecords(filename, words)
+    update_header, update_records = ReadLabelRecords(update_filename, words)
+
+    replaced = {}
+    for label, update_label in zip(labels, update_labels):
+        record = update_records[update_label].copy() if 0 <= update_label < len(update_records) else np.zeros(0, np.int64)
+        record[::stride] = CropToVolume(record[::stride], update_header[:3], offset, header[:3])
+        replaced[label] = record
+
+    output = [header[:3], [max_label]]
+    for label in range(max_label):
+        if label in replaced:
+            record = replaced[label]
+        elif label < len(records):
+            record = records[label]
+        else:
+            record = np.zeros(0, np.int64)
+        output += [[record.size // words], record]
+
+    temporary = filename + '.tmp%d' % os.getpid()
+    np.concatenate(output).astype(np.int64).tofile(temporary)
+    os.rename(temporary, filename)
+
+def OutputFilenames(prefix, out_res):
+    # the files of the thinning pipeline that hold one record per label
+    res = '%03dx%03dx%03d' % (out_res[2], out_res[1], out_res[0])
+    filenames = SkeletonFilenames(prefix, 'thinning', out_res)
+    filenames['downsample-skeleton'] = filenames.pop('downsample')
+    filenames['upsample-skeleton'] = filenames.pop('upsample')
+    filenames['downsample'] = '%s/downsample-%s.bytes' % (prefix, res)
+    filenames['upsample'] = '%s/upsample-%s.bytes' % (prefix, res)
+    return filenames
+
+# incremental update
+##################
+def UpdateSkeletons(segment, out_folder, in_res, out_res, changed_labels=None, old_segment=None):
+    """
+    Recomputes the thinning skeletons of the changed labels of segment and splices them
+    into the outputs of an earlier run in out_folder. The changed labels are given or
+    found by comparing segment with old_segment chunk by chunk. The labels are
+    skeletonized on an aligned crop around their voxels, so an edit only costs the size
+    of the labels it touches.
+    Returns the changed labels and the number of labels of the updated files
+    """
+    if changed_labels is None:
+        changed_labels = ChangedLabels(old_segment, segment)
+    labels = np.unique(np.asarray(changed_labels, dtype=np.int64))
+    labels = labels[labels > 0]
+    max_label = int(segment.max()) + 1
+
+    filenames = OutputFilenames(out_folder, out_res)
+    header = np.fromfile(filenames['upsample'], dtype=np.int64, count=4)
+    if tuple(header[:3]) != tuple(segment.shape):
+        raise ValueError('%s holds a segmentation of shape %s, not %s' % (out_folder, tuple(header[:3]), segment.shape))
+
+    # skeletonize the changed labels, relabeled to consecutive ids, on their crop
+    update_labels = -np.ones(labels.size, dtype=np.int64)
+    crop = LabelCrop(segment, labels, in_res, out_res)
+    update_folder = os.path.join(out_folder, 'incremental')
+    if crop is not None:
+        sub = segment[crop[0][0]:crop[0][1], crop[1][0]:crop[1][1], crop[2][0]:crop[2][1]]
+        present = np.concatenate([[0], np.intersect1d(labels, sub)])
+        sub = np.where(np.isin(sub, present), np.searchsorted(present, sub), 0).astype(np.int64)
+        update_labels = np.where(np.isin(labels, present), np.searchsorted(present, labels), -1)
+
+        if not os.path.exists(update_folder):
+            os.makedirs(update_folder)
+        CreateMetaFile(in_res, sub.shape, update_folder)
+        DownsampleMapping(update_folder, sub, output_resolution=out_res)
+        TopologicalThinning(update_folder, sub, skeleton_resolution=out_res)
+        FindEndpointVectorsAndEdges(update_folder, skeleton_algorithm='thinning', skeleton_resolution=out_res)
+        up_offset = [crop[dim][0] for dim in range(3)]
+        down_offset = [DownsampleOffset(crop[dim][0], in_res, out_res, dim) for dim in range(3)]
+    else:
+        # the changed labels were removed, their records are emptied
+        up_offset = down_offset = [0, 0, 0]
+    update_filenames = OutputFilenames(update_folder, out_res)
+
+    for name, filename in filenames.items():
+        offset = down_offset if name.startswith('downsample') else up_offset
+        update_filename = update_filenames[name] if crop is not None else filename
+        SpliceLabelFile(filename, update_filename, labels, update_labels, max_label, offset)
+
+    # the down to up mapping is rebuilt from the spliced files when it is read
+    res = '%03dx%03dx%03d' % (out_res[2], out_res[1], out_res[0])
+    mapping_filename = os.path.join(out_folder, 'down-to-up-%s.bytes' % res)
+    if os.path.exists(mapping_filename):
+        os.remove(mapping_filename)
+    if os.path.isdir(update_folder):
+        shutil.rmtree(update_folder)
+    return labels, max_label
+
+def ReadSkeletonLabels(prefix, labels, out_res):
+    """
+    Reads the thinning skeletons of only the given labels (with edges)
+    Returns a list of skeleton_points.Skeleton objects
+    """
+    filenames = OutputFilenames(prefix, out_res)
+    _, points = ReadLabelRecords(filenames['upsample-skeleton'], 1)
+    _, vectors = ReadLabelRecords(filenames['vectors'], 4)
+    _, edges = ReadLabelRecords(filenames['edges'], 2)
+    resolution, grid_size = Resolution(prefix), GridSize(prefix)
+
+    skeletons = []
+    for label in labels:
+        joints = points[label][points[label] >= 0].tolist()
+        endpoints = (-points[label][points[label] < 0]).tolist()
+        vector = vectors[label].reshape(-1, 4)
+        vector = dict(zip(vector[:, 0].tolist(), map(tuple, vector[:, 1:].copy().view(np.float64))))
+        nedges = edges[label].size // 2
+        skeletons.append(skeleton_points.Skeleton(label, joints, endpoints, vector, resolution, grid_size, \
+                                                  edges=(edges[label][:nedges].tolist(), edges[label][nedges:].tolist())))
+    return skeletons
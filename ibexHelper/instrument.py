@@ -0,0 +1,169 @@
+import os
+import csv
+import json
+import time
+import resource
+import struct
+import functools
+from contextlib import contextmanager
+
+import numpy as np
+
+# instrumentation
+##################
+def PeakRSS():
+    # peak resident set size of this process in bytes (ru_maxrss is in kilobytes on linux)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def IOBytes():
+    # bytes read and written by this process, None where /proc/self/io is unavailable
+    try:
+        with open('/proc/self/io', 'r') as fd:
+            counters = dict(line.split(':') for line in fd if ':' in line)
+        return int(counters['rchar']), int(counters['wchar'])
+    except (IOError, OSError, KeyError, ValueError):
+        return None, None
+
+def VoxelCounts(segment):
+    # number of voxels for every label in the segmentation
+    return np.bincount(segment.ravel().astype(np.int64))
+
+def ReadRunningTimes(filename):
+    # per label running times written by the ibex stages (max_label followed by doubles)
+    with open(filename, 'rb') as fd:
+        max_label, = struct.unpack('q', fd.read(8))
+        return np.fromfile(fd, dtype=np.float64, count=max_label)
+
+
+class Profile(object):
+    """
+    Collects per stage and per label timings, voxel counts, peak RSS and I/O bytes
+    """
+    stage_fields = ['stage', 'label', 'wall_time', 'cpu_time', 'voxels', 'peak_rss', 'read_bytes', 'write_bytes']
+    label_fields = ['stage', 'label', 'running_time', 'voxels']
+
+    def __init__(self, name=''):
+        """
+        Attributes:
+            name (str): name of the profiled run
+            stages (list of dict): one record per timed stage
+            labels (list of dict): one record per label and stage
+        """
+        self.name = name
+        self.stages = []
+        self.labels = []
+
+    @contextmanager
+    def stage(self, name, label=None, voxels=None):
+        """
+        Times the enclosed block as stage name
+        Args:
+            name (str): stage name
+            label (int): label the stage works on, None for whole volume stages
+            voxels (int): number of voxels processed by the stage
+        """
+        read_bytes, write_bytes = IOBytes()
+        cpu_time = time.clock()
+        start_time = time.time()
+
+        record = {'stage': name, 'label': label, 'voxels': voxels}
+        try:
+            yield record
+        finally:
+            record['wall_time'] = time.time() - start_time
+            record['cpu_time'] = time.clock() - cpu_time
+            record['peak_rss'] = PeakRSS()
+            end_read_bytes, end_write_bytes = IOBytes()
+            record['read_bytes'] = None if read_bytes is None else end_read_bytes - read_bytes
+            record['write_bytes'] = None if write_bytes is None else end_write_bytes - write_bytes
+            self.stages.append(record)
+
+    def add_labels(self, name, running_times, voxel_counts=None):
+        """
+        Adds per label running times for stage name
+        Args:
+            running_times (1D ndarray or str): running time per label or a running times file
+            voxel_counts (1D ndarray): voxels per label
+        """
+        if isinstance(running_times, basestring):
+            running_times = ReadRunningTimes(running_times)
+        for label, running_time in enumerate(running_times):
+            voxels = None
+            if voxel_counts is not None and label < len(voxel_counts):
+                voxels = int(voxel_counts[label])
+            self.labels.append({'stage': name, 'label': label, 'running_time': float(running_time), 'voxels': voxels})
+
+    def add_label_directory(self, directory, voxel_counts=None):
+        """adds every running times file in directory with the file name as stage"""
+        if not os.path.isdir(directory):
+            return
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith('.bytes'):
+                self.add_labels(filename[:-len('.bytes')], os.path.join(directory, filename), voxel_counts)
+
+    def slowest_labels(self, n=10):
+        """returns the n label records with the largest running time"""
+        return sorted(self.labels, key=lambda record: -record['running_time'])[:n]
+
+    def summary(self):
+        """returns the total wall time per stage"""
+        totals = {}
+        for record in self.stages:
+            totals[record['stage']] = totals.get(record['stage'], 0.0) + record['wall_time']
+        return totals
+
+    def to_dict(self):
+        return {'name': self.name, 'peak_rss': PeakRSS(), 'stages': self.stages, 'labels': self.labels}
+
+    def write_json(self, filename):
+        with open(filename, 'w') as fd:
+            json.dump(self.to_dict(), fd, indent=2)
+
+    def write_csv(self, filename):
+        """
+        Writes the stage records to filename and the label records to
+        filename with a -labels suffix
+        """
+        root, ext = os.path.splitext(filename)
+        for output_filename, fields, records in [(filename, self.stage_fields, self.stages), \
+                                                 (root + '-labels' + ext, self.label_fields, self.labels)]:
+            with open(output_filename, 'wb') as fd:
+                writer = csv.DictWriter(fd, fieldnames=fields)
+                writer.writeheader()
+                for record in records:
+                    writer.writerow(record)
+
+@contextmanager
+def ProfileStage(profile, name, label=None, voxels=None):
+    # time a stage if a profile is given, otherwise do nothing
+    if profile is None:
+        yield None
+    else:
+        with profile.stage(name, label=label, voxels=voxels) as record:
+            yield record
+
+@contextmanager
+def RecordingRunningTimes(record=True):
+    # per label running times of the ibex stages in the block, the process wide flag is always switched off again
+    if not record:
+        yield
+        return
+    from ibex.skeletonization.generate_skeletons import RecordRunningTimes
+    RecordRunningTimes(True)
+    try:
+        yield
+    finally:
+        RecordRunningTimes(False)
+
+def Profiled(name):
+    # time a method as stage name in self.profile, with the voxels of self.data
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with ProfileStage(getattr(self, 'profile', None), name) as record:
+                output = method(self, *args, **kwargs)
+                if record is not None and getattr(self, 'data', None) is not None:
+                    record['voxels'] = self.data.size
+                return output
+        return wrapper
+    return decorator
@@ -0,0 +1,160 @@
+import os
+
+import numpy as np
+
+from ibex.utilities.dataIO import GridSize
+
+# random access skeleton reading
+##################
+# record offsets (in int64 words) of every label per file path, with its modification time
+record_offsets = {}
+
+def RecordOffsets(filename, words=1):
+    """
+    Returns the offset (in int64 words) of the record of every label in a .pts, .vec or
+    .edges file. Only the record sizes are read, and the offsets are kept until the file
+    changes, so reading one label does not read the whole file.
+    """
+    filename = os.path.abspath(filename)
+    modified_time = os.stat(filename).st_mtime
+    if filename in record_offsets and record_offsets[filename][0] == modified_time:
+        return record_offsets[filename][1]
+
+    data = np.memmap(filename, dtype=np.int64, mode='r')
+    offsets = np.zeros(data[3], dtype=np.int64)
+    offset = 4
+    for label in range(data[3]):
+        offsets[label] = offset
+        offset += 1 + words * data[offset]
+    record_offsets[filename] = (modified_time, offsets)
+    return offsets
+
+def ReadLabelRecord(filename, label, words=1):
+    # the nelements * words values of label, or an empty record if the file has no such label
+    offsets = RecordOffsets(filename, words)
+    if label < 0 or label >= offsets.size:
+        return np.zeros(0, dtype=np.int64)
+    data = np.memmap(filename, dtype=np.int64, mode='r')
+    nelements = data[offsets[label]]
+    return np.array(data[offsets[label] + 1:offsets[label] + 1 + words * nelements])
+
+def ReadSkeletonArrays(prefix, label, out_res=(80, 80, 80), skeleton_algorithm='thinning', params='00'):
+    """
+    Reads the skeleton of one label as arrays, in the node order of Skeleton.get_nodes
+    Returns the nodes (N x 3, zyx voxels), the endpoint flag of every node and the edges
+    (E x 2, node indices)
+    """
+    res = '{:03d}x{:03d}x{:03d}'.format(out_res[2], out_res[1], out_res[0])
+    points = ReadLabelRecord('{}/{}-{}-upsample-{}-skeleton.pts'.format(prefix, skeleton_algorithm, res, params), label)
+    edges = ReadLabelRecord('{}/{}-{}-upsample-skeleton.edges'.format(prefix, skeleton_algorithm, res), label, 2).reshape(2, -1).T
+
+    # joints first, then endpoints
+    indices = np.concatenate([points[points >= 0], -points[points < 0]])
+    ends = np.arange(indices.size) >= np.count_nonzero(points >= 0)
+    nodes = np.stack(np.unravel_index(indices, GridSize(prefix)), axis=1).astype(np.int64)
+
+    # edges hold voxel indices, map them to node indices
+    order = np.argsort(indices, kind='mergesort')
+    edges = order[np.searchsorted(indices[order], edges)] if edges.size else np.zeros((0, 2), dtype=np.int64)
+    return nodes, ends, edges
+
+# line segment buffers
+##################
+def EdgeSegments(nodes, edges):
+    """
+    Returns all non degenerate edges as one E x 2 x 3 array of end point coordinates
+    """
+    segments = np.asarray(nodes, dtype=np.float64)[np.asarray(edges, dtype=np.int64).reshape(-1, 2)]
+    return segments[(segments[:, 0] != segments[:, 1]).any(axis=1)]
+
+# rendering
+##################
+IX, IY, IZ = 2, 1, 0
+
+def RenderSkeletonPNG(nodes, ends, edges, filename, plot_type='edges', junctions=None, size=(8, 8), dpi=100):
+    """
+    Renders a skeleton into a PNG file without a display. The edges are one line
+    collection and the nodes one scatter, whatever the size of the skeleton.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from mpl_toolkits.mplot3d import Axes3D
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    figure = Figure(figsize=size)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111, projection='3d')
+    if plot_type in ('node', 'nodes'):
+        ax.scatter(nodes[:, IX], nodes[:, IY], nodes[:, IZ], s=0.5, c='blue')
+    elif plot_type == 'edges':
+        segments = EdgeSegments(nodes, edges)[:, :, [IX, IY, IZ]]
+        ax.add_collection3d(Line3DCollection(segments, colors='blue', linewidths=0.5))
+    key_nodes = ends if junctions is None else (ends | junctions)
+    ax.scatter(nodes[key_nodes, IX], nodes[key_nodes, IY], nodes[key_nodes, IZ], s=4, c='red')
+    if nodes.shape[0]:
+        for axis, (lower, upper) in zip((ax.set_xlim, ax.set_ylim, ax.set_zlim), zip(nodes[:, [IX, IY, IZ]].min(axis=0), nodes[:, [IX, IY, IZ]].max(axis=0))):
+            axis(lower, upper + 1)
+    ax.set_axis_off()
+    figure.savefig(filename, dpi=dpi)
+
+def RenderSkeletonHTML(nodes, ends, edges, filename, plot_type='edges', junctions=None):
+    """
+    Renders a skeleton into an ipyvolume HTML file with one indexed line mesh for all
+    edges instead of one plot per edge
+    """
+    import ipyvolume as ipv
+    nodes = nodes.astype(float)
+    ipv.figure()
+    if plot_type in ('node', 'nodes'):
+        ipv.scatter(nodes[:, IX], nodes[:, IY], nodes[:, IZ], size=0.5, marker='sphere', color='blue')
+    elif plot_type == 'edges':
+        edges = edges[(nodes[edges[:, 0]] != nodes[edges[:, 1]]).any(axis=1)]
+        ipv.plot_trisurf(nodes[:, IX], nodes[:, IY], nodes[:, IZ], lines=edges, color='blue')
+    key_nodes = ends if junctions is None else (ends | junctions)
+    ipv.scatter(nodes[key_nodes, IX], nodes[key_nodes, IY], nodes[key_nodes, IZ], size=0.85, marker='sphere', color='red')
+    ipv.pylab.style.axes_off()
+    ipv.pylab.style.box_off()
+    ipv.save(filename)
+
+def Junctions(nnodes, edges):
+    # nodes with more than two incident edges
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    return np.bincount(edges.reshape(-1), minlength=nnodes) > 2
+
+def RenderSkeletons(prefix, labels, out_folder='./', out_res=(80, 80, 80), plot_type='edges', formats=('png',), \
+                    skeleton_algorithm='thinning'):
+    """
+    Writes a QC snapshot of every label for a batch of neurons. Every label is read on
+    its own from the skeleton files, so a snapshot costs the size of its skeleton only.
+
+    ====================
+    INPUTS:
+    ====================
+
+    prefix:         Folder with the skeleton files (output of CreateSkeletons).
+    labels:         Labels to render.
+    out_folder:     Folder for the snapshots skel<label>.png / skel<label>.html.
+    out_res:        Resolution of the skeletons, as passed to CreateSkeletons.
+    plot_type:      'edges' or 'nodes'.
+    formats:        Any of 'png' (headless matplotlib) and 'html' (ipyvolume).
+
+    ====================
+    OUTPUTS:
+    ====================
+    filenames:      The snapshot files.
+
+    """
+    if not os.path.exists(out_folder):
+        os.makedirs(out_folder)
+    filenames = []
+    for label in labels:
+        nodes, ends, edges = ReadSkeletonArrays(prefix, label, out_res, skeleton_algorithm)
+        junctions = Junctions(nodes.shape[0], edges)
+        for extension in formats:
+            filename = os.path.join(out_folder, 'skel{}.{}'.format(label, extension))
+            if extension == 'png':
+                RenderSkeletonPNG(nodes, ends, edges, filename, plot_type, junctions)
+            else:
+                RenderSkeletonHTML(nodes, ends, edges, filename, plot_type, junctions)
+            filenames.append(filename)
+    return filenames
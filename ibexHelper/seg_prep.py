@@ -4,6 +4,7 @@ import time
 import json
 
 from util import *
+from instrument import Profile, Profiled
 
 def gen_mask(seg, obj_id):
     obj_mask = np.zeros_like(seg, dtype=int)
@@ -55,6 +56,7 @@ class SegPrep(object):
         self.n_ids = None # number of segments
         self.bbox_dict = None # bbox coordinates for each segment
         self.fiber_ids = None # list of fiber ids
+        self.profile = Profile(name) # stage timings, see write_profile
 
         create_folder('./segs/')
         create_folder('./segs/' + self.name)
@@ -69,6 +71,7 @@ class SegPrep(object):
             log.write("created .meta file\n\n")
             log.close()
 
+    @Profiled('read')
     def read(self, filename, datasetname, dsmpl=(1,1,1), block_lims=3*((None,None),)):
         """
         Args:
@@ -90,6 +93,7 @@ class SegPrep(object):
         # log.write("[%d:%d, %d:%d, %d:%d]\n"%(block_lims[0][0], block_lims[0][1], block_lims[1][0], block_lims[1][1], block_lims[2][0], block_lims[2][1]))
         # log.close()
 
+    @Profiled('read')
     def read_internal(self, stage=None):
         """reads previously saved segmentation"""
         if stage is None:
@@ -138,12 +142,13 @@ class SegPrep(object):
         log = open("./logs/" + self.name +'.log', "a+")
         log.write("swapped axes %d and %d\n"%(axis1, axis2))
 
-    def write(self, stage=None):
+    @Profiled('write')
+    def write(self, stage=None, nthreads=1):
         if stage is None: 
             fout = './segs/' + self.name + "/seg.h5"
         else: 
             fout = './segs/' + self.name + "/" + stage + "-seg.h5"
-        writeh5(fout, 'main', self.data, compression="gzip", chunks=(1,self.data.shape[1],self.data.shape[2]))
+        WriteH5(fout, self.data, 'main', compression="gzip", chunks=(1,self.data.shape[1],self.data.shape[2]), nthreads=nthreads)
         meta = open("./meta/" + self.name +'.meta', "a+")
         meta.write("# grid size\n")
         meta.write("%dx%dx%d\n"%(self.shape[2], self.shape[1], self.shape[0]))
@@ -152,6 +157,7 @@ class SegPrep(object):
         log.write("saved prepared segmentation\n\n")
         log.close()
 
+    @Profiled('bboxes')
     def gen_bboxes(self):
         """
         generates bounding box for each object in segmentation
@@ -196,6 +202,7 @@ class SegPrep(object):
         #    print label
         #    assert label in self.bbox_dict.keys()
 
+    @Profiled('fibers')
     def find_fiber_ids(self, method="bbox-aspect-ratio", params=None):
         """
         Finds fiber IDs in segmentation by inspecting shape statistics
@@ -264,6 +271,7 @@ class SegPrep(object):
             print "Found %d fiber components out of %d objects"%(len(self.fiber_ids), self.n_ids)
         print "Fiber extraction time: %f s"%(time.time()-start_time)          
 
+    @Profiled('filter')
     def filter_fibers(self):
         """
         Zeroes out non-fiber regions of segmentation
@@ -290,6 +298,7 @@ class SegPrep(object):
         write_json(self.bbox_dict, './segs/'+self.name+'/bboxes-filtered.json')
         print "Fiber filtering time: %f"%(time.time()-start_time)
 
+    @Profiled('relabel')
     def relabel(self, id_map=None, use_bboxes=False, print_labels=False):
         """
         Relabels the segmentation data such that max ID = # objects - 1 or according to supplied ID map
@@ -372,3 +381,14 @@ class SegPrep(object):
                 write_json(self.bbox_dict, './segs/'+self.name+'/bboxes-relabeled.json')
 
         print "Relabeling time: %f"%(time.time()-start_time)
+
+    def write_profile(self, filename=None):
+        """
+        Writes the stage timings of this segmentation as json (default ./logs/<name>-profile.json) or csv
+        """
+        if filename is None:
+            filename = './logs/' + self.name + '-profile.json'
+        if filename.endswith('.csv'):
+            self.profile.write_csv(filename)
+        else:
+            self.profile.write_json(filename)
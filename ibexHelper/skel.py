@@ -1,7 +1,10 @@
 import os,sys
 from ibex.transforms.seg2seg import DownsampleMapping
-from ibex.skeletonization.generate_skeletons import TopologicalThinning, FindEndpointVectors, FindEdges
-from ibex.utilities.dataIO import ReadSkeletons
+from ibex.skeletonization.generate_skeletons import TopologicalThinning, FindEndpointVectorsAndEdges
+from ibex.utilities.dataIO import ReadSkeletons, SetMetaData
+from instrument import ProfileStage, RecordingRunningTimes, VoxelCounts
+from cache import CachedFiles
+from render import ReadSkeletonArrays, Junctions, RenderSkeletonPNG, RenderSkeletonHTML
 from scipy.ndimage.morphology import binary_fill_holes
 
 import numpy as np
@@ -9,7 +12,8 @@ import cPickle as pickle
 
 # skel operation
 ##################
-def CreateSkeletons(segment, out_folder = 'temp/', in_res=(30, 6, 6), out_res=(80, 80, 80), return_option = None):
+def CreateSkeletons(segment, out_folder = 'temp/', in_res=(30, 6, 6), out_res=(80, 80, 80), return_option = None, profile = None, cache = None, \
+                    changed_labels = None, old_segment = None):
     """
     This function uses Ibex to exctract the skeleton out of a voxel representation (in
     a .h5 file). It optionally stores the skeleton plot as an html file.
@@ -24,6 +28,21 @@ def CreateSkeletons(segment, out_folder = 'temp/', in_res=(30, 6, 6), out_res=(8
     out_res:    Tuple of three integers, representing the resolution we want to use for
                 extraction of the skeleton. This is used only if you want to downsample.
 
+    profile:    An instrument.Profile object. If given, the stage timings, voxel counts and
+                per label running times of this run are added to it.
+
+    cache:      A cache.StageCache object. If given, the downsampling, thinning and
+                endpoint/edge stages are skipped when their outputs for the same segment
+                and resolutions are cached.
+
+    changed_labels: List of label ids edited since the skeletons in out_folder were
+                created. Only these labels are skeletonized again and spliced into the
+                existing .pts/.vec/.edges files (and skel_pts.pkl with 'save').
+
+    old_segment: The segmentation the skeletons in out_folder were created from. If
+                given instead of changed_labels, the changed labels are found by a
+                chunk by chunk comparison with segment.
+
     ====================
     OUTPUTS:
     ====================
@@ -33,21 +52,61 @@ def CreateSkeletons(segment, out_folder = 'temp/', in_res=(30, 6, 6), out_res=(8
     if not os.path.exists(out_folder):
         os.makedirs(out_folder)
 
-    print('meta file')
-    CreateMetaFile(in_res, segment.shape, out_folder)
-    
-    segment = segment.astype(np.int64)
-    print('seg: downsample')
-    DownsampleMapping(out_folder, segment, output_resolution=out_res)
-    print('skel: topological thining')
-    TopologicalThinning(out_folder, segment, skeleton_resolution=out_res)
-    print('graph: edge/end-pt')
-    FindEndpointVectors(out_folder, skeleton_algorithm='thinning', skeleton_resolution=out_res)
-    FindEdges(out_folder, skeleton_algorithm='thinning', skeleton_resolution=out_res)
+    if profile is not None:
+        voxel_counts = VoxelCounts(segment)
+
+    with RecordingRunningTimes(profile is not None):
+        print('meta file')
+        with ProfileStage(profile, 'meta'):
+            CreateMetaFile(in_res, segment.shape, out_folder)
+
+        segment = segment.astype(np.int64)
+
+        # incremental update of the labels that changed since the last run
+        res = '%03dx%03dx%03d' % (out_res[2], out_res[1], out_res[0])
+        changed = None
+        computed = []
+        if (changed_labels is not None or old_segment is not None) and \
+                os.path.exists(os.path.join(out_folder, 'thinning-%s-upsample-00-skeleton.pts' % res)):
+            from incremental import UpdateSkeletons, ReadSkeletonLabels
+            print('skel: incremental update')
+            with ProfileStage(profile, 'incremental'):
+                changed, max_label = UpdateSkeletons(segment, out_folder, in_res, out_res, \
+                                                     changed_labels=changed_labels, old_segment=old_segment)
+            print('updated %d labels' % len(changed))
+        else:
+            computed = CreateSkeletonStages(segment, out_folder, in_res, out_res, res, profile, cache)
+
+    if profile is not None:
+        # per label running times written by the c++ stages of this run, cached stages leave older files
+        for stage, label_stage, filename in [('thinning', 'thinning-labels', 'thinning-%s.bytes' % res), \
+                                             ('thinning', 'upsample-labels', 'thinning-%s-upsample-00.bytes' % res), \
+                                             ('endpoints-edges', 'edges-labels', 'thinning-%s-edge-times.bytes' % res)]:
+            if stage not in computed:
+                continue
+            filename = os.path.join(out_folder, 'running-times', filename)
+            if os.path.exists(filename):
+                profile.add_labels(label_stage, filename, voxel_counts)
 
     # return option
     if return_option is not None:
-        skel = ReadSkeletons(out_folder, read_edges=True, downsample_resolution=out_res)
+        pkl_filename = os.path.join(out_folder, 'skel_pts.pkl')
+        if return_option == 'save' and changed is not None and os.path.exists(pkl_filename):
+            # only the graphs of the changed labels are read and replaced
+            with ProfileStage(profile, 'read'):
+                skel = ReadSkeletonLabels(out_folder, changed[changed < max_label], out_res)
+            nodes, edges = pickle.load(open(pkl_filename, 'rb'))
+            for label in range(len(nodes), max_label):
+                nodes.append(np.zeros((0, 3), dtype=np.int))
+                edges.append(np.zeros((0, 2), dtype=np.int))
+            nodes, edges = nodes[:max_label], edges[:max_label]
+            for x in skel:
+                nodes[x.label] = x.get_nodes()
+                edges[x.label] = x.get_edges()
+            pickle.dump([nodes, edges], open(pkl_filename, 'wb'))
+            return
+        with ProfileStage(profile, 'read'):
+            skel = ReadSkeletons(out_folder, read_edges=True, downsample_resolution=out_res)
         # 0: no return
         if return_option == 'return':
             return skel
@@ -55,7 +114,40 @@ def CreateSkeletons(segment, out_folder = 'temp/', in_res=(30, 6, 6), out_res=(8
             # save [numpy array] into pickles
             nodes = [x.get_nodes() for x in skel]
             edges = [x.get_edges() for x in skel]
-            pickle.dump([nodes, edges], open(out_folder + '/skel_pts.pkl', 'wb'))
+            pickle.dump([nodes, edges], open(pkl_filename, 'wb'))
+
+def CreateSkeletonStages(segment, out_folder, in_res, out_res, res, profile=None, cache=None):
+    # downsampling, thinning and endpoint/edge stages on the whole segment
+    # every stage is keyed by the key of the stage it reads from and its parameters
+    # returns the stages that were computed and not copied from the cache
+    if cache is not None:
+        segment_key = cache.key('segment', [segment], {'in_res': list(in_res)})
+        downsample_key = cache.key('downsample', [segment_key], {'out_res': list(out_res)})
+        thinning_key = cache.key('thinning', [downsample_key], {'astar_expansion': 0})
+        edges_key = cache.key('endpoints-edges', [thinning_key])
+    else:
+        downsample_key = thinning_key = edges_key = None
+
+    computed = []
+    print('seg: downsample')
+    with ProfileStage(profile, 'downsample', voxels=segment.size):
+        if not CachedFiles(cache, downsample_key, out_folder, \
+                    [os.path.join(out_folder, '%s-%s.bytes' % (name, res)) for name in ['downsample', 'upsample']], \
+                    lambda: DownsampleMapping(out_folder, segment, output_resolution=out_res)):
+            computed.append('downsample')
+    print('skel: topological thining')
+    with ProfileStage(profile, 'thinning', voxels=segment.size):
+        if not CachedFiles(cache, thinning_key, out_folder, \
+                    [os.path.join(out_folder, 'thinning-%s-%s-skeleton.pts' % (res, name)) for name in ['downsample', 'upsample-00']], \
+                    lambda: TopologicalThinning(out_folder, segment, skeleton_resolution=out_res)):
+            computed.append('thinning')
+    print('graph: edge/end-pt')
+    with ProfileStage(profile, 'endpoints-edges'):
+        if not CachedFiles(cache, edges_key, out_folder, \
+                    [os.path.join(out_folder, 'thinning-%s-%s' % (res, name)) for name in ['endpoint-vectors.vec', 'upsample-skeleton.edges']], \
+                    lambda: FindEndpointVectorsAndEdges(out_folder, skeleton_algorithm='thinning', skeleton_resolution=out_res)):
+            computed.append('endpoints-edges')
+    return computed
 
  
 def CreateMetaFile(resolution, seg_shape, out_folder='./'):
@@ -66,39 +158,21 @@ def CreateMetaFile(resolution, seg_shape, out_folder='./'):
     meta.write("# grid size\n")
     meta.write("%dx%dx%d\n"%(seg_shape[2], seg_shape[1], seg_shape[0]))
     meta.close()
+    # later reads of this folder do not depend on the modification time of meta.txt
+    SetMetaData(out_folder, resolution, seg_shape)
 
  
-def PlotSkeletons(seg_name, plot_type='node', out_res=(30,48,48)): 
-    import ipyvolume as ipv
-    print('Read skeletons')
-    skeletons = ReadSkeletons(seg_name, skeleton_algorithm='thinning', downsample_resolution=out_res, read_edges=True)
-
-    print('Plot skeletons')
-    node_list = skeletons[1].get_nodes()
-    nodes = np.stack(node_list).astype(float)
-    junction_idx = skeletons[1].get_junctions()
-    junctions = nodes[junction_idx, :]
-    ends = skeletons[1].get_ends()
-    jns_ends = np.vstack([junctions, ends])
-    
-    IX, IY, IZ = 2, 1, 0
-    ipv.figure()
-    if plot_type == 'nodes':
-        nodes = ipv.scatter(nodes[:,IX], nodes[:,IY], nodes[:,IZ], \
-                            size=0.5, marker='sphere', color='blue')
-    elif plot_type == 'edges':
-        edges = skeletons[1].get_edges().astype(float)
-        for e1, e2 in edges:
-            if not ((e1[IX] == e2[IX]) and (e1[IY] == e2[IY]) and (e1[IZ] == e2[IZ])):
-                ipv.plot([e1[IX], e2[IX]], [e1[IY], e2[IY]], [e1[IZ], e2[IZ]], \
-                         color='blue');
-
-    jns = ipv.scatter(jns_ends[:,IX], jns_ends[:,IY], jns_ends[:,IZ], \
-                      size=0.85, marker='sphere', color='red')
-    ipv.pylab.style.axes_off()
-    ipv.pylab.style.box_off()
+def PlotSkeletons(seg_name, plot_type='node', out_res=(30,48,48), label=1, extension='html'):
+    # only the skeleton of label is read, and all edges are drawn with one plot call
+    print('Read skeleton')
+    nodes, ends, edges = ReadSkeletonArrays(seg_name, label, out_res)
 
-    ipv.save(seg_name + '_skel.html')
+    print('Plot skeleton')
+    junctions = Junctions(nodes.shape[0], edges)
+    if extension == 'png':
+        RenderSkeletonPNG(nodes, ends, edges, seg_name + '_skel.png', plot_type, junctions)
+    else:
+        RenderSkeletonHTML(nodes, ends, edges, seg_name + '_skel.html', plot_type, junctions)
 
 def SaveMeshAsHTML(cell_dir, stl_id, mesh_dir='./'):
     in_mesh = GetMesh(cell_dir, stl_id)
@@ -1,31 +1,49 @@
 import os,sys
-from ibex.transforms.seg2seg import DownsampleMapping
-from ibex.skeletonization.generate_skeletons import TopologicalThinning, FindEndpointVectors, FindEdges
-from ibex.utilities.dataIO import ReadSkeletons
-from scipy.ndimage.morphology import binary_fill_holes
-
-import ipyvolume as ipv
 import numpy as np
 
-import networkx as nx
-from networkx.drawing.nx_agraph import graphviz_layout
-
 # skel for erl evaluation
 ##################
+def GetERLArraysFromSkeleton(nodes, edges, seg_list, res):
+    """
+    Flattens a list of skeletons into arrays for erl evaluation
+    nodes[k] (N x 3, zyx voxels) and edges[k] (E x 2, indices into nodes[k]) belong to skeleton k
+    Returns the node positions (N x 3, physical units), the skeleton id of every node,
+    the edges (E x 2, global node ids), the physical length of every edge and the segment
+    id of every node in every segmentation (len(seg_list) x N)
+    """
+    nodes = [np.asarray(node).reshape(-1, 3) for node in nodes]
+    counts = np.array([node.shape[0] for node in nodes], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+
+    coords = np.concatenate(nodes).astype(np.int64) if len(nodes) else np.zeros((0, 3), np.int64)
+    positions = coords * np.asarray(res)
+    skeleton_ids = np.repeat(np.arange(len(nodes)), counts)
+
+    # edges of skeleton k index into its own nodes
+    edge_list = [np.asarray(edges[k], dtype=np.int64).reshape(-1, 2) + offsets[k] for k in range(len(nodes))]
+    edge_ids = np.concatenate(edge_list) if len(edge_list) else np.zeros((0, 2), np.int64)
+    lengths = np.linalg.norm((positions[edge_ids[:, 0]] - positions[edge_ids[:, 1]]).astype(np.float64), axis=1)
+
+    # one fancy indexing call per segmentation
+    segment_ids = np.zeros((len(seg_list), coords.shape[0]), dtype=np.int64)
+    for i in range(len(seg_list)):
+        segment_ids[i] = seg_list[i][coords[:, 0], coords[:, 1], coords[:, 2]]
+    return positions, skeleton_ids, edge_ids, lengths, segment_ids
+
 def GetERLDataFromSkeleton(nodes, edges, seg_list, res):
+    """
+    Builds the skeleton graph (node attributes skeleton_id, z, y, x and edge attribute
+    length) and the node to segment lookup of every segmentation for
+    funlib.evaluate.expected_run_length
+    """
+    import networkx as nx
+    positions, skeleton_ids, edge_ids, lengths, segment_ids = GetERLArraysFromSkeleton(nodes, edges, seg_list, res)
     gt_graph = nx.Graph()
-    node_segment_lut = [{}]*len(seg_list)
-    cc = 0
-    for k in range(len(nodes)):
-        node = nodes[k]
-        edge = edges[k] + cc
-        for l in range(node.shape[0]):
-            gt_graph.add_node(cc, skeleton_id = k, z=node[l,0]*res[0], y=node[l,1]*res[1], x=node[l,2]*res[2])
-            for i in range(len(seg_list)):
-                node_segment_lut[i][cc] = seg_list[i][node[l,0], node[l,1], node[l,2]]
-            cc += 1
-        for l in range(edge.shape[0]):
-            gt_graph.add_edge(edge[l,0], edge[l,1])
+    node_ids = range(positions.shape[0])
+    gt_graph.add_nodes_from((node, {'skeleton_id': skeleton_id, 'z': z, 'y': y, 'x': x}) \
+                            for node, skeleton_id, (z, y, x) in zip(node_ids, skeleton_ids.tolist(), positions.tolist()))
+    gt_graph.add_edges_from((u, v, {'length': length}) for (u, v), length in zip(edge_ids.tolist(), lengths.tolist()))
+    node_segment_lut = [dict(zip(node_ids, segment_ids[i].tolist())) for i in range(len(seg_list))]
     return gt_graph, node_segment_lut
  
 # skel -> graph
@@ -117,7 +135,7 @@ def ModifiedBFS(node_list, orig_graph, new_graph, visited, node_coords, dt=None,
         if use_euclid: 
             weight = Euclidean(prev, cur, coords)
         thickness = AvgThick(prev, cur, coords, dt)*weight
-        while IsJunction(cur, orig_graph):
+        while IsJunction(cur, orig_graph) and cur != src:
             nxt = orig_graph[cur][int(orig_graph[cur][0] == prev)]
             prev = cur
             cur = nxt
@@ -229,7 +247,7 @@ def BFS(node_list, orig_graph, new_graph, visited, node_coords, dt=None,\
         if use_euclid: 
             weight = Euclidean(prev, cur, coords)
         thickness = AvgThick(prev, cur, coords, dt)*weight
-        while IsJunction(cur, orig_graph):
+        while IsJunction(cur, orig_graph) and cur != src:
             nxt = orig_graph[cur][int(orig_graph[cur][0] == prev)]
             prev = cur
             cur = nxt
@@ -2,6 +2,8 @@ import numpy as np
 import pickle
 import h5py
 
+from ibex.utilities.dataIO import WriteH5Dataset
+
 def GetBbox(seg, do_count=False):
     dim = len(seg.shape)
     a=np.where(seg>0)
@@ -32,16 +34,23 @@ def ReadPkl(filename):
                 break
     return data
 
-def WriteH5(filename, dtarray, datasetname='main'):
-    fid=h5py.File(filename,'w')                                                                      
-    if isinstance(datasetname, (list,)):                                                             
-        for i,dd in enumerate(datasetname):                                                          
-            ds = fid.create_dataset(dd, dtarray[i].shape, compression="gzip", dtype=dtarray[i].dtype)
-            ds[:] = dtarray[i]                                                                       
-    else:                                                                                            
-        ds = fid.create_dataset(datasetname, dtarray.shape, compression="gzip", dtype=dtarray.dtype) 
-        ds[:] = dtarray                                                                              
-    fid.close()    
+def WriteH5(filename, dtarray, datasetname='main', compression='gzip', chunks=None, compression_level=4, nthreads=1):
+    # compression: 'gzip', 'lzf' or None; chunks: e.g. (1, y, x) z-slabs or (64, 64, 64) blocks
+    # gzip chunks are compressed by nthreads; an array can be a (z slab generator, shape, dtype) tuple
+    fid=h5py.File(filename,'w')
+    if isinstance(datasetname, (list,)):
+        for i,dd in enumerate(datasetname):
+            WriteH5Data(fid, dd, dtarray[i], compression, chunks, compression_level, nthreads)
+    else:
+        WriteH5Data(fid, datasetname, dtarray, compression, chunks, compression_level, nthreads)
+    fid.close()
+
+def WriteH5Data(fid, datasetname, dtarray, compression, chunks, compression_level, nthreads):
+    if isinstance(dtarray, tuple):
+        generator, shape, dtype = dtarray
+        WriteH5Dataset(fid, datasetname, generator, compression, chunks, compression_level, nthreads, shape, dtype)
+    else:
+        WriteH5Dataset(fid, datasetname, np.asarray(dtarray), compression, chunks, compression_level, nthreads)
 
 def ReadH5(filename, datasetname='main'):
     fid=h5py.File(filename,'r')
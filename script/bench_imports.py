@@ -0,0 +1,58 @@
+import os,sys
+import json
+import subprocess
+
+# import timing
+##################
+# entry points that pool workers import for pure compute
+COMPUTE_MODULES = ['ibex.utilities.dataIO', 'ibex.data_structures.skeleton_points', 'ibexHelper.skel', \
+                   'ibexHelper.skel2graph', 'ibexHelper.block', 'ibexHelper.incremental', 'ibexHelper.erl', \
+                   'ibexHelper.graph_compare']
+# visualization and optional i/o backends that should only load when used
+BACKENDS = ['matplotlib', 'mpl_toolkits.mplot3d', 'ipyvolume', 'networkx', 'imageio', 'tifffile', 'PIL.Image']
+
+TIMER = """
+import sys, time, json
+start = time.time()
+import %s
+elapsed = time.time() - start
+print(json.dumps({'time': elapsed, 'backends': [name for name in %r if name in sys.modules]}))
+"""
+
+def TimeImport(module, repeats=5):
+    # import module in fresh interpreters, like a newly started worker process
+    times, backends = [], []
+    for _ in range(repeats):
+        output = subprocess.check_output([sys.executable, '-c', TIMER % (module, BACKENDS)])
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result['time'])
+        backends = result['backends']
+    times.sort()
+    return {'module': module, 'time': times[len(times) // 2], 'backends': backends}
+
+def PrintRows(rows):
+    print('%-40s %9s  %s' % ('module', 'time (s)', 'backends loaded'))
+    for row in rows:
+        print('%-40s %9.3f  %s' % (row['module'], row['time'], ', '.join(row['backends']) or '-'))
+
+
+if __name__ == "__main__":
+    # python bench_imports.py [OUT_FOLDER] [REPEATS]
+    out_folder = sys.argv[1] if len(sys.argv) > 1 else 'bench-imports'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    if not os.path.exists(out_folder):
+        os.makedirs(out_folder)
+
+    rows = []
+    for module in COMPUTE_MODULES:
+        rows.append(TimeImport(module, repeats))
+    # what every worker would pay if the backends were still imported at module level
+    for module in BACKENDS:
+        try:
+            rows.append(TimeImport(module, repeats))
+        except subprocess.CalledProcessError:
+            print('%s is not installed' % module)
+
+    PrintRows(rows)
+    with open(os.path.join(out_folder, 'bench-imports.json'), 'w') as f:
+        json.dump(rows, f, indent=2)
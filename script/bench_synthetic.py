@@ -0,0 +1,210 @@
+import os,sys
+import time
+import json
+
+# add ibexHelper path
+from ibex.transforms.seg2seg import DownsampleMapping
+from ibex.skeletonization import generate_skeletons
+from ibex.skeletonization.generate_skeletons import TopologicalThinning, TEASER, MedialAxis, FindEndpointVectors, FindEdges
+from ibex.utilities.dataIO import ReadSkeletons
+from ibexHelper.skel import CreateMetaFile
+from ibexHelper.skel2graph import GetGraphFromSkeleton
+from ibexHelper.graph import ShrinkGraph, GetEdgeList
+import numpy as np
+import networkx as nx
+
+# synthetic segmentations
+##################
+def DrawTube(seg, label, p0, p1, radius):
+    # stamp all voxels within radius of the segment p0-p1 (z,y,x)
+    p0, p1 = np.array(p0, dtype=float), np.array(p1, dtype=float)
+    lo = np.maximum(np.floor(np.minimum(p0, p1) - radius).astype(int), 0)
+    hi = np.minimum(np.ceil(np.maximum(p0, p1) + radius).astype(int) + 1, seg.shape)
+    if np.any(hi <= lo):
+        return
+    zz, yy, xx = np.mgrid[lo[0]:hi[0], lo[1]:hi[1], lo[2]:hi[2]]
+    pts = np.stack([zz, yy, xx], axis=-1).astype(float)
+    d = p1 - p0
+    t = np.clip(np.dot(pts - p0, d) / max(np.dot(d, d), 1e-6), 0, 1)
+    dist = np.linalg.norm(pts - (p0 + t[..., None] * d), axis=-1)
+    crop = seg[lo[0]:hi[0], lo[1]:hi[1], lo[2]:hi[2]]
+    crop[dist <= radius] = label
+
+def DrawPolyline(seg, label, pts, radius):
+    for p0, p1 in zip(pts[:-1], pts[1:]):
+        DrawTube(seg, label, p0, p1, radius)
+
+def SynthTubes(sz, rng, num=8, radius=3):
+    # wavy tubes running along z
+    seg = np.zeros(sz, np.int64)
+    for label in range(1, num+1):
+        y0, x0 = rng.uniform(radius, sz[1]-radius), rng.uniform(radius, sz[2]-radius)
+        zs = np.linspace(0, sz[0]-1, 8)
+        pts = [(z, np.clip(y0 + rng.uniform(-4, 4), 0, sz[1]-1), np.clip(x0 + rng.uniform(-4, 4), 0, sz[2]-1)) for z in zs]
+        DrawPolyline(seg, label, pts, radius)
+    return seg
+
+def SynthTrees(sz, rng, num=4, depth=3, radius=2.5):
+    # recursively branching trees
+    seg = np.zeros(sz, np.int64)
+    def Branch(label, p0, direction, length, level):
+        p1 = np.clip(p0 + direction * length, 0, np.array(sz)-1)
+        DrawTube(seg, label, p0, p1, radius)
+        if level == 0:
+            return
+        for _ in range(2):
+            d = direction + rng.uniform(-0.8, 0.8, 3)
+            Branch(label, p1, d / np.linalg.norm(d), 0.7 * length, level-1)
+    for label in range(1, num+1):
+        root = np.array([0, rng.uniform(0, sz[1]), rng.uniform(0, sz[2])])
+        Branch(label, root, np.array([1.0, 0, 0]), sz[0] / 3.0, depth)
+    return seg
+
+def SynthLoops(sz, rng, num=4, radius=2.5):
+    # tori, the skeleton of every label contains a cycle
+    seg = np.zeros(sz, np.int64)
+    for label in range(1, num+1):
+        r = rng.uniform(0.15, 0.25) * min(sz)
+        c = [rng.uniform(r+radius, s-r-radius) for s in sz]
+        th = np.linspace(0, 2*np.pi, 17)
+        pts = [(c[0] + r*np.sin(t) * 0.5, c[1] + r*np.cos(t), c[2] + r*np.sin(t)) for t in th]
+        DrawPolyline(seg, label, pts, radius)
+    return seg
+
+def SynthSmall(sz, rng, num=200, radius=1.5):
+    # many small blobs
+    seg = np.zeros(sz, np.int64)
+    for label in range(1, num+1):
+        p = [rng.uniform(0, s) for s in sz]
+        DrawTube(seg, label, p, p, radius + rng.uniform(0, 1))
+    return seg
+
+def SynthHuge(sz, rng, radius=None):
+    # one thick object that spans the whole volume
+    seg = np.zeros(sz, np.int64)
+    if radius is None:
+        radius = min(sz) / 6.0
+    c = np.array(sz) / 2.0
+    for axis in range(3):
+        p0, p1 = c.copy(), c.copy()
+        p0[axis], p1[axis] = 0, sz[axis]-1
+        DrawTube(seg, 1, p0, p1, radius)
+    return seg
+
+SYNTH = {'tubes': SynthTubes, 'trees': SynthTrees, 'loops': SynthLoops, 'small': SynthSmall, 'huge': SynthHuge}
+
+# benchmark
+##################
+def Throughput(rows, name, dt, nvox, nlabel):
+    rows.append({'stage': name, 'time': dt, 'voxels/s': nvox / max(dt, 1e-9), 'labels/s': nlabel / max(dt, 1e-9)})
+
+def HasThinningTables():
+    lut_dir = os.path.dirname(generate_skeletons.__file__)
+    return os.path.exists(os.path.join(lut_dir, 'lut_simple.dat')) and os.path.exists(os.path.join(lut_dir, 'lut_isthmus.dat'))
+
+def BenchDataset(out_folder, name, seg, res, skel_res, algorithms):
+    """
+    Times every stage on one synthetic segmentation
+    Returns a list of dicts with stage, algorithm, time, voxels/s, labels/s
+    """
+    prefix = os.path.join(out_folder, name)
+    if not os.path.exists(prefix):
+        os.makedirs(prefix)
+    # medial axis and teaser read from skeletons/<prefix>
+    link = os.path.join('skeletons', prefix)
+    if not os.path.exists(os.path.dirname(link)):
+        os.makedirs(os.path.dirname(link))
+    if not os.path.exists(link):
+        os.symlink(os.path.relpath(prefix, os.path.dirname(link)), link)
+    CreateMetaFile(res, seg.shape, prefix)
+
+    nvox = seg.size
+    nlabel = len(np.unique(seg)) - 1
+    rows = []
+
+    t0 = time.time()
+    DownsampleMapping(prefix, seg, output_resolution=skel_res)
+    Throughput(rows, 'DownsampleMapping', time.time()-t0, nvox, nlabel)
+
+    for algo in algorithms:
+        stage = []
+        t0 = time.time()
+        if algo == 'thinning':
+            TopologicalThinning(prefix, seg, skeleton_resolution=skel_res)
+            Throughput(stage, 'TopologicalThinning', time.time()-t0, nvox, nlabel)
+        elif algo == 'teaser':
+            TEASER(prefix, seg, skeleton_resolution=skel_res)
+            Throughput(stage, 'TEASER', time.time()-t0, nvox, nlabel)
+        elif algo == 'medial-axis':
+            MedialAxis(prefix, seg, skeleton_resolution=skel_res)
+            Throughput(stage, 'MedialAxis', time.time()-t0, nvox, nlabel)
+
+        t0 = time.time()
+        FindEndpointVectors(prefix, skeleton_resolution=skel_res, skeleton_algorithm=algo)
+        Throughput(stage, 'FindEndpointVectors', time.time()-t0, nvox, nlabel)
+
+        t0 = time.time()
+        FindEdges(prefix, skeleton_resolution=skel_res, skeleton_algorithm=algo)
+        Throughput(stage, 'FindEdges', time.time()-t0, nvox, nlabel)
+
+        t0 = time.time()
+        skels = ReadSkeletons(prefix, skeleton_algorithm=algo, read_edges=True, downsample_resolution=skel_res)
+        Throughput(stage, 'ReadSkeletons', time.time()-t0, nvox, nlabel)
+
+        # graphs only exist for skeletons with at least one edge between two nodes
+        skels = [x for x in skels if any(e.source.iv != e.target.iv for e in x.edges)]
+        t0 = time.time()
+        graphs = []
+        for skel in skels:
+            graph, wt_dict, th_dict, ph_dict = GetGraphFromSkeleton(skel, modified_bfs=True)
+            if len(graph) > 0:
+                G = nx.Graph()
+                G.add_edges_from(GetEdgeList(graph, wt_dict, th_dict))
+                graphs.append(G)
+        Throughput(stage, 'GetGraphFromSkeleton', time.time()-t0, nvox, len(skels))
+
+        t0 = time.time()
+        for G in graphs:
+            ShrinkGraph(G, threshold=[10, 0])
+        Throughput(stage, 'ShrinkGraph', time.time()-t0, nvox, len(graphs))
+
+        for row in stage:
+            row['algorithm'] = algo
+        rows += stage
+
+    for row in rows:
+        row['dataset'] = name
+        row['shape'] = list(seg.shape)
+        row['labels'] = nlabel
+    return rows
+
+def PrintRows(rows):
+    print('%-14s %-12s %-22s %9s %14s %12s' % ('dataset', 'algorithm', 'stage', 'time (s)', 'voxels/s', 'labels/s'))
+    for row in rows:
+        print('%-14s %-12s %-22s %9.3f %14.0f %12.1f' % (row['dataset'], row.get('algorithm', '-'), row['stage'], \
+                                                      row['time'], row['voxels/s'], row['labels/s']))
+
+
+if __name__ == "__main__":
+    # python bench_synthetic.py [OUT_FOLDER] [SIZES, e.g. 64,128]
+    out_folder = sys.argv[1] if len(sys.argv) > 1 else 'bench-synthetic'
+    sizes = [int(x) for x in sys.argv[2].split(',')] if len(sys.argv) > 2 else [64, 128]
+
+    res = (10, 10, 10) # z,y,x in nm
+    skel_res = (40, 40, 40)
+    algorithms = ['teaser', 'medial-axis']
+    if HasThinningTables():
+        algorithms = ['thinning'] + algorithms
+    else:
+        print('lut_simple.dat/lut_isthmus.dat not found: skip TopologicalThinning')
+
+    rows = []
+    for sz in sizes:
+        for kind in ['tubes', 'trees', 'loops', 'small', 'huge']:
+            rng = np.random.RandomState(sz)
+            seg = SYNTH[kind]((sz, sz, sz), rng)
+            rows += BenchDataset(out_folder, '%s-%03d' % (kind, sz), seg, res, skel_res, algorithms)
+
+    PrintRows(rows)
+    with open(os.path.join(out_folder, 'bench-synthetic.json'), 'w') as f:
+        json.dump(rows, f, indent=2)
@@ -31,3 +31,8 @@ if __name__ == '__main__':
     #     similarity, distance = evaluate(gt_graph_list[i], pd_graph_list[i])
     #     SIMILARITY.append(similarity)
     #     DISTANCE.append(distance)
+
+    # exact GED does not scale to reduced neuron graphs, bound it for all pairs at once instead
+    # from ibexHelper.graph_compare import CompareGraphs
+    # scores = CompareGraphs(gt_graph_list, pd_graph_list, max_distance=100, nprocesses=8)
+    # DISTANCE = scores['lower'].diagonal(), scores['upper'].diagonal()
@@ -2,6 +2,7 @@ import pickle
 import sys,os
 from funlib import evaluate
 from ibexHelper.skel2graph import GetERLDataFromSkeleton 
+from ibexHelper.erl import ExpectedRunLength
 from ibexHelper.util import ReadH5
 
 def test_erl(skel_pickle_path, seg_path, res= [30,6,6]):
@@ -18,6 +19,10 @@ def test_erl(skel_pickle_path, seg_path, res= [30,6,6]):
                     skeleton_position_attributes=['z', 'y', 'x'])
     print('ERL:', scores)
 
+    # array based evaluation without the networkx graph, should match funlib
+    native_scores = ExpectedRunLength(nodes, edges, [seg], res)
+    print('ERL (ibexHelper):', native_scores[0])
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print('need an argument to select the test')
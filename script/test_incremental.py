@@ -0,0 +1,79 @@
+import os,sys
+import shutil
+import numpy as np
+from bench_synthetic import SynthTrees
+from ibexHelper.skel import CreateSkeletons
+from ibexHelper.incremental import OutputFilenames, ReadLabelRecords, RECORD_LAYOUT
+
+def ReadMappingRecords(filenames):
+    # the downsample and upsample records list the voxels of a label in hash order, so
+    # they are compared as (downsampled, upsampled) pairs sorted by the downsampled index
+    down_header, down_records = ReadLabelRecords(filenames['downsample'])
+    up_header, up_records = ReadLabelRecords(filenames['upsample'])
+    order = [np.argsort(record, kind='mergesort') for record in down_records]
+    return {'downsample': (down_header, [record[indices] for record, indices in zip(down_records, order)]),
+            'upsample': (up_header, [record[indices] for record, indices in zip(up_records, order)])}
+
+def CompareLabelFiles(inc_folder, full_folder, out_res):
+    # the spliced files should hold the records of a full rerun, label by label
+    same = True
+    inc_filenames = OutputFilenames(inc_folder, out_res)
+    full_filenames = OutputFilenames(full_folder, out_res)
+    inc_mapping = ReadMappingRecords(inc_filenames)
+    full_mapping = ReadMappingRecords(full_filenames)
+    for name in sorted(full_filenames):
+        if name in full_mapping:
+            inc_header, inc_records = inc_mapping[name]
+            full_header, full_records = full_mapping[name]
+        else:
+            words, _ = RECORD_LAYOUT[os.path.splitext(full_filenames[name])[1][1:]]
+            inc_header, inc_records = ReadLabelRecords(inc_filenames[name], words)
+            full_header, full_records = ReadLabelRecords(full_filenames[name], words)
+        different = [label for label in range(max(len(inc_records), len(full_records))) \
+                     if label >= len(inc_records) or label >= len(full_records) or \
+                        not np.array_equal(inc_records[label], full_records[label])]
+        if not np.array_equal(inc_header, full_header):
+            different = ['header'] + different
+        print('%s: %s' % (name, 'ok' if not different else 'MISMATCH in labels %s' % different))
+        same &= not different
+    return same
+
+def RunEdit(name, segment, edited, output_path, in_res, out_res, changed_labels=None):
+    # full run, incremental update with the edit and a full rerun of the edited segmentation
+    inc_folder = os.path.join(output_path, name + '-incremental/')
+    full_folder = os.path.join(output_path, name + '-full/')
+    for folder in [inc_folder, full_folder]:
+        if os.path.exists(folder):
+            shutil.rmtree(folder)
+
+    CreateSkeletons(segment, inc_folder, in_res, out_res)
+    if changed_labels is None:
+        CreateSkeletons(edited, inc_folder, in_res, out_res, old_segment=segment)
+    else:
+        CreateSkeletons(edited, inc_folder, in_res, out_res, changed_labels=changed_labels)
+    CreateSkeletons(edited, full_folder, in_res, out_res)
+
+    print('%s edit' % name)
+    return CompareLabelFiles(inc_folder, full_folder, out_res)
+
+def test_incremental(output_path='./', shape=(96, 96, 96), in_res=(10, 10, 10), out_res=(20, 20, 20)):
+    # the trees start at z = 0, the padding moves every crop away from the origin of the volume
+    segment = np.pad(SynthTrees(shape, np.random.RandomState(0), num=6), ((16, 0), (0, 0), (0, 0)), 'constant')
+
+    # split: the upper half of label 1 becomes a new label
+    split = segment.copy()
+    split[(segment == 1) & (np.arange(segment.shape[0])[:, None, None] >= segment.shape[0] // 2)] = segment.max() + 1
+    # merge: label 3 becomes part of label 2
+    merge = segment.copy()
+    merge[segment == 3] = 2
+
+    same = RunEdit('split', segment, split, output_path, in_res, out_res)
+    same &= RunEdit('merge', segment, merge, output_path, in_res, out_res, changed_labels=[2, 3])
+    return same
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print('need an argument to select the test')
+    opt = sys.argv[1]
+    if opt=='0': # incremental update against a full rerun
+        test_incremental(sys.argv[2] if len(sys.argv) > 2 else './')
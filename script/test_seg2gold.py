@@ -0,0 +1,37 @@
+import sys,time
+import numpy as np
+from ibex.transforms.seg2gold import Overlap
+
+def CompareOverlap(seg, gold, nthreads=1):
+    # the contingency table should match the unique (segment, gold) pairs of numpy
+    start = time.time()
+    segmentation_ids, gold_ids, counts = Overlap(seg, gold, nthreads)
+    elapsed = time.time() - start
+    keys, unique_counts = np.unique(seg.astype(np.int64) * (gold.max() + 1) + gold, return_counts=True)
+    same = np.array_equal(keys // (gold.max() + 1), segmentation_ids) and \
+           np.array_equal(keys % (gold.max() + 1), gold_ids) and np.array_equal(unique_counts, counts)
+    print('%d pairs, %d threads: %s (%.2fs)' % (keys.size, nthreads, 'ok' if same else 'MISMATCH', elapsed))
+    return same
+
+def test_overlap(shape=(100, 256, 256), nthreads=4):
+    rng = np.random.RandomState(0)
+    # few labels in long runs
+    gold = (np.arange(np.prod(shape)).reshape(shape) // 3000) % 500
+    seg = gold.copy(); seg[:, :shape[1] // 2] += 600; seg[rng.rand(*shape) < 0.05] = 7
+    gold[rng.rand(*shape) < 0.1] = 0
+    # many labels: small supervoxels, so every thread sees far more unique pairs than a block of voxels
+    many_seg = (np.arange(np.prod(shape)).reshape(shape) // 8) % 600000
+    many_gold = many_seg // 4 + rng.randint(0, 2, shape)
+
+    same = True
+    for nt in [1, nthreads]:
+        same &= CompareOverlap(seg, gold, nt)
+        same &= CompareOverlap(many_seg, many_gold, nt)
+    return same
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print('need an argument to select the test')
+    opt = sys.argv[1]
+    if opt=='0': # overlap table against np.unique
+        test_overlap()
@@ -9,7 +9,7 @@ from ibexHelper.graph2x import Graph2H5
 import h5py
 import numpy as np
 import networkx as nx
-from scipy.ndimage.morphology import distance_transform_cdt
+from ibex.transforms.distance import DistanceTransform
 
 
 if __name__ == "__main__":
@@ -39,7 +39,8 @@ if __name__ == "__main__":
         sz = seg.shape
         bb = GetBbox(seg>0)
         seg_b = seg[bb[0]:bb[1]+1,bb[2]:bb[3]+1,bb[4]:bb[5]+1]
-        dt = distance_transform_cdt(seg_b, return_distances=True)
+        # euclidean distance with anisotropic voxels, in units of the smallest voxel size like edgTh
+        dt = DistanceTransform(seg_b, resolution=np.array(res, dtype=float) / min(res))
 
         print('generate graph')
         new_graph, wt_dict, th_dict, ph_dict = GetGraphFromSkeleton(skel, dt=dt, dt_bb=[bb[x] for x in [0,2,4]],\